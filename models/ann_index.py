@@ -0,0 +1,59 @@
+# models/ann_index.py
+import numpy as np
+import scipy.sparse as sp
+
+# Rows scored per matrix product while clustering, to bound temporary memory
+ASSIGN_CHUNK = 65536
+
+
+class IVFIndex:
+    """Approximate nearest-neighbour search over unit vectors by inner product.
+
+    Vectors are clustered with spherical k-means into `n_lists` inverted lists; a query
+    only scores the vectors in the `n_probe` lists whose centroids are closest to it.
+    More probes trade latency for recall; probing every list is exact search.
+    The index keeps row ids only and reads candidates from the caller's matrix.
+    """
+
+    def __init__(self, vectors, n_lists=None, n_probe=8, iterations=10, sample_size=50_000, seed=0):
+        self.vectors = vectors
+        n = len(vectors)
+        self.n_lists = min(n_lists or max(1, int(np.sqrt(n))), n)
+        self.n_probe = n_probe
+
+        rng = np.random.default_rng(seed)
+        sample = vectors[np.sort(rng.choice(n, min(n, sample_size), replace=False))]
+        centroids = sample[rng.choice(len(sample), self.n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assign = self._assign(sample, centroids)
+            members = sp.csr_matrix(
+                (np.ones(len(sample), dtype=sample.dtype), (assign, np.arange(len(sample)))),
+                shape=(self.n_lists, len(sample)),
+            )
+            sums = np.asarray(members @ sample)
+            norms = np.linalg.norm(sums, axis=1)
+            # A list that lost all its members keeps its old centroid
+            filled = norms > 0
+            centroids[filled] = sums[filled] / norms[filled, None]
+        self.centroids = centroids
+
+        assign = self._assign(vectors, centroids)
+        self.ids = np.argsort(assign, kind="stable")
+        self.offsets = np.searchsorted(assign[self.ids], np.arange(self.n_lists + 1))
+
+    def search(self, query, k, n_probe=None):
+        """(ids, scores) of the approximately k best rows for one query vector, best first."""
+        query = np.asarray(query, dtype=self.vectors.dtype).ravel()
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        lists = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        candidates = np.concatenate([self.ids[self.offsets[l]:self.offsets[l + 1]] for l in lists])
+        scores = self.vectors[candidates] @ query
+        # Same order as an exact search: score, then row id
+        order = np.lexsort((candidates, -scores))[:k]
+        return candidates[order], scores[order]
+
+    def _assign(self, vectors, centroids):
+        return np.concatenate([
+            np.argmax(vectors[start:start + ASSIGN_CHUNK] @ centroids.T, axis=1)
+            for start in range(0, len(vectors), ASSIGN_CHUNK)
+        ])
@@ -1,20 +1,117 @@
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 import re
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
 from string import punctuation
 from spacy.lang.en.stop_words import STOP_WORDS
 
+KEYWORD_CATEGORIES = {
+    "Software Development": ["developer", "engineer", "software", "full stack", "backend", "frontend"],
+    "Data Science": ["data scientist", "machine learning", "ai", "analyst"],
+    "DevOps": ["devops", "site reliability", "infrastructure", "cloud", "ci/cd", "sre"],
+    "QA": ["qa", "quality assurance", "test", "automation"],
+    "Cloud Engineering": ["cloud", "aws", "azure", "gcp", "architect"],
+    "Frontend Development": ["frontend", "react", "vue", "html", "css", "ui"],
+    "Backend Development": ["backend", "django", "flask", "node", "sql", "database"],
+    "Product Management": [
+        "product manager", "product owner", "roadmap", "stakeholders", "market research",
+        "requirements", "product strategy", "go-to-market", "product lifecycle"
+    ],
+    "Project Management": [
+        "project manager", "scrum master", "agile", "waterfall", "timeline", "milestones",
+        "budget", "risk management", "status reporting", "resource allocation"
+    ]
+}
+
+COMMON_SKILLS = {
+    "python", "java", "c++", "javascript", "react", "angular", "node.js",
+    "git", "docker", "kubernetes", "aws", "sql", "flask", "django",
+    "machine learning", "tensorflow", "pytorch", "css", "html", "linux",
+    "ci/cd", "jenkins", "vue", "azure", "gcp", "jira", "selenium"
+}
+
+
+def _compile_patterns():
+    # Both tables as one list of distinct strings, each with the categories it signals and
+    # whether it is a skill, so a posting is searched once per string. Matching stays a
+    # plain substring test ("ai" also matches inside "email"), run in C by `in`; a
+    # character-level automaton gives the same hits but walks the text in Python, slower.
+    categories = defaultdict(list)
+    for category, keywords in KEYWORD_CATEGORIES.items():
+        for keyword in keywords:
+            if category not in categories[keyword]:
+                categories[keyword].append(category)
+    patterns = list(categories) + sorted(COMMON_SKILLS - set(categories))
+    return [(pattern, tuple(categories.get(pattern, ())), pattern in COMMON_SKILLS) for pattern in patterns]
+
+
+_PATTERNS = _compile_patterns()
+
+
 class CareerPathRecommender:
+    """Career paths mined from job postings, and recommendations for a resume against them.
+
+    The path model is kept as per-category counts of role titles and skills, so postings
+    can be added (add_jobs) and removed (remove_jobs, or sync_jobs to follow a refreshed
+    job list) without re-reading the others; career_paths is rebuilt from the counts only
+    after a change. Postings are keyed by job_id, else url, else title and description.
+    """
+
     def __init__(self, job_descriptions):
-        self.job_descriptions = job_descriptions
-        self.career_paths = self._extract_paths_from_jobs(job_descriptions)
+        self._lock = threading.RLock()
+        self._postings = {}  # key -> (role, categories, skills)
+        self._roles = defaultdict(Counter)
+        self._skills = defaultdict(Counter)
+        self._career_paths = None
+        self.add_jobs(job_descriptions)
+
+    @property
+    def career_paths(self):
+        with self._lock:
+            if self._career_paths is None:
+                self._career_paths = {category: {
+                    "skills": list(self._skills[category]),
+                    "roles": list(roles),
+                    "description": f"Auto-generated from Adzuna job titles/descriptions for {category}"
+                } for category, roles in self._roles.items() if roles and self._skills[category]}
+            return self._career_paths
+
+    def add_jobs(self, jobs):
+        # A posting whose key is already in the model replaces the old one
+        with self._lock:
+            for job in jobs:
+                key = self._job_key(job)
+                self._remove(key)
+                categories, skills = self._match_job(job)
+                role = job.get("title", "Unknown Role")
+                for category in categories:
+                    self._roles[category][role] += 1
+                    self._skills[category].update(skills)
+                self._postings[key] = (role, categories, skills)
+            self._career_paths = None
+
+    def remove_jobs(self, keys):
+        # keys as _job_key gives them (a posting's job_id, else its url); unknown keys are ignored
+        with self._lock:
+            removed = sum(self._remove(key) for key in keys)
+            if removed:
+                self._career_paths = None
+            return removed
+
+    def sync_jobs(self, jobs):
+        """Make the model describe exactly `jobs`: only postings not seen before are matched."""
+        jobs = {self._job_key(job): job for job in jobs}
+        with self._lock:
+            self.remove_jobs([key for key in self._postings if key not in jobs])
+            self.add_jobs([job for key, job in jobs.items() if key not in self._postings])
 
     def recommend_career_paths(self, resume_data):
+        career_paths = self.career_paths
         user_skills = set([skill.lower() for skill in resume_data.get("skills", {}).get("all_skills", [])])
 
         path_scores = {}
-        for path_name, path_data in self.career_paths.items():
+        for path_name, path_data in career_paths.items():
             path_skills = set([skill.lower() for skill in path_data["skills"]])
             intersection = len(user_skills.intersection(path_skills))
             union = len(user_skills.union(path_skills))
@@ -25,7 +122,7 @@ class CareerPathRecommender:
         recommendations = []
 
         for path_name, score in sorted_paths[1:5]:  # Skip top path (assumed served by job matcher)
-            path_data = self.career_paths[path_name]
+            path_data = career_paths[path_name]
             path_skills = set([skill.lower() for skill in path_data["skills"]])
             missing_skills = path_skills - user_skills
 
@@ -57,53 +154,30 @@ class CareerPathRecommender:
                 total_years += 1
         return total_years
 
-    def _extract_paths_from_jobs(self, jobs):
-        keyword_categories = {
-            "Software Development": ["developer", "engineer", "software", "full stack", "backend", "frontend"],
-            "Data Science": ["data scientist", "machine learning", "ai", "analyst"],
-            "DevOps": ["devops", "site reliability", "infrastructure", "cloud", "ci/cd", "sre"],
-            "QA": ["qa", "quality assurance", "test", "automation"],
-            "Cloud Engineering": ["cloud", "aws", "azure", "gcp", "architect"],
-            "Frontend Development": ["frontend", "react", "vue", "html", "css", "ui"],
-            "Backend Development": ["backend", "django", "flask", "node", "sql", "database"],
-            "Product Management": [
-                "product manager", "product owner", "roadmap", "stakeholders", "market research",
-                "requirements", "product strategy", "go-to-market", "product lifecycle"
-            ],
-            "Project Management": [
-                "project manager", "scrum master", "agile", "waterfall", "timeline", "milestones",
-                "budget", "risk management", "status reporting", "resource allocation"
-            ]
-        }
-
-        common_skills = {
-            "python", "java", "c++", "javascript", "react", "angular", "node.js",
-            "git", "docker", "kubernetes", "aws", "sql", "flask", "django",
-            "machine learning", "tensorflow", "pytorch", "css", "html", "linux",
-            "ci/cd", "jenkins", "vue", "azure", "gcp", "jira", "selenium"
-        }
-
-        path_data = defaultdict(lambda: {
-            "skills": set(),
-            "roles": set(),
-            "description": "",
-        })
-
-        for job in jobs:
-            title = job.get("title", "").lower()
-            desc = job.get("description", "").lower()
-            combined = f"{title} {desc}"
-
-            for category, keywords in keyword_categories.items():
-                if any(k in combined for k in keywords):
-                    path_data[category]["roles"].add(job.get("title", "Unknown Role"))
-                    path_data[category]["description"] = f"Auto-generated from Adzuna job titles/descriptions for {category}"
-                    matched_skills = [s for s in common_skills if s in desc]
-                    path_data[category]["skills"].update(matched_skills)
-
-        return {k: {
-            "skills": list(v["skills"]),
-            "roles": list(v["roles"]),
-            "description": v["description"]
-        } for k, v in path_data.items() if v["skills"] and v["roles"]}
-
+    def _remove(self, key):
+        posting = self._postings.pop(key, None)
+        if posting is None:
+            return 0
+        role, categories, skills = posting
+        for category in categories:
+            self._roles[category] -= Counter({role: 1})
+            self._skills[category] -= Counter(skills)
+        return 1
+
+    def _match_job(self, job):
+        # Categories whose keywords occur in the title or description; the skills a
+        # category gains from the posting are those in its description
+        title = job.get("title", "").lower()
+        desc = job.get("description", "").lower()
+        combined = f"{title} {desc}"
+
+        categories, skills = set(), []
+        for pattern, pattern_categories, is_skill in _PATTERNS:
+            if pattern in combined:
+                categories.update(pattern_categories)
+                if is_skill and pattern in desc:
+                    skills.append(pattern)
+        return tuple(c for c in KEYWORD_CATEGORIES if c in categories), tuple(skills)
+
+    def _job_key(self, job):
+        return job.get("job_id") or job.get("url") or (job.get("title"), job.get("description"))
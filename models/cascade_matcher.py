@@ -0,0 +1,112 @@
+# models/cascade_matcher.py
+import time
+import numpy as np
+from models.embedding_matcher import embed_texts
+from models.job_matcher import JobMatch, JobMatcher, PartialMatches
+from models.model_registry import DEFAULT_MODEL
+
+
+class CascadeMatcher(JobMatcher):
+    """Two-stage ranking: sparse TF-IDF picks `n_candidates` jobs, embeddings re-rank only those.
+
+    Stage one is the regular JobMatcher top-k search. Stage two embeds the resume and any
+    candidate not embedded yet (job vectors are cached per job and follow their jobs through
+    add_jobs/remove_jobs), then orders the candidates by embedding similarity.
+
+    Each stage has a latency budget in seconds. Stage one can't stop part way, so any time
+    it spends over its budget comes out of stage two's. Stage two embeds uncached candidates
+    in TF-IDF order, a batch at a time, while its budget lasts; candidates it didn't reach
+    follow the re-ranked ones in TF-IDF order, with their TF-IDF scores, and such a result
+    is left out of the match cache. `last_timings` describes the last query. Results are
+    JobMatch lists; top_k defaults to n_candidates.
+    """
+
+    def __init__(self, n_candidates=100, model_name=DEFAULT_MODEL, embed=None, candidate_budget=0.05, rerank_budget=0.25,
+                 embed_batch_size=32, hashed=False, n_features=2 ** 20, shards=1, shard_executor="thread", compact=False,
+                 match_cache=None, scoring="tfidf", retrieval="dense"):
+        if compact:
+            raise ValueError("Cascade re-ranking embeds job descriptions on demand, so it can't use a compact index.")
+        super().__init__(hashed=hashed, n_features=n_features, shards=shards, shard_executor=shard_executor,
+                         match_cache=match_cache, scoring=scoring, retrieval=retrieval)
+        self.n_candidates = n_candidates
+        self.model_name = model_name
+        self.embed = embed
+        self.candidate_budget = candidate_budget
+        self.rerank_budget = rerank_budget
+        self.embed_batch_size = embed_batch_size
+        self.last_timings = None
+
+    def _reset(self):
+        super()._reset()
+        # One row per job; rows with _embedded False haven't been embedded yet
+        self._job_embeddings = None
+        self._embedded = np.zeros(0, dtype=bool)
+
+    def memory_report(self):
+        report = super().memory_report()
+        report["job_embeddings"] = self._job_embeddings.nbytes + self._embedded.nbytes if self._job_embeddings is not None else 0
+        report["total"] += report["job_embeddings"]
+        return report
+
+    def _match(self, resume_text, top_k, filters):
+        top_k = self.n_candidates if top_k is None else top_k
+        start = time.perf_counter()
+        rows = self.filter_index.rows(filters) if filters else None
+        candidates, sparse_scores = self._search(self._transform([resume_text]), max(self.n_candidates, top_k), rows)
+        candidate_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deadline = start + max(0.0, self.rerank_budget - max(0.0, candidate_seconds - self.candidate_budget))
+        query = embed_texts([resume_text], self.model_name, self.embed)[0]
+        missing = candidates[~self._embedded[candidates]]
+        embedded = 0
+        while embedded < len(missing) and time.perf_counter() < deadline:
+            batch = missing[embedded:embedded + self.embed_batch_size]
+            self._store_embeddings(batch, embed_texts([self._jobs[row]["description"] for row in batch], self.model_name, self.embed))
+            embedded += len(batch)
+
+        ready = self._embedded[candidates]
+        reranked = candidates[ready]
+        semantic = self._job_embeddings[reranked] @ query if len(reranked) else np.empty(0, dtype=np.float32)
+        order = np.lexsort((reranked, -semantic))
+        indices = np.concatenate([reranked[order], candidates[~ready]])[:top_k]
+        scores = np.concatenate([semantic[order], sparse_scores[~ready]])[:top_k]
+        self.last_timings = {
+            "candidates": candidate_seconds,
+            "rerank": time.perf_counter() - start,
+            "n_candidates": len(candidates),
+            "embedded": embedded,
+            "reranked": len(reranked),
+        }
+        jobs = self.jobs
+        matches = [JobMatch(i, score, jobs) for i, score in zip(indices, scores)]
+        # A re-rank the budget cut short isn't cached, so a later query can finish it
+        return matches if len(reranked) == len(candidates) else PartialMatches(matches)
+
+    def _match_batch(self, texts, top_k, chunk_size):
+        # The re-rank is per resume; batching only the sparse stage would skip it
+        for text in texts:
+            yield self._match(text, top_k, None) if text.strip() else []
+
+    def _store_embeddings(self, rows, vectors):
+        if self._job_embeddings is None:
+            self._job_embeddings = np.zeros((len(self._embedded), vectors.shape[1]), dtype=np.float32)
+        self._job_embeddings[rows] = vectors
+        self._embedded[rows] = True
+
+    def _build_vectors(self, keep):
+        # Cached embeddings follow their jobs through compaction; added jobs start unembedded
+        rows = np.asarray(keep, dtype=np.intp)
+        old = rows < len(self._embedded)
+        embedded = np.zeros(len(rows), dtype=bool)
+        embedded[old] = self._embedded[rows[old]]
+        if self._job_embeddings is not None:
+            vectors = np.zeros((len(rows), self._job_embeddings.shape[1]), dtype=np.float32)
+            vectors[old] = self._job_embeddings[rows[old]]
+            self._job_embeddings = vectors
+        self._embedded = embedded
+        return super()._build_vectors(keep)
+
+    def _cache_text(self, resume_text):
+        # The re-rank embeds the exact text
+        return resume_text
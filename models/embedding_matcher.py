@@ -0,0 +1,97 @@
+# models/embedding_matcher.py
+import numpy as np
+from models.ann_index import IVFIndex
+from models.job_matcher import JobMatcher
+from models.model_registry import DEFAULT_MODEL, get_task_nlp
+
+
+def embed_texts(texts, model_name=DEFAULT_MODEL, embed=None):
+    """l2-normalized float32 document vectors: `embed(texts)` if given, else spaCy's doc.vector."""
+    if embed is not None:
+        vectors = np.array(embed(texts), dtype=np.float32, ndmin=2)
+    else:
+        nlp = get_task_nlp("similarity", model_name)
+        vectors = np.array([doc.vector for doc in nlp.pipe(texts)], dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    # Texts without any known word keep a zero vector and score 0 against everything
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+class EmbeddingMatcher(JobMatcher):
+    """JobMatcher that ranks jobs by dense document embeddings instead of TF-IDF.
+
+    Jobs are embedded once (mean spaCy word vectors by default, or any `embed(texts)`
+    function) into a normalized float32 matrix, so a query is one matrix-vector product.
+    With `ann`, top-k queries probe an IVF index instead of scoring every job.
+    """
+
+    def __init__(self, model_name=DEFAULT_MODEL, embed=None, ann=False, ann_lists=None, ann_probe=8, ann_min_jobs=10_000,
+                 shards=1, shard_executor="thread", compact=False, match_cache=None):
+        super().__init__(shards=shards, shard_executor=shard_executor, compact=compact, match_cache=match_cache)
+        self.model_name = model_name
+        self.embed = embed
+        self.ann = ann
+        self.ann_lists = ann_lists
+        self.ann_probe = ann_probe
+        # Below this many jobs exact search is about as fast, so no index is built
+        self.ann_min_jobs = ann_min_jobs
+
+    def _reset(self):
+        super()._reset()
+        self._embeddings = None
+        self.ann_index = None
+
+    def save(self, path):
+        raise ValueError("Saving is only supported for TF-IDF job indexes.")
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        raise ValueError("Loading is only supported for TF-IDF job indexes.")
+
+    def memory_report(self):
+        report = super().memory_report()
+        index = self.ann_index
+        report["ann_index"] = index.ids.nbytes + index.offsets.nbytes + index.centroids.nbytes if index is not None else 0
+        report["total"] += report["ann_index"]
+        return report
+
+    def _cache_text(self, resume_text):
+        # spaCy keeps case and whitespace tokens, so only identical texts embed identically
+        return resume_text
+
+    def _check_changeable(self):
+        # Embeddings of kept jobs are carried over, so compact indexes can change too
+        pass
+
+    def _search(self, resume_vector, top_k, rows=None):
+        # Filtered queries score their candidate rows exactly
+        if self.ann_index is not None and rows is None:
+            return self.ann_index.search(resume_vector, top_k)
+        return super()._search(resume_vector, top_k, rows)
+
+    def _transform(self, texts):
+        return embed_texts(texts, self.model_name, self.embed)
+
+    def _build_vectors(self, keep):
+        # Only rows added since the last refresh are embedded; the rest are carried over
+        keep = np.asarray(keep, dtype=np.intp)
+        embedded = 0 if self._embeddings is None else len(self._embeddings)
+        new = np.flatnonzero(keep >= embedded)
+        new_vectors = self._transform([self._jobs[row]["description"] for row in new]) if len(new) else None
+
+        if self._embeddings is None and new_vectors is None:
+            return None
+        dim = new_vectors.shape[1] if new_vectors is not None else self._embeddings.shape[1]
+        vectors = np.empty((len(keep), dim), dtype=np.float32)
+        old = np.flatnonzero(keep < embedded)
+        if len(old):
+            vectors[old] = self._embeddings[keep[old]]
+        if len(new):
+            vectors[new] = new_vectors
+        self._embeddings = vectors
+
+        self.ann_index = None
+        if self.ann and len(vectors) >= self.ann_min_jobs:
+            self.ann_index = IVFIndex(vectors, n_lists=self.ann_lists, n_probe=self.ann_probe)
+        return vectors
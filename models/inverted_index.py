@@ -0,0 +1,135 @@
+# models/inverted_index.py
+import threading
+import numpy as np
+import scipy.sparse as sp
+
+# Relative slack on pruning thresholds, so rounding differences between partial sums and
+# exact scores never prune a job that belongs in the top k
+_SLACK = 1e-6
+
+
+class InvertedIndex:
+    """Top-k retrieval over a sparse job-term weight matrix through term postings.
+
+    Each term's postings are the job rows containing it (sorted int32 ids) and their weights,
+    sliced from one CSC copy of the matrix. A query scores jobs term by term with MaxScore
+    pruning: terms are visited in order of their largest possible contribution, and once the
+    terms left could not lift an unseen job past the current k-th best score, their postings
+    are only probed (binary search) for jobs already seen instead of scanned. Candidates
+    that survive are rescored from the row-major matrix, so scores and tie order are exactly
+    those of a full matrix-vector product.
+
+    Per-job score and seen buffers are allocated once and only the touched entries are
+    reset after a query, so a query's cost follows the postings it reads, not the number of
+    jobs. A query that finds the buffers in use by another thread gets its own.
+    """
+
+    def __init__(self, weights):
+        self.weights = weights.tocsr()
+        self.n_rows = weights.shape[0]
+        columns = sp.csc_matrix(weights)
+        columns.sort_indices()
+        self.offsets = columns.indptr
+        self.rows = columns.indices.astype(np.int32, copy=False)
+        self.values = columns.data
+        # Largest weight per term: its maximum possible contribution per unit of query weight
+        self.max_weight = np.zeros(weights.shape[1], dtype=self.values.dtype)
+        filled = np.flatnonzero(np.diff(self.offsets))
+        if len(filled):
+            self.max_weight[filled] = np.maximum.reduceat(self.values, self.offsets[filled])
+        self.last_stats = None
+        self._scores = np.zeros(self.n_rows)
+        self._seen = np.zeros(self.n_rows, dtype=bool)
+        self._buffers = threading.Lock()
+
+    def postings(self, term):
+        start, stop = self.offsets[term], self.offsets[term + 1]
+        return self.rows[start:stop], self.values[start:stop]
+
+    def search(self, query, k):
+        """(rows, scores) of the k best rows for one sparse query row vector, best first."""
+        if not self._buffers.acquire(blocking=False):
+            return self._search(query, k, np.zeros(self.n_rows), np.zeros(self.n_rows, dtype=bool))
+        try:
+            return self._search(query, k, self._scores, self._seen)
+        finally:
+            self._buffers.release()
+
+    def _search(self, query, k, scores, seen):
+        query = sp.csr_matrix(query)
+        terms, weights = query.indices, query.data
+        bounds = weights * self.max_weight[terms]
+        order = np.argsort(-bounds, kind="stable")
+        terms, weights, bounds = terms[order], weights[order], bounds[order]
+        # rest[i]: the most terms i.. can add to any job
+        rest = np.append(np.cumsum(bounds[::-1])[::-1], 0.0)
+
+        found = []
+        candidates = np.empty(0, dtype=np.int32)
+        threshold = 0.0
+        scanned = probed = 0
+
+        try:
+            # Essential terms: scan their postings while an unseen job could still make the top k
+            term = 0
+            while term < len(terms):
+                rows, values = self.postings(terms[term])
+                scores[rows] += weights[term] * values
+                new = rows[~seen[rows]]
+                seen[new] = True
+                found.append(new)
+                scanned += len(rows)
+                term += 1
+                candidates = np.concatenate(found)
+                found = [candidates]
+                threshold = self._threshold(scores[candidates], k)
+                if rest[term] < threshold:
+                    break
+
+            # Non-essential terms: only jobs that can still reach the k-th best score are probed
+            for term in range(term, len(terms)):
+                candidates = candidates[scores[candidates] + rest[term] >= threshold]
+                rows, values = self.postings(terms[term])
+                positions = np.minimum(np.searchsorted(rows, candidates), max(len(rows) - 1, 0))
+                hit = rows[positions] == candidates if len(rows) else np.zeros(len(candidates), dtype=bool)
+                scores[candidates[hit]] += weights[term] * values[positions[hit]]
+                probed += len(candidates)
+                threshold = max(threshold, self._threshold(scores[candidates], k))
+
+            candidates = np.sort(candidates[scores[candidates] >= threshold])
+        finally:
+            # `found` holds every row this query touched; the buffers go back to all zero
+            touched = np.concatenate(found) if found else candidates
+            scores[touched] = 0
+            seen[touched] = False
+
+        exact = np.asarray((self.weights[candidates] @ query.T).todense()).ravel()
+        top = np.lexsort((candidates, -exact))[:k]
+        rows, values = candidates[top], exact[top]
+        if len(rows) < k:
+            # Too few jobs share a term with the query: the rest score 0, in row order
+            zero = _first_rows_not_in(rows, k - len(rows), self.n_rows)
+            rows = np.concatenate([rows, zero])
+            values = np.concatenate([values, np.zeros(len(zero), dtype=values.dtype)])
+
+        self.last_stats = {"postings": int(self.offsets[terms + 1].sum() - self.offsets[terms].sum()),
+                           "scanned": scanned, "probed": probed, "rescored": len(candidates)}
+        return rows, values
+
+    def _threshold(self, scores, k):
+        # Lower bound on the final k-th best score (partial scores only grow)
+        if len(scores) < k:
+            return 0.0
+        return np.partition(scores, len(scores) - k)[len(scores) - k] * (1 - _SLACK)
+
+
+def _first_rows_not_in(rows, count, n_rows):
+    # The first `count` row ids (in order) missing from `rows`, reading at most len(rows) + count ids
+    taken = set(rows.tolist())
+    missing = []
+    row = 0
+    while len(missing) < count and row < n_rows:
+        if row not in taken:
+            missing.append(row)
+        row += 1
+    return np.array(missing, dtype=np.intp)
@@ -0,0 +1,141 @@
+# models/job_dedup.py
+import re
+import zlib
+import numpy as np
+
+# Shingles hashed per block when computing signatures, to bound temporary memory
+_SIGNATURE_BLOCK = 1 << 16
+
+
+class JobDeduplicator:
+    """Drops near-duplicate job postings, keeping one canonical posting per cluster.
+
+    Each posting's title and description are cut into word shingles and summarized by a
+    MinHash signature; LSH banding buckets postings that agree on a whole band, so only
+    bucket mates are compared instead of every pair. Bucket mates whose estimated Jaccard
+    similarity reaches `threshold` are merged into one cluster. Within a bucket a posting is
+    compared with one representative of each cluster there so far, not every member, so a
+    pair can still be missed in one band when neither is close to the representative; the
+    other bands usually catch it.
+
+    The canonical posting of a cluster is the most recently posted one, preferring postings
+    with a salary and then longer descriptions. `report` describes the last run.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=32, shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        # One random 64-bit key per permutation, mixed into every shingle hash (see _permute)
+        self._keys = np.random.default_rng(seed).integers(0, 2 ** 63, num_perm, dtype=np.uint64) << np.uint64(1)
+        self.report = None
+
+    def deduplicate(self, jobs):
+        """The canonical posting of every near-duplicate cluster, in their original order."""
+        jobs = list(jobs)
+        clusters = self.clusters(jobs)
+        kept = sorted(max(cluster, key=lambda i: self._canonical_rank(jobs[i], i)) for cluster in clusters)
+        self.report.update(
+            kept=len(kept),
+            removed=len(jobs) - len(kept),
+            reduction=(len(jobs) - len(kept)) / len(jobs) if jobs else 0.0,
+        )
+        return [jobs[i] for i in kept]
+
+    def clusters(self, jobs):
+        """Lists of job indices, one per near-duplicate cluster (singletons included)."""
+        signatures = self.signatures([self._job_text(job) for job in jobs])
+        parent = list(range(len(jobs)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        rows = self.num_perm // self.bands
+        compared = 0
+        for band in range(self.bands):
+            buckets = {}
+            for i, signature in enumerate(signatures):
+                if signature is None:
+                    continue
+                buckets.setdefault(signature[band * rows:(band + 1) * rows].tobytes(), []).append(i)
+            for members in buckets.values():
+                # Each member is compared with one member of every cluster already formed in
+                # this bucket, so two postings that both differ from the first member still
+                # merge; a bucket of n postings in c clusters costs about n * c comparisons
+                representatives = []
+                for i in members:
+                    joined = False
+                    for j in representatives:
+                        root_i, root_j = find(i), find(j)
+                        if root_i == root_j:
+                            joined = True
+                            continue
+                        compared += 1
+                        if np.mean(signatures[i] == signatures[j]) >= self.threshold:
+                            parent[root_i] = root_j
+                            joined = True
+                    if not joined:
+                        representatives.append(i)
+
+        clusters = {}
+        for i in range(len(jobs)):
+            clusters.setdefault(find(i), []).append(i)
+        self.report = {"jobs": len(jobs), "clusters": len(clusters), "compared_pairs": compared}
+        return list(clusters.values())
+
+    def signatures(self, texts):
+        """MinHash signature (uint64 array of num_perm values) per text; None for texts without words."""
+        hashes = [self._shingle_hashes(text) for text in texts]
+        signatures = [None] * len(texts)
+        present = [i for i, h in enumerate(hashes) if len(h)]
+
+        # Signatures of many postings at once: hash every shingle in a block under every
+        # permutation, then take the minimum within each posting's run of shingles
+        start = 0
+        while start < len(present):
+            stop, size = start, 0
+            while stop < len(present) and (stop == start or size + len(hashes[present[stop]]) <= _SIGNATURE_BLOCK):
+                size += len(hashes[present[stop]])
+                stop += 1
+            block = np.concatenate([hashes[i] for i in present[start:stop]])
+            offsets = np.cumsum([0] + [len(hashes[i]) for i in present[start:stop - 1]])
+            permuted = self._permute(block)
+            minima = np.minimum.reduceat(permuted, offsets, axis=1)
+            for column, i in enumerate(present[start:stop]):
+                signatures[i] = minima[:, column]
+            start = stop
+        return signatures
+
+    def _permute(self, hashes):
+        # num_perm x len(hashes) independent-looking hash values: each key is xored in and
+        # the result run through the murmur3 64-bit finalizer. (Linear a * x + b hashes are
+        # cheaper but far from min-wise independent, and under-estimate similar pairs.)
+        x = hashes[None, :] ^ self._keys[:, None]
+        x ^= x >> np.uint64(33)
+        x *= np.uint64(0xFF51AFD7ED558CCD)
+        x ^= x >> np.uint64(33)
+        x *= np.uint64(0xC4CEB9FE1A85EC53)
+        x ^= x >> np.uint64(33)
+        return x
+
+    def _shingle_hashes(self, text):
+        words = re.findall(r"[a-z0-9]+", text.lower())
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        return np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+
+    def _job_text(self, job):
+        return f"{job.get('title') or ''} {job.get('description') or ''}"
+
+    def _canonical_rank(self, job, index):
+        has_salary = job.get("salary_min") is not None or job.get("salary_max") is not None
+        # Dates are YYYY-MM-DD strings, so they order correctly as text; earlier postings win ties
+        return (job.get("date_posted") or "", has_salary, len(job.get("description") or ""), -index)
@@ -0,0 +1,137 @@
+# models/job_filters.py
+import datetime
+import numpy as np
+
+
+class JobFilterIndex:
+    """Column indexes over job metadata, for picking candidate rows before any scoring.
+
+    Location and category values map to packed bitmaps over the rows (or plain row lists for
+    values too rare for a bitmap to pay off); salaries and posting dates are sorted arrays
+    answered with binary search. Supported filters:
+
+        location            str or list of str; a whole location or one of its comma-separated parts
+        category            str or list of str
+        min_salary          the job's salary range reaches at least this much
+        max_salary          the job's salary range starts at or below this much
+        posted_after        date or ISO date string (inclusive)
+        posted_within_days  int, relative to today
+
+    Values are compared case-insensitively. Jobs missing a field never match a filter on it.
+    """
+
+    FILTERS = ("location", "category", "min_salary", "max_salary", "posted_after", "posted_within_days")
+
+    def __init__(self, jobs):
+        self.n_rows = len(jobs)
+        location_rows, category_rows = {}, {}
+        salary_low = np.full(self.n_rows, np.nan)
+        salary_high = np.full(self.n_rows, np.nan)
+        posted = np.full(self.n_rows, np.datetime64("NaT"), dtype="datetime64[D]")
+
+        for row, job in enumerate(jobs):
+            location = self._normalize(job.get("location"))
+            if location:
+                parts = {location} | {part.strip() for part in location.split(",") if part.strip()}
+                for part in parts:
+                    location_rows.setdefault(part, []).append(row)
+            category = self._normalize(job.get("category"))
+            if category:
+                category_rows.setdefault(category, []).append(row)
+
+            low, high = job.get("salary_min"), job.get("salary_max")
+            salary_low[row] = low if low is not None else (high if high is not None else np.nan)
+            salary_high[row] = high if high is not None else salary_low[row]
+            posted[row] = self._parse_date(job.get("date_posted"))
+
+        self.locations = {value: self._postings(rows) for value, rows in location_rows.items()}
+        self.categories = {value: self._postings(rows) for value, rows in category_rows.items()}
+        self.salary_low = _SortedColumn(salary_low)
+        self.salary_high = _SortedColumn(salary_high)
+        self.posted = _SortedColumn(posted)
+
+    def rows(self, filters):
+        """Sorted row numbers of the jobs that pass every filter."""
+        unknown = set(filters) - set(self.FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown job filters: {', '.join(sorted(unknown))}. Expected: {', '.join(self.FILTERS)}.")
+
+        allowed = None
+        for name, values in (("location", self.locations), ("category", self.categories)):
+            if filters.get(name) is None:
+                continue
+            wanted = [filters[name]] if isinstance(filters[name], str) else filters[name]
+            matched = np.zeros(self.n_rows, dtype=bool)
+            for value in wanted:
+                postings = values.get(self._normalize(value))
+                if postings is None:
+                    continue
+                if postings.dtype == np.uint8:
+                    matched |= np.unpackbits(postings, count=self.n_rows).view(bool)
+                else:
+                    matched[postings] = True
+            allowed = matched if allowed is None else allowed & matched
+
+        ranges = []
+        if filters.get("min_salary") is not None:
+            ranges.append((self.salary_high, np.greater_equal, filters["min_salary"]))
+        if filters.get("max_salary") is not None:
+            ranges.append((self.salary_low, np.less_equal, filters["max_salary"]))
+        if filters.get("posted_after") is not None:
+            ranges.append((self.posted, np.greater_equal, self._parse_date(filters["posted_after"])))
+        if filters.get("posted_within_days") is not None:
+            since = datetime.date.today() - datetime.timedelta(days=filters["posted_within_days"])
+            ranges.append((self.posted, np.greater_equal, np.datetime64(since, "D")))
+
+        if not ranges:
+            return np.arange(self.n_rows) if allowed is None else np.flatnonzero(allowed)
+
+        # Start from the most selective range (a binary-searched slice), then check only
+        # those rows against the other ranges and the location/category matches
+        candidates = [column.select(op, value) for column, op, value in ranges]
+        smallest = min(range(len(ranges)), key=lambda i: len(candidates[i]))
+        rows = np.sort(candidates[smallest])
+        for i, (column, op, value) in enumerate(ranges):
+            if i != smallest:
+                rows = rows[op(column.raw[rows], value)]
+        if allowed is not None:
+            rows = rows[allowed[rows]]
+        return rows
+
+    def _postings(self, rows):
+        # A packed bitmap costs n_rows / 8 bytes; a row list 4 bytes per row
+        if len(rows) * 4 < self.n_rows / 8:
+            return np.array(rows, dtype=np.int32)
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[rows] = True
+        return np.packbits(mask)
+
+    def _normalize(self, value):
+        return str(value).strip().lower() if value is not None else ""
+
+    def _parse_date(self, value):
+        if value is None or value == "":
+            return np.datetime64("NaT")
+        if isinstance(value, (datetime.date, np.datetime64)):
+            return np.datetime64(value, "D")
+        try:
+            # Adzuna dates look like 2025-04-12T10:00:00Z; only the day matters here
+            return np.datetime64(str(value)[:10], "D")
+        except ValueError:
+            return np.datetime64("NaT")
+
+
+class _SortedColumn:
+    # A numeric/date column sorted once, answering range queries with binary search.
+    # Missing values (NaN/NaT) are left out of the sorted part and fail every comparison.
+    def __init__(self, values):
+        self.raw = values
+        present = np.flatnonzero(~np.isnat(values) if values.dtype.kind == "M" else ~np.isnan(values))
+        order = np.argsort(values[present], kind="stable")
+        self.values = values[present][order]
+        self.rows = present[order]
+
+    def select(self, op, value):
+        if op is np.greater_equal:
+            return self.rows[np.searchsorted(self.values, value, side="left"):]
+        return self.rows[:np.searchsorted(self.values, value, side="right")]
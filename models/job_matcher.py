@@ -1,42 +1,281 @@
 # models/job_matcher.py
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import os
+import sys
+import json
+import bisect
+import numpy as np
+import scipy.sparse as sp
+from collections.abc import Mapping
+from models.inverted_index import InvertedIndex
+from models.job_filters import JobFilterIndex
+from models.match_cache import MatchCache
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+INDEX_FORMAT = "jobfinity-job-index"
+INDEX_VERSION = 1
+
+# Okapi BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
 
 class JobMatcher:
-    def __init__(self):
+    SCORINGS = ("tfidf", "bm25")
+    RETRIEVALS = ("dense", "inverted")
+
+    def __init__(self, hashed=False, n_features=2 ** 20, shards=1, shard_executor="thread", compact=False, match_cache=None,
+                 scoring="tfidf", retrieval="dense"):
+        if scoring not in self.SCORINGS:
+            raise ValueError(f"Unknown scoring: {scoring}. Expected one of: {', '.join(self.SCORINGS)}.")
+        if retrieval not in self.RETRIEVALS:
+            raise ValueError(f"Unknown retrieval: {retrieval}. Expected one of: {', '.join(self.RETRIEVALS)}.")
+        from models.job_shards import ShardedScorer  # job_shards imports this module
+        if shard_executor not in ShardedScorer.EXECUTORS:
+            raise ValueError(f"Unknown shard executor: {shard_executor}. Expected one of: {', '.join(ShardedScorer.EXECUTORS)}.")
+        # hashed=True indexes jobs in a fixed-size hashed feature space, so add_jobs/remove_jobs
+        # only tokenize the changed jobs and update document frequencies; otherwise the TF-IDF
+        # vocabulary is refit on every change. Either way the next read re-weights every job
+        # (see _refresh): a changed job count moves every term's IDF, so that pass is
+        # O(total non-zeros), though far cheaper than re-tokenizing the corpus
+        self.hashed = hashed
+        self.n_features = n_features
+        # scoring="bm25" weights job terms with Okapi BM25 instead of l2-normalized TF-IDF, and
+        # scores are sums over the resume's distinct terms rather than cosine similarities
+        self.scoring = scoring
+        # retrieval="inverted" answers top-k queries from term postings (see InvertedIndex)
+        self.retrieval = retrieval
+        # compact=True stores job vectors as float32 with int32 indices and drops job
+        # descriptions once vectorized (see memory_report for what that saves)
+        self.compact = compact
+        # Optional MatchCache for match_resume results; `generation` goes up whenever the
+        # indexed jobs change, which retires every cached result
+        self.match_cache = match_cache
+        self.generation = 0
+        # shards > 1 splits top-k searches across that many parallel scorers (see ShardedScorer)
+        self.shards = shards
+        self.shard_executor = shard_executor
+        self._scorer = None
+        self._reset()
+
+    def _reset(self):
+        self._close_scorer()
+        self._inverted = None
         self.vectorizer = None
-        self.job_vectors = None
-        self.jobs = []
-        self.job_descriptions = []
+        self._job_vectors = None
+        self._jobs = []
+        self._job_descriptions = []
+
+        # Rows are appended on add and tombstoned on remove; _refresh compacts them
+        self._rows = {}
+        self._dead = set()
+        self._dirty = False
+        self._filter_index = None
+
+        # Hashed mode: raw term counts (one CSR block per add_jobs call) and document frequencies
+        self._count_blocks = []
+        self._block_starts = []
+        self._df = None
+        self._idf = None
+
+    @property
+    def jobs(self):
+        self._refresh()
+        return self._jobs
+
+    @property
+    def job_descriptions(self):
+        self._refresh()
+        if self.compact:
+            raise ValueError("Compact job indexes don't keep job descriptions.")
+        if self._job_descriptions is None:
+            self._job_descriptions = [job["description"] for job in self._jobs]
+        return self._job_descriptions
+
+    @property
+    def job_vectors(self):
+        self._refresh()
+        return self._job_vectors
+
+    @property
+    def filter_index(self):
+        # Built on the first filtered query after the jobs change
+        self._refresh()
+        if self._filter_index is None:
+            self._filter_index = JobFilterIndex(self._jobs)
+        return self._filter_index
 
     def preprocess_job_descriptions(self, jobs):
-        valid_jobs = [
-            job for job in jobs
-            if job.get("description") and len(job["description"].strip()) > 20
-        ]
+        valid_jobs = self._valid_jobs(jobs)
 
         if not valid_jobs:
             raise ValueError("No valid job information to vectorize. Please check job data.")
 
-        self.job_descriptions = [job["description"] for job in valid_jobs]
-        self.vectorizer = TfidfVectorizer(stop_words='english')
-        self.job_vectors = self.vectorizer.fit_transform(self.job_descriptions)
-        self.jobs = valid_jobs
+        self._reset()
+        self.add_jobs(valid_jobs)
+        self._refresh()
+
+    def add_jobs(self, jobs):
+        # A job whose job_id or url is already indexed replaces the old posting, as does a
+        # later job in the same batch
+        valid_jobs = self._unique_jobs(self._valid_jobs(jobs))
+        self._check_changeable()
+        self._materialize()
+        self.remove_jobs([key for job in valid_jobs for key in self._job_keys(job)])
+
+        if self.hashed:
+            if self.vectorizer is None:
+                self.vectorizer = HashingVectorizer(n_features=self.n_features, alternate_sign=False, norm=None, stop_words='english')
+                self._df = np.zeros(self.n_features, dtype=np.int32 if self.compact else np.int64)
+            counts = self.vectorizer.transform([job["description"] for job in valid_jobs])
+            if self.compact:
+                # A term repeated more than 65535 times in one posting is clipped
+                counts = _compact_csr(counts, np.uint16)
+            # Each (row, term) appears once in the CSR output, so this counts documents per term
+            np.add.at(self._df, counts.indices, 1)
+            self._block_starts.append(len(self._jobs))
+            self._count_blocks.append(counts)
+
+        for job in valid_jobs:
+            for key in self._job_keys(job):
+                self._rows[key] = len(self._jobs)
+            self._jobs.append(job)
+        self._dirty = self._dirty or bool(valid_jobs)
+        return len(valid_jobs)
+
+    def remove_jobs(self, keys):
+        # keys are job_id or url values; unknown keys are ignored
+        self._check_changeable()
+        self._materialize()
+        removed = 0
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is None or row in self._dead:
+                continue
+            if self.hashed:
+                block = bisect.bisect_right(self._block_starts, row) - 1
+                counts = self._count_blocks[block]
+                local = row - self._block_starts[block]
+                np.subtract.at(self._df, counts.indices[counts.indptr[local]:counts.indptr[local + 1]], 1)
+            self._dead.add(row)
+            removed += 1
+        self._dirty = self._dirty or bool(removed)
+        return removed
+
+    def save(self, path):
+        """Write the index to directory `path` in a format JobMatcher.load can memory-map."""
+        self._refresh()
+        if self._job_vectors is None:
+            raise ValueError("No job vectors to save. Add jobs first.")
+        os.makedirs(path, exist_ok=True)
+        # A loaded index may still be reading the files about to be replaced
+        if os.path.exists(os.path.join(path, "meta.json")):
+            os.remove(os.path.join(path, "meta.json"))
+
+        arrays = {"idf": self._idf if self.hashed else self.vectorizer.idf_}
+        arrays.update(self._csr_arrays("vectors", self._job_vectors))
+        if self.hashed:
+            arrays.update(self._csr_arrays("counts", self._count_blocks[0]))
+            arrays["df"] = self._df
+        else:
+            terms = sorted(self.vectorizer.vocabulary_, key=self.vectorizer.vocabulary_.get)
+            with open(os.path.join(path, "vocabulary.json"), "w", encoding="utf-8") as f:
+                json.dump(terms, f, separators=(",", ":"))
+        for name, array in arrays.items():
+            self._replace_file(path, f"{name}.npy", lambda f: np.save(f, array))
+
+        offsets = [0]
+        with open(os.path.join(path, "jobs.jsonl.tmp"), "wb") as f:
+            for job in self._jobs:
+                offsets.append(offsets[-1] + f.write(json.dumps(job, separators=(",", ":")).encode("utf-8") + b"\n"))
+        os.replace(os.path.join(path, "jobs.jsonl.tmp"), os.path.join(path, "jobs.jsonl"))
+        self._replace_file(path, "jobs_offsets.npy", lambda f: np.save(f, np.array(offsets, dtype=np.int64)))
+
+        # Written last: a directory without meta.json is an incomplete index
+        meta = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_VERSION,
+            "hashed": self.hashed,
+            "n_features": self.n_features,
+            "compact": self.compact,
+            "scoring": self.scoring,
+            "n_jobs": len(self._jobs),
+            "shape": list(self._job_vectors.shape),
+        }
+        self._replace_file(path, "meta.json", lambda f: f.write(json.dumps(meta, indent=2).encode("utf-8")))
+
+    @classmethod
+    def load(cls, path, mmap=True, shards=1, shard_executor="thread", retrieval="dense"):
+        """Load an index written by save. With mmap, the vectors and jobs stay on disk and are
+        paged in on demand, shared between every process that loads the same files."""
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"No saved job index at {path}.")
+        if meta.get("format") != INDEX_FORMAT or meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported job index format at {path}: {meta.get('format')} v{meta.get('version')}.")
+
+        mmap_mode = "r" if mmap else None
+        matcher = cls(hashed=meta["hashed"], n_features=meta["n_features"], shards=shards, shard_executor=shard_executor,
+                      compact=meta.get("compact", False), scoring=meta.get("scoring", "tfidf"), retrieval=retrieval)
+        matcher._job_vectors = matcher._load_csr(path, "vectors", meta["shape"], mmap_mode)
+        if matcher.hashed:
+            matcher.vectorizer = HashingVectorizer(n_features=matcher.n_features, alternate_sign=False, norm=None, stop_words='english')
+            matcher._idf = np.load(os.path.join(path, "idf.npy"))
+            matcher._df = np.load(os.path.join(path, "df.npy"))
+            matcher._count_blocks = [matcher._load_csr(path, "counts", meta["shape"], mmap_mode)]
+            matcher._block_starts = [0]
+        else:
+            with open(os.path.join(path, "vocabulary.json"), encoding="utf-8") as f:
+                terms = json.load(f)
+            matcher.vectorizer = TfidfVectorizer(stop_words='english')
+            matcher.vectorizer.vocabulary_ = {term: i for i, term in enumerate(terms)}
+            matcher.vectorizer.idf_ = np.load(os.path.join(path, "idf.npy"))
 
-    def match_resume(self, resume_data):
+        matcher._jobs = _SavedJobs(path, mmap_mode)
+        matcher._job_descriptions = None
+        return matcher
+
+    def match_resume(self, resume_data, top_k=None, filters=None):
+        # With top_k, only the best k jobs are selected and returned as lazy JobMatch
+        # mappings, instead of a scored copy of every job. With filters (see JobFilterIndex),
+        # only the jobs that pass them are scored at all.
         resume_text = self._create_resume_text(resume_data)
         if not resume_text.strip():
             raise ValueError("Resume text is empty.")
 
-        resume_vector = self.vectorizer.transform([resume_text])
-
         if self.job_vectors is None or self.job_vectors.shape[0] == 0:
             raise ValueError("No job vectors available for similarity comparison.")
 
-        similarities = cosine_similarity(resume_vector, self.job_vectors)[0]
+        if self.match_cache is None:
+            return self._match(resume_text, top_k, filters)
+        key = self._cache_key(resume_text, top_k, filters)
+        matches = self.match_cache.get(key)
+        if matches is None:
+            matches = self._match(resume_text, top_k, filters)
+            if not isinstance(matches, PartialMatches):
+                self.match_cache.set(key, matches, _result_size(matches))
+        # JobMatch results are read-only; scored job copies are copied again so callers
+        # can't change the cached ones
+        return list(matches) if top_k is not None else [job.copy() for job in matches]
+
+    def _match(self, resume_text, top_k, filters):
+        rows = self.filter_index.rows(filters) if filters else None
+        resume_vector = self._transform([resume_text])
+
+        if top_k is not None:
+            jobs = self.jobs
+            return [JobMatch(i, score, jobs) for i, score in zip(*self._search(resume_vector, top_k, rows))]
+
+        # Job and resume rows are l2-normalized, so the dot product is the cosine similarity
+        if rows is None:
+            similarities = _dense(self.job_vectors @ resume_vector.T).ravel()
+            rows = range(len(similarities))
+        else:
+            similarities = _dense(self.job_vectors[rows] @ resume_vector.T).ravel()
 
         matched_jobs = []
-        for i, similarity in enumerate(similarities):
+        for i, similarity in zip(rows, similarities):
             job_match = self.jobs[i].copy()
             job_match["similarity"] = similarity
             matched_jobs.append(job_match)
@@ -44,6 +283,242 @@ class JobMatcher:
         matched_jobs.sort(key=lambda x: x["similarity"], reverse=True)
         return matched_jobs
 
+    def match_many(self, resumes, top_k=20, batch_size=256, chunk_size=65536):
+        """Yield the top_k JobMatch list for each resume in `resumes` (any iterable), in order.
+
+        Resumes are vectorized batch_size at a time and scored against chunk_size jobs at a
+        time, so scoring memory stays near batch_size * chunk_size * 8 bytes whatever the
+        number of resumes or jobs. Resumes with no usable text get an empty list.
+        """
+        if self.job_vectors is None or self.job_vectors.shape[0] == 0:
+            raise ValueError("No job vectors available for similarity comparison.")
+
+        batch = []
+        for resume_data in resumes:
+            batch.append(self._create_resume_text(resume_data))
+            if len(batch) == batch_size:
+                yield from self._match_batch(batch, top_k, chunk_size)
+                batch = []
+        if batch:
+            yield from self._match_batch(batch, top_k, chunk_size)
+
+    def _match_batch(self, texts, top_k, chunk_size):
+        jobs = self.jobs
+        job_vectors = self.job_vectors
+        resume_vectors = self._transform(texts)
+        best = [(np.empty(0), np.empty(0, dtype=np.intp))] * len(texts)
+
+        for start in range(0, job_vectors.shape[0], chunk_size):
+            scores = _dense(resume_vectors @ job_vectors[start:start + chunk_size].T)
+            for row, row_scores in enumerate(scores):
+                # Merge this chunk's best with the best so far, keeping full-sort order
+                top = top_k_indices(row_scores, top_k)
+                best_scores, best_indices = best[row]
+                candidate_scores = np.concatenate([best_scores, row_scores[top]])
+                candidate_indices = np.concatenate([best_indices, top + start])
+                order = np.lexsort((candidate_indices, -candidate_scores))[:top_k]
+                best[row] = (candidate_scores[order], candidate_indices[order])
+
+        for text, (best_scores, best_indices) in zip(texts, best):
+            if not text.strip():
+                yield []
+                continue
+            yield [JobMatch(i, score, jobs) for i, score in zip(best_indices, best_scores)]
+
+    def _search(self, resume_vector, top_k, rows=None):
+        # (indices, scores) of the top_k jobs for one resume vector, best first, optionally
+        # among the given sorted rows only
+        if rows is None:
+            if self.retrieval == "inverted":
+                return self._inverted_index().search(resume_vector, top_k)
+            if self.shards > 1:
+                return self._sharded_scorer().search(resume_vector, top_k)
+            similarities = _dense(self.job_vectors @ resume_vector.T).ravel()
+            indices = top_k_indices(similarities, top_k)
+            return indices, similarities[indices]
+        similarities = _dense(self.job_vectors[rows] @ resume_vector.T).ravel()
+        indices = top_k_indices(similarities, top_k)
+        return rows[indices], similarities[indices]
+
+    def _sharded_scorer(self):
+        # Built on the first search after the jobs change
+        if self._scorer is None:
+            from models.job_shards import ShardedScorer  # job_shards imports this module
+            self._scorer = ShardedScorer(self.job_vectors, self.shards, self.shard_executor)
+        return self._scorer
+
+    def _close_scorer(self):
+        if self._scorer is not None:
+            self._scorer.close()
+            self._scorer = None
+
+    def _cache_key(self, resume_text, top_k, filters):
+        return self.generation, MatchCache.key_for(self._cache_text(resume_text)), top_k, _filters_key(filters)
+
+    def _cache_text(self, resume_text):
+        # The vectorizers lowercase and tokenize on words, so case and spacing can't change a match
+        return " ".join(resume_text.lower().split())
+
+    def _inverted_index(self):
+        # Built on the first search after the jobs change
+        self._refresh()
+        if self._inverted is None:
+            self._inverted = InvertedIndex(self._job_vectors)
+        return self._inverted
+
+    def _transform(self, texts):
+        vectors = self._weight(self.vectorizer.transform(texts)) if self.hashed else self.vectorizer.transform(texts)
+        if self.scoring == "bm25":
+            # BM25 counts each indexed resume term once; the job side carries idf and tf
+            vectors.data = np.ones_like(vectors.data)
+        # Queries match the job vectors' dtype; scipy would otherwise upcast a float32
+        # job matrix to float64 (a full copy) on every product
+        return vectors.astype(np.float32) if self.compact else vectors
+
+    def _weight(self, counts):
+        # TF-IDF with l2 rows, as TfidfVectorizer computes it; terms no job contains get
+        # zero weight, like words outside a fitted vocabulary
+        weighted = counts.astype(np.float32 if self.compact else np.float64)
+        weighted.data *= self._idf[weighted.indices]
+        weighted.eliminate_zeros()
+        return normalize(weighted, copy=False)
+
+    def _bm25(self, counts):
+        # Okapi BM25 job-term weights: idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg length))
+        weighted = counts.astype(np.float32 if self.compact else np.float64).tocsr()
+        n_jobs = weighted.shape[0]
+        df = np.bincount(weighted.indices, minlength=weighted.shape[1])
+        idf = np.log1p((n_jobs - df + 0.5) / (df + 0.5))
+        lengths = np.asarray(weighted.sum(axis=1)).ravel()
+        saturation = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(lengths.mean(), 1.0))
+        tf = weighted.data
+        weighted.data = idf[weighted.indices] * tf * (BM25_K1 + 1) / (tf + np.repeat(saturation, np.diff(weighted.indptr)))
+        return weighted
+
+    def _refresh(self):
+        # Apply pending adds/removes: drop tombstoned rows, then re-derive IDF and job vectors.
+        # This restacks and re-weights all stored counts, so its cost grows with the corpus,
+        # not the change; add_jobs/remove_jobs batch changes into one refresh on the next read
+        if not self._dirty:
+            return
+        keep = [row for row in range(len(self._jobs)) if row not in self._dead]
+        self._jobs = [self._jobs[row] for row in keep]
+        self._job_descriptions = None
+        self._rows = {key: row for row, job in enumerate(self._jobs) for key in self._job_keys(job)}
+        self._job_vectors = self._build_vectors(keep)
+        if self.compact:
+            if sp.issparse(self._job_vectors):
+                self._job_vectors = _compact_csr(self._job_vectors)
+            self._jobs = [_compact_job(job) if "description" in job else job for job in self._jobs]
+        self._filter_index = None
+        self._inverted = None
+        self._close_scorer()
+        self._dead = set()
+        self._dirty = False
+        self.generation += 1
+        if self.match_cache is not None:
+            self.match_cache.clear()
+
+    def _build_vectors(self, keep):
+        # Job vectors for the compacted rows; `keep` maps each new row to its row before compaction
+        if self.hashed:
+            counts = sp.vstack(self._count_blocks, format="csr") if self._count_blocks else sp.csr_matrix((0, self.n_features))
+            if self._dead:
+                counts = counts[keep]
+            self._count_blocks = [counts]
+            self._block_starts = [0]
+            n_jobs = len(self._jobs)
+            self._idf = np.where(self._df > 0, np.log((1 + n_jobs) / (1 + self._df)) + 1, 0.0)
+            if self.compact:
+                self._idf = self._idf.astype(np.float32)
+            return self._bm25(counts) if self.scoring == "bm25" else self._weight(counts)
+        if self._jobs:
+            self.vectorizer = TfidfVectorizer(stop_words='english')
+            descriptions = [job["description"] for job in self._jobs]
+            if self.scoring == "tfidf":
+                return self.vectorizer.fit_transform(descriptions)
+            # BM25 needs raw counts; the TF-IDF vectorizer is assembled from the same fit,
+            # as load() does, to vectorize resumes against this vocabulary
+            counter = CountVectorizer(stop_words='english')
+            counts = counter.fit_transform(descriptions)
+            self.vectorizer.vocabulary_ = counter.vocabulary_
+            self.vectorizer.idf_ = TfidfTransformer().fit(counts).idf_
+            return self._bm25(counts)
+        self.vectorizer = None
+        return None
+
+    def memory_report(self):
+        """Approximate bytes held per structure, plus their "total".
+
+        Memory-mapped arrays of a loaded index count in full, though their pages are shared
+        between processes and only resident once read.
+        """
+        self._refresh()
+        # Structures that share the job vectors (the inverted index) don't count them again
+        seen = {id(self._job_vectors)}
+        report = {
+            "job_vectors": _nbytes(self._job_vectors),
+            "term_counts": sum(_nbytes(block) for block in self._count_blocks),
+            "idf": _nbytes(self._idf if self.hashed or self.vectorizer is None else self.vectorizer.idf_) + _nbytes(self._df),
+            "vocabulary": _deep_size(getattr(self.vectorizer, "vocabulary_", None), seen),
+            "jobs": _deep_size(self._jobs, seen),
+            "job_descriptions": _deep_size(self._job_descriptions, seen),
+            "row_keys": _deep_size(self._rows, seen),
+            "filter_index": _deep_size(self._filter_index, seen),
+            "inverted_index": _deep_size(self._inverted, seen),
+        }
+        report["total"] = sum(report.values())
+        return report
+
+    def _check_changeable(self):
+        # Refitting the vocabulary needs every job description, which compact indexes drop
+        if self.compact and not self.hashed and len(self._jobs):
+            raise ValueError("Compact job indexes can only be changed with hashed=True; rebuild with preprocess_job_descriptions.")
+
+    def _materialize(self):
+        # Jobs of a loaded index are decoded on access; changing the index needs them in memory
+        if isinstance(self._jobs, _SavedJobs):
+            self._jobs = list(self._jobs)
+            self._job_descriptions = None
+            self._rows = {key: row for row, job in enumerate(self._jobs) for key in self._job_keys(job)}
+
+    def _csr_arrays(self, name, matrix):
+        return {f"{name}_data": matrix.data, f"{name}_indices": matrix.indices, f"{name}_indptr": matrix.indptr}
+
+    def _load_csr(self, path, name, shape, mmap_mode):
+        data, indices, indptr = (
+            np.load(os.path.join(path, f"{name}_{part}.npy"), mmap_mode=mmap_mode)
+            for part in ("data", "indices", "indptr")
+        )
+        return sp.csr_matrix((data, indices, indptr), shape=tuple(shape), copy=False)
+
+    def _replace_file(self, path, name, write):
+        # Write beside the target and rename, so readers mapping the old file keep a valid copy
+        tmp = os.path.join(path, name + ".tmp")
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, os.path.join(path, name))
+
+    def _valid_jobs(self, jobs):
+        return [
+            job for job in jobs
+            if job.get("description") and len(job["description"].strip()) > 20
+        ]
+
+    def _job_keys(self, job):
+        return [job[field] for field in ("job_id", "url") if job.get(field)]
+
+    def _unique_jobs(self, jobs):
+        # The last job with a given key wins
+        seen = set()
+        unique = []
+        for job in reversed(jobs):
+            keys = self._job_keys(job)
+            if not seen.intersection(keys):
+                unique.append(job)
+            seen.update(keys)
+        unique.reverse()
+        return unique
 
     def _create_resume_text(self, resume_data):
         resume_text = ""
@@ -65,3 +540,144 @@ class JobMatcher:
             resume_text += edu.get("school", "") + " "
 
         return resume_text.strip()
+
+
+def _compact_csr(matrix, dtype=np.float32):
+    # float32 values (uint16 for term counts) and int32 indices: 6-8 bytes per stored term
+    # instead of 12-16
+    matrix = matrix.tocsr()
+    data = matrix.data
+    if np.issubdtype(dtype, np.integer):
+        data = np.minimum(data, np.iinfo(dtype).max)
+    index_dtype = np.int32 if matrix.nnz < 2 ** 31 else np.int64
+    return sp.csr_matrix(
+        (data.astype(dtype), matrix.indices.astype(index_dtype), matrix.indptr.astype(index_dtype)),
+        shape=matrix.shape,
+    )
+
+
+def _compact_job(job):
+    # A job without its description; repeated metadata strings share one interned copy
+    return {
+        field: sys.intern(value) if isinstance(value, str) and field in ("company", "location", "category") else value
+        for field, value in job.items() if field != "description"
+    }
+
+
+def _nbytes(value):
+    if value is None:
+        return 0
+    if sp.issparse(value):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    return getattr(value, "nbytes", None) or len(value)
+
+
+def _deep_size(value, seen):
+    # Size of a container and everything it references, counting shared objects once
+    if value is None or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.ndarray) or sp.issparse(value):
+        return _nbytes(value)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_deep_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _deep_size(vars(value), seen)
+    return size
+
+
+def _filters_key(filters):
+    if not filters:
+        return None
+    return tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items()))
+
+
+def _result_size(matches):
+    # The result list and its matches; the job fields they point to belong to the index
+    return sys.getsizeof(matches) + sum(sys.getsizeof(match) + 24 for match in matches)
+
+
+class PartialMatches(list):
+    """A match list that isn't the full ranking (e.g. a re-rank cut short by its latency
+    budget), so it's returned but never cached."""
+
+
+def _dense(scores):
+    return scores.toarray() if sp.issparse(scores) else np.asarray(scores)
+
+
+def top_k_indices(scores, k):
+    """Indices of the k highest scores, best first, in the order a stable full sort would give."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > kth)
+        # Jobs tied with the k-th score are kept in index order, as sort() would
+        selected = np.concatenate([above, np.flatnonzero(scores == kth)[:k - len(above)]])
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+class JobMatch(Mapping):
+    """A ranked job: its row in the index and its score. The job's own fields are looked up
+    on first access, so ranking k jobs never copies the rest."""
+    __slots__ = ("index", "score", "_jobs", "_job")
+
+    def __init__(self, index, score, jobs):
+        self.index = int(index)
+        self.score = float(score)
+        self._jobs = jobs
+        self._job = None
+
+    @property
+    def job(self):
+        if self._job is None:
+            self._job = self._jobs[self.index]
+        return self._job
+
+    def __getitem__(self, key):
+        if key == "similarity":
+            return self.score
+        return self.job[key]
+
+    def __iter__(self):
+        yield from (key for key in self.job if key != "similarity")
+        yield "similarity"
+
+    def __len__(self):
+        return len(self.job) + ("similarity" not in self.job)
+
+    def __repr__(self):
+        return f"JobMatch(index={self.index}, score={self.score:.4f})"
+
+
+class _SavedJobs:
+    # Read-only list of the jobs in a saved index, decoded from jobs.jsonl one at a time
+    def __init__(self, path, mmap_mode):
+        self._offsets = np.load(os.path.join(path, "jobs_offsets.npy"), mmap_mode=mmap_mode)
+        if mmap_mode:
+            self._data = np.memmap(os.path.join(path, "jobs.jsonl"), dtype=np.uint8, mode="r") if self._offsets[-1] else b""
+        else:
+            with open(os.path.join(path, "jobs.jsonl"), "rb") as f:
+                self._data = f.read()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("job index out of range")
+        return json.loads(bytes(self._data[self._offsets[i]:self._offsets[i + 1]]))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
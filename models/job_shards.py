@@ -0,0 +1,81 @@
+# models/job_shards.py
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import scipy.sparse as sp
+from models.job_matcher import _dense, top_k_indices
+
+# Shards inherited by forked scoring processes, by scorer token (see ShardedScorer)
+_worker_shards = {}
+_tokens = itertools.count()
+
+
+def _score_shard(shards, shard, query, k):
+    # Local top-k of one shard, as global (row, score) pairs in full-sort order
+    start, vectors = (shards if isinstance(shards, list) else _worker_shards[shards])[shard]
+    scores = vectors @ _dense(query).ravel()
+    top = top_k_indices(scores, k)
+    return top + start, scores[top]
+
+
+class ShardedScorer:
+    """Top-k search over a job matrix split into row shards that are scored in parallel.
+
+    Every shard returns its own top k, and the merged candidates are ordered exactly like a
+    full sort over the whole matrix (score, then row). With executor="thread" the shards are
+    scored on a thread pool: scipy's sparse products and numpy's BLAS release the GIL, so
+    this scales across cores without copying anything. executor="process" scores them in
+    forked processes that inherit the shards instead, for builds where they don't.
+    """
+
+    EXECUTORS = ("thread", "process")
+
+    def __init__(self, vectors, n_shards, executor="thread"):
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown shard executor: {executor}. Expected one of: {', '.join(self.EXECUTORS)}.")
+        self.n_rows = vectors.shape[0]
+        self.n_shards = max(1, min(n_shards, self.n_rows))
+        self.executor = executor
+
+        bounds = np.linspace(0, self.n_rows, self.n_shards + 1).astype(np.intp)
+        self.shards = [(start, self._slice(vectors, start, stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        if executor == "thread":
+            self._shards = self.shards
+            self._pool = ThreadPoolExecutor(max_workers=self.n_shards)
+        else:
+            # Workers fork on the first search and find the shards here, so only the
+            # query and the k results per shard are ever pickled
+            self._shards = next(_tokens)
+            _worker_shards[self._shards] = self.shards
+            self._pool = ProcessPoolExecutor(max_workers=self.n_shards, mp_context=multiprocessing.get_context("fork"))
+
+    def search(self, query, k):
+        """(rows, scores) of the k best rows for one query row vector, best first."""
+        if self.executor == "thread":
+            # A dense query turns each shard's product into a plain matrix-vector product;
+            # processes get the small sparse one and densify it themselves
+            query = _dense(query).ravel()
+        futures = [self._pool.submit(_score_shard, self._shards, shard, query, k) for shard in range(self.n_shards)]
+        results = [future.result() for future in futures]
+        rows = np.concatenate([rows for rows, _ in results])
+        scores = np.concatenate([scores for _, scores in results])
+        order = np.lexsort((rows, -scores))[:k]
+        return rows[order], scores[order]
+
+    def close(self):
+        self._pool.shutdown()
+        if self.executor == "process":
+            _worker_shards.pop(self._shards, None)
+
+    def _slice(self, vectors, start, stop):
+        if not sp.issparse(vectors):
+            return vectors[start:stop]
+        # A CSR row range that shares data/indices with the full matrix instead of copying them
+        vectors = vectors.tocsr()
+        indptr = vectors.indptr[start:stop + 1]
+        return sp.csr_matrix(
+            (vectors.data[indptr[0]:indptr[-1]], vectors.indices[indptr[0]:indptr[-1]], indptr - indptr[0]),
+            shape=(stop - start, vectors.shape[1]),
+        )
@@ -0,0 +1,127 @@
+# models/match_batcher.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from models.job_matcher import PartialMatches, _result_size
+
+# A worker thread with nothing to do for this long exits (and a new one starts with the
+# next request), so a batcher whose matcher was replaced doesn't keep it alive
+_IDLE_SECONDS = 1.0
+
+
+class MatchBatcher:
+    """Coalesce concurrent top-k match_resume calls into batched matrix products.
+
+    Callers on any thread submit a resume and get a Future (or wait in match_resume). A
+    worker thread takes the first waiting request, keeps gathering for up to `window`
+    seconds or until `max_batch` requests are in, then vectorizes the batch in one
+    transform and scores it against the jobs in one sparse matrix product per `chunk_size`
+    jobs (the JobMatcher.match_many path), and hands each caller its own top_k. Results
+    are the same JobMatch lists match_resume returns and go through the matcher's match
+    cache; requests with filters are matched one by one on the worker thread.
+    """
+
+    def __init__(self, matcher, window=0.005, max_batch=32, chunk_size=65536):
+        if window < 0 or max_batch < 1:
+            raise ValueError("MatchBatcher needs a window >= 0 and a max_batch >= 1.")
+        self.matcher = matcher
+        self.window = window
+        self.max_batch = max_batch
+        self.chunk_size = chunk_size
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self.requests = 0
+        self.batches = 0
+
+    def submit(self, resume_data, top_k=20, filters=None):
+        if top_k is None:
+            raise ValueError("MatchBatcher only serves top_k matches.")
+        future = Future()
+        with self._lock:
+            self._requests.put((resume_data, top_k, filters, future))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="match-batcher", daemon=True)
+                self._worker.start()
+        return future
+
+    def match_resume(self, resume_data, top_k=20, filters=None):
+        return self.submit(resume_data, top_k, filters).result()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+        }
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._requests.get(timeout=_IDLE_SECONDS)]
+            except queue.Empty:
+                with self._lock:
+                    # submit() holds the lock while queueing, so nothing slips in unserved
+                    if self._requests.empty():
+                        self._worker = None
+                        return
+                continue
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._requests.get(timeout=max(deadline - time.monotonic(), 0)) if self.window
+                                 else self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            self._serve(batch)
+
+    def _serve(self, batch):
+        matcher = self.matcher
+        pending = []
+        for resume_data, top_k, filters, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if filters:
+                    future.set_result(matcher.match_resume(resume_data, top_k, filters))
+                    continue
+                text = matcher._create_resume_text(resume_data)
+                if not text.strip():
+                    raise ValueError("Resume text is empty.")
+                if matcher.job_vectors is None or matcher.job_vectors.shape[0] == 0:
+                    raise ValueError("No job vectors available for similarity comparison.")
+                key = matcher._cache_key(text, top_k, None) if matcher.match_cache is not None else None
+                matches = matcher.match_cache.get(key) if key is not None else None
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            if matches is not None:
+                future.set_result(list(matches))
+            else:
+                pending.append((text, top_k, key, future))
+
+        self.requests += len(batch)
+        self.batches += 1
+        if not pending:
+            return
+        try:
+            if len(pending) == 1:
+                # A lone request is faster on the single-resume path (top-k search, sharding, postings)
+                text, top_k, _, _ = pending[0]
+                results = [matcher._match(text, top_k, None)]
+            else:
+                # One product at the largest k; top-k lists are in full-sort order, so each
+                # caller's k best are a prefix of it
+                results = list(matcher._match_batch([text for text, _, _, _ in pending],
+                                                    max(top_k for _, top_k, _, _ in pending), self.chunk_size))
+        except Exception as e:
+            for _, _, _, future in pending:
+                future.set_exception(e)
+            return
+        for (_, top_k, key, future), matches in zip(pending, results):
+            partial = isinstance(matches, PartialMatches)
+            matches = matches[:top_k]
+            if key is not None and not partial:
+                matcher.match_cache.set(key, matches, _result_size(matches))
+            future.set_result(list(matches))
@@ -0,0 +1,67 @@
+# models/match_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class MatchCache:
+    """Size-bounded in-memory LRU cache for match results.
+
+    Keys are built by the matcher from its index generation and a hash of the resume text
+    (see key_for), so results computed before the jobs changed are never served; the
+    matcher also clears the cache when its generation moves on. Each entry is stored with
+    its approximate size in bytes and least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size), least recently used first
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes and self._entries:
+                _, (_, oldest_size) = self._entries.popitem(last=False)
+                self._size -= oldest_size
+                self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,92 @@
+# models/model_registry.py
+import threading
+import warnings
+import nltk
+import spacy
+
+DEFAULT_MODEL = "en_core_web_md"
+
+# Components excluded from each pipeline profile. Excluded components are never
+# loaded, so a profile only pays for the work its tasks actually use.
+PIPELINE_PROFILES = {
+    "tokenize": ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"],
+    "tagging": ["parser", "senter", "ner"],
+    "full": [],
+}
+
+# Profile used for each extraction task. Skill matching and keyword/vector
+# similarity only read token text, lexical attributes and static vectors.
+TASK_PROFILES = {
+    "skills": "tokenize",
+    "keywords": "tokenize",
+    "similarity": "tokenize",
+    "lemmas": "tagging",
+    "entities": "full",
+}
+
+# NLTK resources the parsers rely on, mapped to their nltk.data lookup paths
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt",
+}
+
+_models = {}
+_lock = threading.Lock()
+_missing_nltk = None
+
+
+def get_nlp(name=DEFAULT_MODEL, profile="full"):
+    """Return the process-wide spaCy pipeline for `name` and `profile`, loading it on first use."""
+    key = (name, profile)
+    nlp = _models.get(key)
+    if nlp is None:
+        if profile not in PIPELINE_PROFILES:
+            raise ValueError(f"Unknown pipeline profile: {profile}")
+        with _lock:
+            nlp = _models.get(key)
+            if nlp is None:
+                nlp = spacy.load(name, exclude=PIPELINE_PROFILES[profile])
+                _models[key] = nlp
+    return nlp
+
+
+def get_task_nlp(task, name=DEFAULT_MODEL):
+    """Return the pipeline profile registered for an extraction task."""
+    return get_nlp(name, TASK_PROFILES[task])
+
+
+def ensure_nltk_data():
+    """Check that the NLTK resources are installed locally, without touching the network.
+
+    Returns the list of missing resource names; a warning is emitted once per process
+    if anything is missing.
+    """
+    global _missing_nltk
+    if _missing_nltk is None:
+        missing = []
+        for resource, path in NLTK_RESOURCES.items():
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                missing.append(resource)
+        if missing:
+            warnings.warn(
+                f"NLTK data not found: {', '.join(missing)}. "
+                f"Install it once with nltk.download() (see README).",
+                RuntimeWarning,
+            )
+        _missing_nltk = missing
+    return list(_missing_nltk)
+
+
+def warm_up(names=(DEFAULT_MODEL,), profiles=("tokenize",)):
+    """Load the given pipelines and check NLTK data ahead of the first request."""
+    ensure_nltk_data()
+    for name in names:
+        for profile in profiles:
+            get_nlp(name, profile)
+
+
+def loaded_models():
+    """(name, profile) pairs of the pipelines currently loaded in this process."""
+    return list(_models)
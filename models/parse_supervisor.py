@@ -0,0 +1,244 @@
+# models/parse_supervisor.py
+import os
+import copy
+import time
+import threading
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Parser inherited by forked workers (see ParseSupervisor._spawn)
+_worker_parser = None
+
+
+def _worker_main(conn, max_rss):
+    if max_rss and resource is not None and not os.path.exists(f"/proc/{os.getpid()}/statm"):
+        # No /proc to watch RSS from the parent; cap the address space instead (peak RSS
+        # at fork stands in for the inherited address space, so this is approximate)
+        limit = max_rss + resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            payload = conn.recv()
+        except EOFError:
+            return
+        try:
+            if isinstance(payload, (str, os.PathLike)):
+                with open(payload, "rb") as file:
+                    data = _worker_parser.parse(file)
+            else:
+                data = _worker_parser.parse(payload)
+            conn.send(("ok", data, None))
+        except MemoryError:
+            conn.send(("oom", None, "MemoryError: resume exceeded the worker memory limit"))
+        except Exception as e:
+            conn.send(("error", None, f"{type(e).__name__}: {e}"))
+
+
+def _rss(pid):
+    """Resident set size of a process in bytes (0 where /proc is unavailable)."""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        # (run, index, file, started, cache_key); run identifies the parse_many call and
+        # cache_key is the (key, fingerprint) the result goes in the parser's cache under
+        self.job = None
+        self.baseline_rss = _rss(process.pid)
+
+
+class ParseSupervisor:
+    """Run ResumeParser.parse in forked worker processes with per-document time and memory limits.
+
+    A worker that runs past `timeout` seconds or grows more than `max_rss` bytes past its
+    size at fork is killed and replaced, and the document gets a "timeout"/"oom" result
+    instead of stalling or exhausting the server.
+
+    One supervisor can serve several threads at once: each parse_many call only reads
+    replies from the workers it submitted to, and the pool is changed under a lock.
+
+    The parser's ResumeCache is used here, not in the workers: results are looked up and
+    stored by the supervisor, keyed on the document bytes, so the whole pool shares one
+    cache and one size bound. Only the "result" tier is filled this way.
+    """
+
+    def __init__(self, parser, workers=1, timeout=30.0, max_rss=1024 * 1024 * 1024, poll_interval=0.05):
+        self.parser = parser
+        self.workers = workers
+        self.timeout = timeout
+        self.max_rss = max_rss
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context("fork")
+        self._pool = []
+        self._worker_parser = None
+        # Guards the pool and worker jobs; notified whenever a worker becomes free
+        self._lock = threading.Condition()
+        self.respawns = 0
+
+    def parse(self, data):
+        """Parse one resume (bytes, buffer, binary file or path) and return its result dict."""
+        return next(self.parse_many([data]))
+
+    def parse_many(self, files):
+        """Yield one {"file", "status", "data", "error", "seconds"} dict per input, in input order.
+
+        Status is "ok", "error", "timeout" or "oom".
+        """
+        run = object()
+        queue = deque(enumerate(files))
+        done = {}
+        next_index = 0
+        try:
+            while True:
+                with self._lock:
+                    self._start()
+                    for worker in self._pool:
+                        while worker.job is None and queue:
+                            index, file = queue.popleft()
+                            self._submit(worker, run, index, file, done)
+                    busy = [worker for worker in self._pool if worker.job and worker.job[0] is run]
+                    if not busy and queue and next_index not in done:
+                        # Every worker is busy with another caller's documents
+                        self._lock.wait(self.poll_interval)
+                        continue
+                if not busy and not queue and next_index not in done:
+                    break
+
+                # Only this run reads from its workers' pipes, so waiting needs no lock
+                ready = wait([worker.conn for worker in busy], timeout=self.poll_interval) if busy else []
+                with self._lock:
+                    for worker in busy:
+                        if worker.conn in ready:
+                            self._receive(worker, done)
+                        else:
+                            self._check_limits(worker, done)
+                    if any(worker.job is None for worker in self._pool):
+                        self._lock.notify_all()
+
+                while next_index in done:
+                    yield done.pop(next_index)
+                    next_index += 1
+        finally:
+            # A caller that stops early must not get these documents' results next time
+            with self._lock:
+                for worker in list(self._pool):
+                    if worker.job and worker.job[0] is run:
+                        self._kill(worker)
+                self._lock.notify_all()
+
+    def close(self):
+        with self._lock:
+            for worker in self._pool:
+                worker.conn.close()
+                worker.process.join(1)
+                if worker.process.is_alive():
+                    worker.process.kill()
+                    worker.process.join()
+            self._pool = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _start(self):
+        if not self._pool:
+            # Load models first so every worker inherits them instead of loading its own
+            self.parser.skill_nlp
+            self.parser.skill_matcher
+            # Workers parse without the cache; parse_many checks and fills it
+            self._worker_parser = copy.copy(self.parser)
+            self._worker_parser.cache = None
+            self._pool = [self._spawn() for _ in range(self.workers)]
+
+    def _spawn(self):
+        global _worker_parser
+        _worker_parser = self._worker_parser
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn, self.max_rss), daemon=True)
+        process.start()
+        child_conn.close()
+        return _Worker(process, conn)
+
+    def _submit(self, worker, run, index, file, done):
+        try:
+            payload = self.parser._pool_payload(file)
+            payload, cache_key, data = self._cached(payload)
+        except Exception as e:
+            done[index] = self._result(file, "error", None, f"{type(e).__name__}: {e}", 0.0)
+            return
+        if data is not None:
+            done[index] = self._result(file, "ok", data, None, 0.0)
+            return
+        worker.job = (run, index, file, time.monotonic(), cache_key)
+        worker.conn.send(payload)
+
+    def _cached(self, payload):
+        # Returns the payload to send (a path is read here to key it), its cache key and
+        # the cached result, if any
+        cache = self.parser.cache
+        if cache is None:
+            return payload, None, None
+        max_bytes = self.parser.max_bytes
+        if isinstance(payload, (str, os.PathLike)):
+            with open(payload, "rb") as file:
+                payload = file.read(max_bytes + 1) if max_bytes else file.read()
+        if max_bytes and len(payload) > max_bytes:
+            # Not cached; the worker reports the size error
+            return payload, None, None
+        cache_key = (cache.key_for(payload), self.parser.fingerprint)
+        return payload, cache_key, cache.get_result(*cache_key)
+
+    def _receive(self, worker, done):
+        _, index, file, started, cache_key = worker.job
+        try:
+            status, data, error = worker.conn.recv()
+        except (EOFError, OSError):
+            # Died without answering (segfault, kernel OOM killer, ...)
+            self._kill(worker)
+            status, data, error = "error", None, f"Worker exited with code {worker.process.exitcode}"
+        if status == "oom":
+            # A worker that hit its address-space cap may be left in a bad state
+            self._kill(worker)
+        worker.job = None
+        if status == "ok" and cache_key is not None:
+            self.parser.cache.set_result(*cache_key, data)
+        done[index] = self._result(file, status, data, error, time.monotonic() - started)
+
+    def _check_limits(self, worker, done):
+        _, index, file, started, _ = worker.job
+        elapsed = time.monotonic() - started
+        if self.timeout and elapsed > self.timeout:
+            status, error = "timeout", f"Parsing took longer than {self.timeout:g} seconds"
+        elif self.max_rss and _rss(worker.process.pid) - worker.baseline_rss > self.max_rss:
+            status, error = "oom", f"Parsing used more than {self.max_rss:,} bytes of memory"
+        else:
+            return
+        self._kill(worker)
+        done[index] = self._result(file, status, None, error, elapsed)
+
+    def _kill(self, worker):
+        # Kill a worker and put a freshly forked one in its place
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        worker.job = None
+        self._pool[self._pool.index(worker)] = self._spawn()
+        self.respawns += 1
+
+    def _result(self, file, status, data, error, seconds):
+        return {"file": file, "status": status, "data": data, "error": error, "seconds": seconds}
@@ -0,0 +1,168 @@
+# models/pdf_backends.py
+import io
+import PyPDF2
+from pdfminer3.layout import LAParams, LTChar, LTContainer
+from pdfminer3.pdfpage import PDFPage
+from pdfminer3.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer3.converter import TextConverter
+
+# Output below this many word characters is treated as empty (e.g. a scanned resume)
+MIN_WORD_CHARS = 20
+# Share of non-space characters that may be undecodable/control glyphs before output counts as garbled
+MAX_SUSPECT_RATIO = 0.1
+# Longer average "words" mean the backend lost the spaces between them
+MAX_AVG_WORD_LENGTH = 25
+
+
+class PdfBackend:
+    """Text extraction for one PDF, page by page. Subclasses set `name` and implement iter_pages."""
+    name = None
+
+    def iter_pages(self, file, max_pages=0):
+        raise NotImplementedError
+
+
+class PdfminerBackend(PdfBackend):
+    """pdfminer3, with full LAParams layout analysis or a cheap line-break pass over raw characters."""
+
+    def __init__(self, layout=True):
+        self.layout = layout
+        self.name = "pdfminer3-layout" if layout else "pdfminer3-lines"
+
+    def iter_pages(self, file, max_pages=0):
+        resource_manager = PDFResourceManager()
+        page_buffer = io.StringIO()
+        if self.layout:
+            converter = TextConverter(resource_manager, page_buffer, laparams=LAParams())
+        else:
+            converter = _LineTextConverter(resource_manager, page_buffer)
+        interpreter = PDFPageInterpreter(resource_manager, converter)
+
+        try:
+            for page in PDFPage.get_pages(file, maxpages=max_pages, check_extractable=True):
+                interpreter.process_page(page)
+                text = page_buffer.getvalue()
+                page_buffer.seek(0)
+                page_buffer.truncate()
+                yield text
+        finally:
+            converter.close()
+            page_buffer.close()
+
+
+class _LineTextConverter(TextConverter):
+    # Without LAParams pdfminer emits characters in content-stream order with no line
+    # breaks; break lines wherever the baseline moves instead of grouping text boxes
+    def receive_layout(self, ltpage):
+        parts = []
+        previous = None
+        stack = [iter(ltpage)]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+            elif isinstance(item, LTChar):
+                if previous is not None:
+                    if abs(item.y0 - previous.y0) > previous.height / 2:
+                        parts.append("\n")
+                    elif item.x0 - previous.x1 > previous.width / 2 and parts[-1] != " ":
+                        parts.append(" ")
+                parts.append(item.get_text())
+                previous = item
+            elif isinstance(item, LTContainer):
+                stack.append(iter(item))
+        parts.append("\n\f")
+        self.write_text("".join(parts))
+
+
+class PyPDF2Backend(PdfBackend):
+    """PyPDF2's content-stream text extraction: no layout model, but roughly twice as fast as pdfminer."""
+    name = "pypdf2"
+
+    def iter_pages(self, file, max_pages=0):
+        reader = PyPDF2.PdfReader(file)
+        if reader.is_encrypted:
+            # Same policy as pdfminer's check_extractable: only open PDFs with an empty user password
+            reader.decrypt("")
+        pages = reader.pages if not max_pages else reader.pages[:max_pages]
+        for page in pages:
+            yield (page.extract_text() or "") + "\n\f"
+
+
+class AutoBackend(PdfBackend):
+    """Try backends cheapest first, falling back while the output is empty, garbled or an error.
+
+    A backend is judged on its first pages: it is read only until its text so far is
+    usable, and from then on its remaining pages are streamed as the caller asks for them
+    (so a caller's page or character budget still stops extraction early). An error after
+    that point is raised rather than falling back, since pages were already handed out.
+    """
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+        self.name = "auto(" + ",".join(backend.name for backend in self.backends) + ")"
+        self.chosen = {}
+
+    def iter_pages(self, file, max_pages=0):
+        start = file.tell()
+        result, error = None, None
+        for backend in self.backends:
+            file.seek(start)
+            pages = backend.iter_pages(file, max_pages)
+            read = []
+            try:
+                for text in pages:
+                    read.append(text)
+                    if is_usable("".join(read)):
+                        break
+                else:
+                    # Unusable output is kept in case no later backend does better
+                    result = (backend.name, read)
+                    continue
+            except Exception as e:
+                pages.close()
+                error = e
+                continue
+            self.chosen[backend.name] = self.chosen.get(backend.name, 0) + 1
+            try:
+                yield from read
+                yield from pages
+            finally:
+                pages.close()
+            return
+        if result is None:
+            raise error
+        name, read = result
+        self.chosen[name] = self.chosen.get(name, 0) + 1
+        yield from read
+
+
+def is_usable(text):
+    """False for extraction output that is empty or too garbled to parse."""
+    chars = [c for c in text if not c.isspace()]
+    word_chars = sum(c.isalnum() for c in chars)
+    if word_chars < MIN_WORD_CHARS:
+        return False
+    # (cid:N) glyphs come from fonts without a unicode map; U+FFFD and controls from bad decoding
+    suspect = text.count("(cid:") * 6 + sum(c == "\ufffd" or ord(c) < 32 for c in chars)
+    if suspect > MAX_SUSPECT_RATIO * len(chars):
+        return False
+    return len(chars) / max(len(text.split()), 1) <= MAX_AVG_WORD_LENGTH
+
+
+PDF_BACKENDS = {
+    "pdfminer-layout": lambda: PdfminerBackend(layout=True),
+    "pdfminer-lines": lambda: PdfminerBackend(layout=False),
+    "pypdf2": PyPDF2Backend,
+    # Cheapest first; the layout pass is the last resort for output the others mangle
+    "auto": lambda: AutoBackend([PyPDF2Backend(), PdfminerBackend(layout=True)]),
+}
+
+
+def get_pdf_backend(name):
+    """A fresh backend by name (see PDF_BACKENDS), or the given PdfBackend instance."""
+    if isinstance(name, PdfBackend):
+        return name
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{name}'. Expected one of: {', '.join(PDF_BACKENDS)}.")
+    return PDF_BACKENDS[name]()
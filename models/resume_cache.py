@@ -0,0 +1,130 @@
+# models/resume_cache.py
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class ResumeCache:
+    """Size-bounded on-disk cache for parsed resumes, keyed by a hash of the file bytes.
+
+    Tier "text" holds the extracted text and tier "result" the parsed dict. Each entry is
+    stored under a fingerprint of whatever produced it, so changing the parser only
+    invalidates the tiers it affects. Least recently used entries are evicted first.
+    """
+
+    TIERS = ("text", "result")
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # path -> size, least recently used first
+        self._size = 0
+        self.hits = {tier: 0 for tier in self.TIERS}
+        self.misses = {tier: 0 for tier in self.TIERS}
+        self.evictions = 0
+        self._load_index()
+
+    @staticmethod
+    def key_for(data):
+        return hashlib.sha256(data).hexdigest()
+
+    def get_text(self, key, fingerprint):
+        data = self._get("text", key, fingerprint)
+        return data.decode("utf-8") if data is not None else None
+
+    def set_text(self, key, fingerprint, text):
+        self._set("text", key, fingerprint, text.encode("utf-8"))
+
+    def get_result(self, key, fingerprint):
+        data = self._get("result", key, fingerprint)
+        return json.loads(data) if data is not None else None
+
+    def set_result(self, key, fingerprint, result):
+        self._set("result", key, fingerprint, json.dumps(result).encode("utf-8"))
+
+    def stats(self):
+        return {
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+    def clear(self):
+        with self._lock:
+            for path in list(self._entries):
+                self._remove(path)
+
+    def _path(self, tier, key, fingerprint):
+        return os.path.join(self.directory, tier, fingerprint, key[:2], key)
+
+    def _get(self, tier, key, fingerprint):
+        path = self._path(tier, key, fingerprint)
+        with self._lock:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                self._size -= self._entries.pop(path, 0)
+                self.misses[tier] += 1
+                return None
+            self.hits[tier] += 1
+            if path not in self._entries:
+                # Written by another process sharing the directory
+                self._entries[path] = len(data)
+                self._size += len(data)
+            self._entries.move_to_end(path)
+            try:
+                os.utime(path)  # keeps LRU order across restarts
+            except OSError:
+                pass
+            return data
+
+    def _set(self, tier, key, fingerprint, data):
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(tier, key, fingerprint)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._size -= self._entries.pop(path, 0)
+            self._entries[path] = len(data)
+            self._size += len(data)
+            while self._size > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, path):
+        self._size -= self._entries.pop(path, 0)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load_index(self):
+        found = []
+        for tier in self.TIERS:
+            for root, _, files in os.walk(os.path.join(self.directory, tier)):
+                for name in files:
+                    path = os.path.join(root, name)
+                    if name.endswith(".tmp"):
+                        continue
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    found.append((st.st_mtime, path, st.st_size))
+        for _, path, size in sorted(found):
+            self._entries[path] = size
+            self._size += size
+        while self._size > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
@@ -1,18 +1,55 @@
 import io
+import os
 import re
-import nltk
+import json
+import hashlib
+import itertools
+import multiprocessing
+import zipfile
+import docx
 import spacy
-from collections import defaultdict
-from pdfminer3.layout import LAParams
-from pdfminer3.pdfpage import PDFPage
-from pdfminer3.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer3.converter import TextConverter
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from models.model_registry import DEFAULT_MODEL, ensure_nltk_data, get_nlp, get_task_nlp
+from models.pdf_backends import get_pdf_backend
+from models.resume_sections import HEADER_RE, SectionIndex
+from models.skill_matcher import SkillMatcher
+
+# Parser inherited by forked extraction workers (see ResumeParser.extract_texts)
+_pool_parser = None
+
+
+def _extract_in_pool(payload):
+    if isinstance(payload, bytes):
+        payload = io.BytesIO(payload)
+    return _pool_parser._read_pdf(payload)
+
 
 class ResumeParser:
-    def __init__(self):
-        nltk.download('stopwords')
-        nltk.download('punkt')
-        self.nlp = spacy.load('en_core_web_md')
+    # Bump when extraction or analysis changes in ways the fingerprints below don't capture
+    PARSER_VERSION = 4
+    PDF_BACKEND = "auto"
+    DOCX_EXTRACTOR = "python-docx-paragraphs-tables"
+
+    # Entry patterns, compiled once; sections come from SectionIndex
+    DATES_RE = re.compile(r' \((?P<dates>[\d\-\u2013 ]+)\)')
+    DEGREE_RE = re.compile(r'Bachelor|Master|PhD|Associate', re.IGNORECASE)
+    SEPARATOR_RE = re.compile(r'[,\n]+')
+    IN_RE = re.compile(r'(?= in )', re.IGNORECASE)  # every " in ", overlapping ones too
+
+    # Ingestion budgets; larger uploads are rejected, longer documents are truncated
+    MAX_BYTES = 5 * 1024 * 1024
+    MAX_PAGES = 20
+    MAX_CHARS = 100_000
+
+    def __init__(self, model_name=DEFAULT_MODEL, cache=None, max_bytes=MAX_BYTES, max_pages=MAX_PAGES, max_chars=MAX_CHARS, pdf_backend=PDF_BACKEND):
+        ensure_nltk_data()
+        self.model_name = model_name
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.pdf_backend = get_pdf_backend(pdf_backend)
 
         # Skills categories (hardcoded instead of loaded from db)
         self.skills_db = {
@@ -25,80 +62,333 @@ class ResumeParser:
         }
 
         self.skill_lookup = {skill.lower(): category for category, skills in self.skills_db.items() for skill in skills}
+        self._skill_matcher = None
+
+    @property
+    def nlp(self):
+        # Shared per process; loaded on first use rather than per instance
+        return get_nlp(self.model_name)
+
+    @property
+    def skill_nlp(self):
+        # Skill matching only reads token text, so skip tagger/parser/NER
+        return get_task_nlp("skills", self.model_name)
+
+    @property
+    def skill_matcher(self):
+        # Compiled once from skill_lookup; matches multi-word skills like "sql server"
+        if self._skill_matcher is None:
+            nlp = self.skill_nlp
+            self._skill_matcher = SkillMatcher.from_skills(
+                self.skill_lookup, lambda skill: [token.lower for token in nlp.make_doc(skill)]
+            )
+        return self._skill_matcher
+
+    @property
+    def text_fingerprint(self):
+        """Identifies the text-extraction settings; keys the cached extracted text."""
+        return self._hash({
+            "version": self.PARSER_VERSION,
+            "extractor": self.pdf_backend.name,
+            "docx_extractor": self.DOCX_EXTRACTOR,
+            "max_pages": self.max_pages,
+            "max_chars": self.max_chars,
+        })
+
+    @property
+    def fingerprint(self):
+        """Identifies everything that shapes a parse result; keys the cached results."""
+        return self._hash({
+            "text": self.text_fingerprint,
+            "skills": self.skills_db,
+            "patterns": [p.pattern for p in (HEADER_RE, self.DATES_RE, self.DEGREE_RE, self.SEPARATOR_RE)],
+            "model": self.model_name,
+            "model_version": spacy.util.get_package_version(self.model_name),
+            "spacy_version": spacy.__version__,
+        })
+
+    def _hash(self, value):
+        return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+    def parse(self, data):
+        """Parse a resume held in memory: bytes, bytearray, memoryview or a binary file object.
+
+        PDF and DOCX are told apart by their leading bytes, not by the file name.
+        """
+        file = self._as_file(data)
+        kind = self._detect_format(file)
+        if kind == "pdf":
+            return self.parse_pdf(file)
+        if kind == "docx":
+            return self.parse_docx(file)
+        raise ValueError("Unsupported resume format. Please upload a PDF or DOCX file.")
 
     def parse_pdf(self, file):
-        text = self._extract_text_from_pdf(file)
-        return self._process_text(text)
+        return self._parse_file(self._as_file(file), self.iter_pdf_text)
+
+    def parse_docx(self, file):
+        return self._parse_file(self._as_file(file), self.iter_docx_text)
+
+    def _parse_file(self, file, iter_text):
+        if self.cache is None:
+            # Sections are indexed chunk by chunk while the rest of the file is still being read
+            sections = SectionIndex()
+            for chunk in iter_text(file):
+                sections.feed(chunk)
+            return self._process_text(sections.text, sections=sections)
+
+        data = file.read(self.max_bytes + 1) if self.max_bytes else file.read()
+        self._check_size(len(data))
+        key = self.cache.key_for(data)
+        fingerprint = self.fingerprint
+        result = self.cache.get_result(key, fingerprint)
+        if result is None:
+            text_fingerprint = self.text_fingerprint
+            text = self.cache.get_text(key, text_fingerprint)
+            if text is None:
+                text = "".join(iter_text(io.BytesIO(data)))
+                self.cache.set_text(key, text_fingerprint, text)
+            result = self._process_text(text)
+            self.cache.set_result(key, fingerprint, result)
+        return result
+
+    def _as_file(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return io.BytesIO(data)
+        return data
+
+    def _detect_format(self, file):
+        position = file.tell()
+        head = file.read(1024)
+        file.seek(position)
+        if b"%PDF-" in head:
+            return "pdf"
+        if head.startswith(b"PK\x03\x04"):
+            try:
+                with zipfile.ZipFile(file) as archive:
+                    if "word/document.xml" in archive.namelist():
+                        return "docx"
+            except zipfile.BadZipFile:
+                pass
+            finally:
+                file.seek(position)
+        return None
+
+    def parse_many(self, files, batch_size=32, n_process=1, extract_workers=0):
+        """Parse many PDF resumes (paths or binary file objects), batching the NLP stage.
+
+        Yields one {"file", "status", "data", "error"} dict per input, in input order.
+        A file that fails yields status "error" instead of aborting the run. With
+        `extract_workers`, PDF text extraction runs on a process pool (see extract_texts).
+        """
+        pending = {}
+        failures = {}
+        if extract_workers:
+            extracted = self.extract_texts(files, workers=extract_workers)
+        else:
+            extracted = self._extract_serial(files)
+
+        def texts():
+            for index, (file, text, error) in enumerate(extracted):
+                if error is not None:
+                    failures[index] = (file, error)
+                    continue
+                # Only the index travels with the text, so contexts stay picklable
+                pending[index] = (file, text)
+                yield text.lower(), index
+
+        docs = self.skill_nlp.pipe(texts(), as_tuples=True, batch_size=batch_size, n_process=n_process)
+        next_index = 0
+        for doc, index in docs:
+            # Failed extractions ahead of this document were recorded before it entered the pipe
+            for failed in range(next_index, index):
+                yield self._error_result(*failures.pop(failed))
+            file, text = pending.pop(index)
+            try:
+                yield {"file": file, "status": "ok", "data": self._process_text(text, doc), "error": None}
+            except Exception as e:
+                yield self._error_result(file, e)
+            next_index = index + 1
+
+        for failed in sorted(failures):
+            yield self._error_result(*failures[failed])
+
+    def extract_texts(self, files, workers=None, max_pending=None):
+        """Extract text from many PDFs on a pool of forked worker processes.
+
+        The skill pipeline is loaded before the pool forks, so workers share the model
+        memory copy-on-write. At most `max_pending` files (default: two per worker) are
+        in flight; the rest are only submitted as the caller consumes results.
+        Yields (file, text, error) tuples in input order.
+        """
+        global _pool_parser
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or 2 * workers
+
+        # Load models first so forked workers inherit them instead of loading their own
+        self.skill_matcher
+        _pool_parser = self
+        in_flight = deque()
+        files = iter(files)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            for file in files:
+                try:
+                    in_flight.append((file, pool.submit(_extract_in_pool, self._pool_payload(file))))
+                except Exception as e:
+                    in_flight.append((file, e))
+                if len(in_flight) >= max_pending:
+                    yield self._collect(*in_flight.popleft())
+            while in_flight:
+                yield self._collect(*in_flight.popleft())
+
+    def _extract_serial(self, files):
+        for file in files:
+            try:
+                yield file, self._read_pdf(file), None
+            except Exception as e:
+                yield file, None, e
+
+    def _pool_payload(self, file):
+        # Paths are cheap to send; open file objects can't be pickled, so send their bytes
+        if isinstance(file, (str, os.PathLike, bytes)):
+            return file
+        if isinstance(file, (bytearray, memoryview)):
+            return bytes(file)
+        return file.read()
+
+    def _collect(self, file, future):
+        if isinstance(future, Exception):
+            return file, None, future
+        try:
+            return file, future.result(), None
+        except Exception as e:
+            return file, None, e
+
+    def _read_pdf(self, file):
+        file = self._as_file(file)
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                return self._extract_text_from_pdf(f)
+        return self._extract_text_from_pdf(file)
+
+    def _error_result(self, file, error):
+        return {"file": file, "status": "error", "data": None, "error": f"{type(error).__name__}: {error}"}
+
+    def iter_pdf_text(self, file):
+        """Yield the text of a PDF page by page, within the parser's byte/page/char budgets.
+
+        Raises ValueError before any parsing if the file is larger than max_bytes; stops
+        early (truncating the last page) once max_pages or max_chars is reached.
+        """
+        self._check_size(self._file_size(file))
+        remaining = self.max_chars
+
+        pages = self.pdf_backend.iter_pages(file, self.max_pages or 0)
+        try:
+            for text in pages:
+                if remaining is not None:
+                    text = text[:remaining]
+                    remaining -= len(text)
+                yield text
+                if remaining is not None and remaining <= 0:
+                    break
+        finally:
+            pages.close()
 
     def _extract_text_from_pdf(self, file):
-        resource_manager = PDFResourceManager()
-        fake_file_handle = io.StringIO()
-        converter = TextConverter(resource_manager, fake_file_handle, laparams=LAParams())
-        interpreter = PDFPageInterpreter(resource_manager, converter)
+        return "".join(self.iter_pdf_text(file))
+
+    def iter_docx_text(self, file):
+        """Yield the paragraph and table text of a DOCX file within the byte/char budgets."""
+        self._check_size(self._file_size(file))
+        document = docx.Document(file)
+        remaining = self.max_chars
 
-        for page in PDFPage.get_pages(file, check_extractable=True):
-            interpreter.process_page(page)
+        lines = (paragraph.text for paragraph in document.paragraphs)
+        table_rows = (
+            " | ".join(cell.text for cell in row.cells)
+            for table in document.tables for row in table.rows
+        )
+        for line in itertools.chain(lines, table_rows):
+            text = line + "\n"
+            if remaining is not None:
+                text = text[:remaining]
+                remaining -= len(text)
+            yield text
+            if remaining is not None and remaining <= 0:
+                break
+
+    def _file_size(self, file):
+        try:
+            position = file.tell()
+            size = file.seek(0, io.SEEK_END) - position
+            file.seek(position)
+            return size
+        except (AttributeError, OSError):
+            return None
 
-        text = fake_file_handle.getvalue()
-        converter.close()
-        fake_file_handle.close()
-        return text
+    def _check_size(self, size):
+        if self.max_bytes and size is not None and size > self.max_bytes:
+            raise ValueError(f"Resume file is larger than the upload limit of {self.max_bytes:,} bytes.")
 
-    def _process_text(self, text):
+    def _process_text(self, text, doc=None, sections=None):
+        sections = sections or SectionIndex(text)
         return {
-            "skills": self._extract_skills(text),
-            "experience": self._extract_experience(text),
-            "education": self._extract_education(text),
+            "skills": self._extract_skills(text, doc),
+            "experience": self._extract_experience(text, sections),
+            "education": self._extract_education(text, sections),
         }
 
-    def _extract_skills(self, text):
-        doc = self.nlp(text.lower())
+    def _extract_skills(self, text, doc=None):
+        if doc is None:
+            doc = self.skill_nlp(text.lower())
         skills_by_category = defaultdict(list)
-        all_skills = []
+        all_skills = self.skill_matcher.find_all(token.lower for token in doc)
 
-        for token in doc:
-            token_text = token.text.strip().lower()
-            if token_text in self.skill_lookup:
-                category = self.skill_lookup[token_text]
-                if token_text not in skills_by_category[category]:
-                    skills_by_category[category].append(token_text)
-                    all_skills.append(token_text)
+        for skill in all_skills:
+            skills_by_category[self.skill_lookup[skill]].append(skill)
 
         return {
             "skills_by_category": dict(skills_by_category),
             "all_skills": all_skills
         }
 
-    def _extract_experience(self, text):
-        exp_section = re.search(r'(Work Experience|Experience|Professional Experience)(.*?)(Education|Projects|Skills|$)', text, re.DOTALL | re.IGNORECASE)
-        exp_text = exp_section.group(2).strip() if exp_section else text
+    def _extract_experience(self, text, sections=None):
+        exp_text = (sections or SectionIndex(text)).span("experience")
+        if exp_text is None:
+            exp_text = text
 
-        exp_entries = re.findall(r'(?P<title>.+?) at (?P<company>.+?) \((?P<dates>[\d\-\u2013 ]+)\)', exp_text)
         exp_data = []
-
-        for match in exp_entries:
-            title, company, dates = match
-            exp_data.append({
-                "title": title.strip(),
-                "company": company.strip(),
-                "dates": dates.strip()
-            })
+        for line in exp_text.split("\n"):
+            for title, company, dates in self._experience_entries(line):
+                exp_data.append({
+                    "title": title.strip(),
+                    "company": company.strip(),
+                    "dates": dates.strip()
+                })
 
         return exp_data
 
-    def _extract_education(self, text):
-        education_section = re.search(r'(Education)(.*?)(Experience|Skills|Projects|$)', text, re.DOTALL | re.IGNORECASE)
-        education_text = education_section.group(2).strip() if education_section else text
+    def _experience_entries(self, line):
+        # Same entries as findall(r'(.+?) at (.+?) \((dates)\)') on one line, without
+        # backtracking: a title runs to the first " at ", its company to the next date group
+        cursor = 0
+        at = line.find(" at ", 1)
+        for match in self.DATES_RE.finditer(line):
+            if at < 0:
+                return
+            if match.start() > at + 4:
+                yield line[cursor:at], line[at + 4:match.start()], match.group("dates")
+                cursor = match.end()
+                at = line.find(" at ", cursor + 1)
 
-        # Improved regex without trailing unescaped "("
-        education_entries = re.findall(
-            r'(?P<degree>Bachelor|Master|PhD|Associate)[^,\n]* in (?P<field>[^,\n]*)[,\n]+(?P<school>[^\n]+)', 
-            education_text, re.IGNORECASE
-        )
+    def _extract_education(self, text, sections=None):
+        education_text = (sections or SectionIndex(text)).span("education")
+        if education_text is None:
+            education_text = text
 
         education_data = []
-        for match in education_entries:
-            degree, field, school = match
+        for degree, field, school in self._education_entries(education_text):
             education_data.append({
                 "degree": degree.strip(),
                 "field": field.strip(),
@@ -107,3 +397,33 @@ class ResumeParser:
 
         return education_data
 
+    def _education_entries(self, text):
+        # Same entries as findall(r'(degree)[^,\n]* in ([^,\n]*)[,\n]+([^\n]+)') in linear
+        # time: within a clause (up to the next comma/newline) the field follows the last
+        # " in ", and the school is the rest of the line after the separators
+        clause_end = last_in = school_start = school_end = -1
+        resume_at = 0
+        for match in self.DEGREE_RE.finditer(text):
+            if match.start() < resume_at:
+                continue
+            if match.end() > clause_end:
+                separator = self.SEPARATOR_RE.search(text, match.end())
+                if separator is None:
+                    return
+                clause_end = separator.start()
+                last_in = -1
+                for found in self.IN_RE.finditer(text, match.end(), clause_end):
+                    last_in = found.start()
+                school_start = separator.end()
+                if school_start == len(text):
+                    # At the very end the regex backtracks into the separators for a school
+                    comma = text.rfind(",", separator.start() + 1)
+                    if comma >= 0:
+                        school_start = comma
+                school_end = text.find("\n", school_start)
+                if school_end < 0:
+                    school_end = len(text)
+            if last_in < match.end() or school_end == school_start:
+                continue
+            yield match.group(), text[last_in + 4:clause_end], text[school_start:school_end]
+            resume_at = school_end
@@ -0,0 +1,85 @@
+# models/resume_sections.py
+import re
+
+# Header keywords and the section each one opens. Alternatives are tried in this
+# order at each position, so "Work Experience" wins over the bare "Experience".
+# Each section becomes a named group, so a match reports its section directly.
+SECTION_HEADERS = {
+    "work experience": "experience",
+    "professional experience": "experience",
+    "experience": "experience",
+    "education": "education",
+    "projects": "projects",
+    "skills": "skills",
+}
+HEADER_RE = re.compile(
+    "|".join(
+        f"(?P<{section}>{'|'.join(re.escape(h) for h, s in SECTION_HEADERS.items() if s == section)})"
+        for section in dict.fromkeys(SECTION_HEADERS.values())
+    ),
+    re.IGNORECASE,
+)
+_LONGEST_HEADER = max(len(h) for h in SECTION_HEADERS)
+
+
+class SectionIndex:
+    """Header-delimited spans of a resume, found in one linear pass over the text.
+
+    Text can be fed in chunks (e.g. page by page while a PDF is still being read);
+    headers are detected as soon as enough text has arrived to rule out a longer one.
+    """
+
+    def __init__(self, text=""):
+        self._chunks = []
+        self._length = 0
+        self._pending = ""
+        self._pending_start = 0
+        self._headers = []
+        if text:
+            self.feed(text)
+
+    @property
+    def headers(self):
+        """(start, end, section) for every header so far, in document order."""
+        return self._headers + self._scan(self._pending, len(self._pending))[0]
+
+    @property
+    def text(self):
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk):
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        self._pending += chunk
+        # Headers starting this close to the end could still grow into a longer one
+        found, consumed = self._scan(self._pending, len(self._pending) - _LONGEST_HEADER)
+        self._headers += found
+        self._pending = self._pending[consumed:]
+        self._pending_start += consumed
+
+    def span(self, section):
+        """Text of the first `section` span (up to the next header of another section), or None."""
+        headers = self.headers
+        for i, (_, end, name) in enumerate(headers):
+            if name != section:
+                continue
+            stop = self._length
+            for start, _, other in headers[i + 1:]:
+                if other != section:
+                    stop = start
+                    break
+            return self.text[end:stop].strip()
+        return None
+
+    def _scan(self, pending, limit):
+        # Headers starting before `limit`, and how much of `pending` is done with
+        found = []
+        consumed = max(limit, 0)
+        for match in HEADER_RE.finditer(pending):
+            if match.start() >= limit:
+                break
+            found.append((self._pending_start + match.start(), self._pending_start + match.end(), match.lastgroup))
+            consumed = max(consumed, match.end())
+        return found, consumed
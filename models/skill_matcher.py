@@ -0,0 +1,75 @@
+# models/skill_matcher.py
+from collections import deque
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over token keys for single- and multi-word skills.
+
+    Phrases are compiled once; `find` then walks a token sequence in a single pass,
+    so the cost per document does not grow with the number of skills. Keys can be any
+    hashable token representation (spaCy `token.lower` hashes, strings, characters).
+    """
+
+    def __init__(self, phrases=()):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._size = 0
+        for keys, value in phrases:
+            self._add(tuple(keys), value)
+        self._build()
+
+    @classmethod
+    def from_skills(cls, skills, tokenize):
+        """Compile skill names, splitting each with `tokenize` (text -> token keys)."""
+        return cls((tokenize(skill), skill) for skill in skills)
+
+    def __len__(self):
+        return self._size
+
+    def find(self, keys):
+        """Yield (start, end, value) for every phrase occurrence, in order of end position."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, key in enumerate(keys):
+            while state and key not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(key, 0)
+            for length, value in out[state]:
+                yield i + 1 - length, i + 1, value
+
+    def find_all(self, keys):
+        """Distinct matched values in order of first occurrence."""
+        return list(dict.fromkeys(value for _, _, value in self.find(keys)))
+
+    def _add(self, keys, value):
+        if not keys:
+            return
+        state = 0
+        for key in keys:
+            nxt = self._goto[state].get(key)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][key] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        if all(v != value for _, v in self._out[state]):
+            self._out[state] += ((len(keys), value),)
+            self._size += 1
+
+    def _build(self):
+        # Breadth-first so every failure target is finished before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for key, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and key not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(key, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Inherit shorter phrases that end here (e.g. "server" inside "sql server")
+                self._out[nxt] += self._out[self._fail[nxt]]
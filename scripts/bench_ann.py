@@ -0,0 +1,65 @@
+# scripts/bench_ann.py
+# Exact top-k search over a normalized float32 job-embedding matrix versus the IVF index at
+# several probe counts: per-query latency and recall@k, on synthetic clustered 300-d vectors
+# (the shape of en_core_web_md document vectors).
+#
+#   python scripts/bench_ann.py [--jobs 100000 1000000] [--probes 1 4 16 64] [--k 20]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.ann_index import IVFIndex
+from models.job_matcher import top_k_indices
+
+
+def synthetic_embeddings(n, dim, clusters, rng):
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)]
+    vectors += 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, nargs="+", default=[100_000, 1_000_000])
+    arg_parser.add_argument("--dim", type=int, default=300)
+    arg_parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 16, 64])
+    arg_parser.add_argument("--k", type=int, default=20)
+    arg_parser.add_argument("--queries", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for n in args.jobs:
+        vectors = synthetic_embeddings(n, args.dim, clusters=max(10, n // 2000), rng=rng)
+        # Queries are perturbed jobs, so they land near real clusters like resumes do
+        queries = vectors[rng.integers(0, n, args.queries)] + 0.2 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        start = time.perf_counter()
+        exact = [top_k_indices(vectors @ query, args.k) for query in queries]
+        exact_ms = (time.perf_counter() - start) / args.queries * 1e3
+
+        start = time.perf_counter()
+        index = IVFIndex(vectors)
+        build = time.perf_counter() - start
+
+        print(f"\n{n} jobs x {args.dim}d ({vectors.nbytes / 1e6:.0f} MB); IVF with {index.n_lists} lists built in {build:.1f}s")
+        print(f"{'search':<12} {'ms/query':>9} {'speedup':>8} {'recall@' + str(args.k):>10}")
+        print(f"{'exact':<12} {exact_ms:>9.2f} {1:>7.1f}x {1:>10.3f}")
+        for n_probe in args.probes:
+            start = time.perf_counter()
+            found = [index.search(query, args.k, n_probe=n_probe)[0] for query in queries]
+            ms = (time.perf_counter() - start) / args.queries * 1e3
+            recall = np.mean([len(set(a) & set(e)) / args.k for a, e in zip(found, exact)])
+            print(f"{'ivf probe ' + str(n_probe):<12} {ms:>9.2f} {exact_ms / ms:>7.1f}x {recall:>10.3f}")
+        del vectors, index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# scripts/bench_career_paths.py
+# CareerPathRecommender path-model cost: building from scratch with the original nested
+# keyword/skill scan versus the compiled pattern table, and following a job refresh that
+# replaces a share of the postings with sync_jobs versus rebuilding. Synthetic postings
+# are built from the words of tests/sample_jobs.json.
+#
+#   python scripts/bench_career_paths.py [--jobs 1000 10000] [--churn 0.05] [--words 150]
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.career_path import COMMON_SKILLS, KEYWORD_CATEGORIES, CareerPathRecommender
+
+
+def nested_scan(jobs):
+    # The extraction CareerPathRecommender used to run on every instantiation
+    path_data = defaultdict(lambda: {"skills": set(), "roles": set(), "description": ""})
+    for job in jobs:
+        desc = job.get("description", "").lower()
+        combined = f"{job.get('title', '').lower()} {desc}"
+        for category, keywords in KEYWORD_CATEGORIES.items():
+            if any(k in combined for k in keywords):
+                path_data[category]["roles"].add(job.get("title", "Unknown Role"))
+                path_data[category]["skills"].update(s for s in COMMON_SKILLS if s in desc)
+    return path_data
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, nargs="+", default=[1000, 10_000])
+    arg_parser.add_argument("--churn", type=float, default=0.05, help="share of postings replaced per refresh")
+    arg_parser.add_argument("--words", type=int, default=150, help="words per synthetic description")
+    args = arg_parser.parse_args()
+
+    with open(os.path.join(ROOT, "tests", "sample_jobs.json")) as f:
+        samples = json.load(f)
+    words = " ".join(job["description"] for job in samples).split()
+    titles = [job["title"] for job in samples]
+    rng = random.Random(0)
+
+    def posting(i):
+        return {"job_id": str(i), "title": rng.choice(titles), "description": " ".join(rng.choices(words, k=args.words))}
+
+    print(f"{'jobs':>7} {'nested ms':>10} {'compiled ms':>12} {'rebuild ms':>11} {'sync ms':>8}")
+    for n in args.jobs:
+        jobs = [posting(i) for i in range(n)]
+        nested = timed(lambda: nested_scan(jobs))
+        recommender = None
+
+        def build():
+            nonlocal recommender
+            recommender = CareerPathRecommender(jobs)
+            recommender.career_paths
+        compiled = timed(build)
+
+        replaced = int(n * args.churn)
+        refreshed = jobs[replaced:] + [posting(n + i) for i in range(replaced)]
+        rebuild = timed(lambda: CareerPathRecommender(refreshed).career_paths)
+        sync = timed(lambda: (recommender.sync_jobs(refreshed), recommender.career_paths))
+        print(f"{n:>7} {nested:>10.1f} {compiled:>12.1f} {rebuild:>11.1f} {sync:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
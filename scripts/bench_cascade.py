@@ -0,0 +1,83 @@
+# scripts/bench_cascade.py
+# Recall and per-stage latency of CascadeMatcher against the exhaustive embedding ranking
+# (EmbeddingMatcher) for a range of candidate counts N. Synthetic postings draw skills from
+# synonym groups; the embedding gives synonyms nearby vectors, TF-IDF treats them as
+# unrelated words, so small N loses jobs that only match through synonyms. Embedding cost
+# per text is simulated with --embed-ms (spaCy's en_core_web_md takes about 1 ms per posting).
+#
+#   python scripts/bench_cascade.py [--jobs 20000] [--n 10 50 100 200 500 1000] [--top-k 10]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.cascade_matcher import CascadeMatcher
+from models.embedding_matcher import EmbeddingMatcher
+
+
+def synthetic_embed(groups, words_per_group, rng):
+    # Each word's vector is its synonym group's vector plus a little noise of its own
+    centers = rng.standard_normal((groups, 64))
+    vectors = {}
+    for group in range(groups):
+        for word in range(words_per_group):
+            vectors[f"skill{group}x{word}"] = centers[group] + 0.3 * rng.standard_normal(64)
+
+    def embed(texts):
+        return [np.mean([vectors[w] for w in text.split() if w in vectors] or [np.zeros(64)], axis=0) for text in texts]
+    return embed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=20_000)
+    arg_parser.add_argument("--n", type=int, nargs="+", default=[10, 50, 100, 200, 500, 1000])
+    arg_parser.add_argument("--top-k", type=int, default=10)
+    arg_parser.add_argument("--queries", type=int, default=20)
+    arg_parser.add_argument("--groups", type=int, default=100, help="synonym groups")
+    arg_parser.add_argument("--synonyms", type=int, default=2, help="words per synonym group")
+    arg_parser.add_argument("--embed-ms", type=float, default=1.0, help="simulated embedding cost per text")
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embed = synthetic_embed(args.groups, args.synonyms, rng)
+
+    def costly_embed(texts):
+        time.sleep(args.embed_ms / 1e3 * len(texts))
+        return embed(texts)
+
+    def skills(n):
+        return [f"skill{g}x{w}" for g, w in zip(rng.integers(0, args.groups, n), rng.integers(0, args.synonyms, n))]
+
+    jobs = [{"job_id": str(i), "description": " ".join(skills(8))} for i in range(args.jobs)]
+    resumes = [{"skills": {"all_skills": skills(6)}} for _ in range(args.queries)]
+
+    # The reference ranking embeds every job (without the simulated cost, to keep the run short)
+    exact = EmbeddingMatcher(embed=embed)
+    exact.preprocess_job_descriptions(jobs)
+    print(f"exhaustive re-rank would embed {args.jobs} jobs: {args.jobs * args.embed_ms / 1e3:.1f}s at {args.embed_ms} ms each")
+    expected = [[m.index for m in exact.match_resume(resume, top_k=args.top_k)] for resume in resumes]
+
+    print(f"{'N':>6} {'recall@' + str(args.top_k):>10} {'tfidf ms':>9} {'cold rerank ms':>15} {'warm rerank ms':>15}")
+    for n in args.n:
+        cascade = CascadeMatcher(n_candidates=n, embed=costly_embed, rerank_budget=float("inf"))
+        cascade.preprocess_job_descriptions(jobs)
+        recall, stages = [], {"candidates": [], "cold": [], "warm": []}
+        for resume, truth in zip(resumes, expected):
+            # Cold: candidates not embedded yet; warm: the same query again, vectors cached
+            top = cascade.match_resume(resume, top_k=args.top_k)
+            stages["candidates"].append(cascade.last_timings["candidates"])
+            stages["cold"].append(cascade.last_timings["rerank"])
+            cascade.match_resume(resume, top_k=args.top_k)
+            stages["warm"].append(cascade.last_timings["rerank"])
+            recall.append(len(set(truth) & {m.index for m in top}) / args.top_k)
+        print(f"{n:>6} {np.mean(recall):>10.1%} {np.mean(stages['candidates']) * 1e3:>9.1f} "
+              f"{np.mean(stages['cold']) * 1e3:>15.1f} {np.mean(stages['warm']) * 1e3:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# scripts/bench_inverted_index.py
+# Top-k latency of JobMatcher's dense path (score every job) versus retrieval="inverted"
+# (term postings with MaxScore pruning), for TF-IDF and BM25 scoring, on synthetic hashed
+# indexes with Zipf-distributed job terms. Results are checked to be identical.
+#
+#   python scripts/bench_inverted_index.py [--jobs 100000 1000000] [--terms 40] [--top-k 20]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import JobMatcher
+
+VOCABULARY = [f"term{i}" for i in range(50_000)]
+
+
+def synthetic_matcher(n_jobs, terms, scoring, rng):
+    # Tokenizing a million generated descriptions would take minutes, so term counts are
+    # filled in directly at the hashed columns the vocabulary words map to
+    matcher = JobMatcher(hashed=True, n_features=2 ** 20, compact=True, scoring=scoring)
+    matcher.add_jobs([{"job_id": "seed", "description": "seed posting for the hashing vectorizer"}])
+    columns = matcher.vectorizer.transform(VOCABULARY).indices
+    ranks = np.minimum(rng.zipf(1.2, n_jobs * terms), len(VOCABULARY)) - 1
+    counts = sp.csr_matrix(
+        (np.ones(n_jobs * terms, dtype=np.uint16), columns[ranks], np.arange(0, n_jobs * terms + 1, terms)),
+        shape=(n_jobs, matcher.n_features),
+    )
+    counts.sum_duplicates()
+    matcher._count_blocks = [counts]
+    matcher._block_starts = [0]
+    matcher._df = np.bincount(counts.indices, minlength=matcher.n_features).astype(np.int32)
+    matcher._jobs = [{"job_id": str(i)} for i in range(n_jobs)]
+    matcher._dirty = True
+    matcher._refresh()
+    return matcher
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, nargs="+", default=[100_000, 1_000_000])
+    arg_parser.add_argument("--terms", type=int, default=40, help="term occurrences per synthetic job")
+    arg_parser.add_argument("--query-terms", type=int, default=25)
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--queries", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Resumes mix a few very common terms with many mid-frequency ones, like skills do
+    resumes = [
+        {"skills": {"all_skills": list(rng.choice(VOCABULARY[:3000], args.query_terms, replace=False))}}
+        for _ in range(args.queries)
+    ]
+    print(f"{'jobs':>9} {'scoring':<7} {'dense ms':>9} {'inverted ms':>12} {'speedup':>8} {'scanned':>8} {'probed':>7}")
+    for n in args.jobs:
+        for scoring in ("tfidf", "bm25"):
+            matcher = synthetic_matcher(n, args.terms, scoring, rng)
+            timings, results = {}, {}
+            for retrieval in ("dense", "inverted"):
+                matcher.retrieval = retrieval
+                matcher.match_resume(resumes[0], top_k=args.top_k)  # builds the postings
+                start = time.perf_counter()
+                results[retrieval] = [[m.index for m in matcher.match_resume(resume, top_k=args.top_k)] for resume in resumes]
+                timings[retrieval] = (time.perf_counter() - start) / len(resumes) * 1e3
+            assert results["dense"] == results["inverted"]
+
+            # Share of the query terms' postings that were scanned / probed, for the last query
+            stats = matcher._inverted.last_stats
+            print(f"{n:>9} {scoring:<7} {timings['dense']:>9.1f} {timings['inverted']:>12.1f} "
+                  f"{timings['dense'] / timings['inverted']:>7.1f}x {stats['scanned'] / stats['postings']:>8.1%} "
+                  f"{stats['probed'] / stats['postings']:>7.1%}")
+            del matcher
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# scripts/bench_job_dedup.py
+# JobDeduplicator (MinHash + LSH banding) versus exact all-pairs Jaccard on synthetic job
+# corpora with injected reposts (lightly edited copies): run time, pairs compared, recall of
+# the true duplicate pairs and the corpus-size reduction.
+#
+#   python scripts/bench_job_dedup.py [--jobs 2000 20000] [--repost-rate 0.3] [--exact-max 5000]
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_dedup import JobDeduplicator
+
+WORDS = [f"term{i}" for i in range(5000)]
+
+
+def synthetic_jobs(n, repost_rate, rng):
+    jobs = []
+    while len(jobs) < n:
+        if jobs and rng.random() < repost_rate:
+            # A repost: the same text with a word swapped and a new sign-off
+            words = jobs[rng.integers(0, len(jobs))]["description"].split()
+            words[rng.integers(0, len(words))] = rng.choice(WORDS)
+            description = " ".join(words) + " apply via agency"
+        else:
+            description = " ".join(rng.choice(WORDS, 80))
+        jobs.append({"job_id": str(len(jobs)), "title": "Engineer", "description": description})
+    return jobs
+
+
+def exact_pairs(dedup, jobs):
+    shingles = [set(dedup._shingle_hashes(dedup._job_text(job))) for job in jobs]
+    return {
+        (i, j) for i, j in itertools.combinations(range(len(jobs)), 2)
+        if len(shingles[i] & shingles[j]) / len(shingles[i] | shingles[j]) >= dedup.threshold
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, nargs="+", default=[2000, 20000])
+    arg_parser.add_argument("--repost-rate", type=float, default=0.3)
+    arg_parser.add_argument("--threshold", type=float, default=0.8)
+    arg_parser.add_argument("--exact-max", type=int, default=5000, help="skip the all-pairs baseline above this size")
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'jobs':>7} {'method':<8} {'seconds':>8} {'pairs':>12} {'recall':>7} {'kept':>7} {'reduction':>10}")
+    for n in args.jobs:
+        jobs = synthetic_jobs(n, args.repost_rate, rng)
+        dedup = JobDeduplicator(threshold=args.threshold)
+
+        start = time.perf_counter()
+        clusters = dedup.clusters(jobs)
+        seconds = time.perf_counter() - start
+        kept = len(clusters)
+        cluster_of = {i: c for c, members in enumerate(clusters) for i in members}
+
+        recall = "-"
+        if n <= args.exact_max:
+            start = time.perf_counter()
+            truth = exact_pairs(dedup, jobs)
+            exact_seconds = time.perf_counter() - start
+            recall = f"{np.mean([cluster_of[i] == cluster_of[j] for i, j in truth]):.3f}" if truth else "-"
+            print(f"{n:>7} {'exact':<8} {exact_seconds:>8.2f} {n * (n - 1) // 2:>12}")
+        print(f"{n:>7} {'minhash':<8} {seconds:>8.2f} {dedup.report['compared_pairs']:>12} {recall:>7} {kept:>7} {(n - kept) / n:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
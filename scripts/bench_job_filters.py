@@ -0,0 +1,80 @@
+# scripts/bench_job_filters.py
+# Top-k latency of JobMatcher.match_resume scoring every job and filtering afterwards
+# versus filters=... (column indexes pick the rows, only those are scored), for queries of
+# decreasing selectivity on a synthetic index.
+#
+#   python scripts/bench_job_filters.py [--jobs 1000000] [--top-k 20]
+import argparse
+import datetime
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import top_k_indices
+from scripts.bench_top_k import synthetic_matcher
+
+LOCATIONS = ["Remote", "London", "Manchester", "New York, NY", "Austin, TX", "Leeds", "Bristol", "Seattle, WA"]
+CATEGORIES = ["IT Jobs", "Engineering Jobs", "Sales Jobs", "Healthcare & Nursing Jobs", "Accounting & Finance Jobs"]
+QUERIES = [
+    {"category": "IT Jobs"},
+    {"location": "Remote", "min_salary": 100_000},
+    {"location": "Remote", "min_salary": 100_000, "posted_within_days": 14},
+]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=1_000_000)
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    matcher = synthetic_matcher(args.jobs, 40, rng)
+    today = datetime.date.today()
+    locations = rng.integers(0, len(LOCATIONS), args.jobs)
+    categories = rng.integers(0, len(CATEGORIES), args.jobs)
+    salaries = rng.integers(20, 160, args.jobs) * 1000
+    ages = rng.integers(0, 120, args.jobs)
+    for i, job in enumerate(matcher._jobs):
+        job.update(
+            location=LOCATIONS[locations[i]], category=CATEGORIES[categories[i]],
+            salary_min=int(salaries[i]), salary_max=int(salaries[i]) + 20_000,
+            date_posted=(today - datetime.timedelta(days=int(ages[i]))).isoformat(),
+        )
+
+    start = time.perf_counter()
+    index = matcher.filter_index
+    print(f"{args.jobs} jobs; filter index built in {time.perf_counter() - start:.1f}s")
+    resume = {"skills": {"all_skills": ["python", "docker", "aws", "sql"]}}
+
+    print(f"{'filters':<70} {'rows':>8} {'scan ms':>8} {'index ms':>9} {'speedup':>8}")
+    for filters in QUERIES:
+        allowed = np.zeros(args.jobs, dtype=bool)
+        allowed[index.rows(filters)] = True
+
+        # Baseline: score every job, then drop the ones failing the (precomputed) filters
+        def scan():
+            scores = (matcher.job_vectors @ matcher._transform([matcher._create_resume_text(resume)]).T).toarray().ravel()
+            scores[~allowed] = -np.inf
+            return top_k_indices(scores, args.top_k)
+
+        def indexed():
+            return [match.index for match in matcher.match_resume(resume, top_k=args.top_k, filters=filters)]
+
+        assert list(scan()) == indexed()
+        timings = []
+        for func in (scan, indexed):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                func()
+            timings.append((time.perf_counter() - start) / args.repeat * 1e3)
+        print(f"{str(filters):<70} {allowed.sum():>8} {timings[0]:>8.1f} {timings[1]:>9.1f} {timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
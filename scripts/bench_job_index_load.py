@@ -0,0 +1,58 @@
+# scripts/bench_job_index_load.py
+# Cold start of a JobMatcher: fitting it from raw job dicts versus loading a saved index
+# (memory-mapped or read into memory), on synthetic postings.
+#
+#   python scripts/bench_job_index_load.py [--jobs N] [--hashed]
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import JobMatcher
+
+
+def make_jobs(count, rng):
+    words = [f"term{i}" for i in range(50_000)] + ["python", "docker", "aws", "react", "sql"]
+    return [
+        {"job_id": str(i), "title": f"Job {i}", "company": "Acme", "location": "Remote",
+         "url": f"https://example.com/jobs/{i}", "description": " ".join(rng.choices(words, k=120))}
+        for i in range(count)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=100_000)
+    arg_parser.add_argument("--hashed", action="store_true")
+    args = arg_parser.parse_args()
+
+    resume = {"skills": {"all_skills": ["Python", "Docker", "AWS", "SQL"]}}
+    jobs = make_jobs(args.jobs, random.Random(0))
+    matcher = JobMatcher(hashed=args.hashed)
+    _, fit = timed(lambda: matcher.preprocess_job_descriptions(jobs))
+
+    with tempfile.TemporaryDirectory() as path:
+        _, save = timed(lambda: matcher.save(path))
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        print(f"{args.jobs} jobs; index is {size / 1e6:.1f} MB on disk\n")
+        print(f"{'startup':<14} {'load s':>8} {'first match s':>14}")
+        print(f"{'fit':<14} {fit:>8.3f} {timed(lambda: matcher.match_resume(resume))[1]:>14.3f}")
+        print(f"{'(save)':<14} {save:>8.3f}")
+        for mmap in (True, False):
+            loaded, load = timed(lambda: JobMatcher.load(path, mmap=mmap))
+            _, first = timed(lambda: loaded.match_resume(resume))
+            print(f"{'load mmap' if mmap else 'load read':<14} {load:>8.3f} {first:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
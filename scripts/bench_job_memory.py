@@ -0,0 +1,68 @@
+# scripts/bench_job_memory.py
+# JobMatcher.memory_report for the default and compact (float32 vectors, int32 indices, no
+# descriptions) index layouts, on synthetic Adzuna-like postings: bytes per structure and
+# per job, and how many more jobs fit in the same memory.
+#
+#   python scripts/bench_job_memory.py [--jobs 50000] [--description-words 120]
+import argparse
+import os
+import sys
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import JobMatcher
+
+LOCATIONS = ["Remote", "London", "Manchester", "New York, NY", "Austin, TX", "Seattle, WA"]
+COMPANIES = [f"Company {i}" for i in range(500)]
+
+
+def synthetic_jobs(n, words_per_description, rng):
+    # Zipf-distributed words, so the vocabulary and term counts look like real text
+    words = np.array([f"w{i}" for i in range(50_000)])
+    jobs = []
+    for i in range(n):
+        ranks = np.minimum(rng.zipf(1.3, words_per_description), len(words)) - 1
+        jobs.append({
+            "job_id": str(i),
+            "title": f"Engineer {i % 300}",
+            "company": str(COMPANIES[rng.integers(0, len(COMPANIES))]),
+            "location": str(LOCATIONS[rng.integers(0, len(LOCATIONS))]),
+            "description": " ".join(words[ranks]),
+            "url": f"https://example.com/jobs/{i}",
+            "date_posted": "2025-04-12",
+            "salary_min": 90000,
+            "salary_max": 120000,
+            "category": "IT Jobs",
+        })
+    return jobs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=50_000)
+    arg_parser.add_argument("--description-words", type=int, default=120)
+    args = arg_parser.parse_args()
+
+    for hashed in (False, True):
+        reports = {}
+        for compact in (False, True):
+            # Each matcher gets its own copy, as jobs fetched per worker would be
+            jobs = synthetic_jobs(args.jobs, args.description_words, np.random.default_rng(0))
+            matcher = JobMatcher(hashed=hashed, compact=compact)
+            matcher.preprocess_job_descriptions(jobs)
+            del jobs
+            reports[compact] = matcher.memory_report()
+            del matcher
+
+        print(f"\n{'hashed' if hashed else 'vocabulary'} index, {args.jobs} jobs")
+        print(f"{'structure':<18} {'default MB':>11} {'compact MB':>11}")
+        for name in reports[False]:
+            print(f"{name:<18} {reports[False][name] / 1e6:>11.1f} {reports[True][name] / 1e6:>11.1f}")
+        per_job = [reports[compact]["total"] / args.jobs for compact in (False, True)]
+        print(f"{'bytes per job':<18} {per_job[0]:>11.0f} {per_job[1]:>11.0f}  ({per_job[0] / per_job[1]:.1f}x more jobs per worker)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# scripts/bench_match_batcher.py
+# Throughput and latency of concurrent top-k matching: every client thread calling
+# JobMatcher.match_resume directly, versus the same clients going through MatchBatcher for
+# a range of batching windows and batch sizes. Each client sends its next request as soon
+# as the last one is answered (closed loop), on a synthetic hashed index.
+#
+#   python scripts/bench_match_batcher.py [--jobs 200000] [--clients 1 8 32] [--windows 0 0.002 0.005 0.02]
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.match_batcher import MatchBatcher
+from scripts.bench_inverted_index import VOCABULARY, synthetic_matcher
+
+
+def run_load(match, resumes, clients, seconds, top_k):
+    latencies = []
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def client(offset):
+        own = []
+        i = offset
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            match(resumes[i % len(resumes)], top_k)
+            own.append(time.perf_counter() - start)
+            i += clients
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=client, args=(offset,)) for offset in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies) / (time.perf_counter() - start), np.percentile(latencies, [50, 99]) * 1e3
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=200_000)
+    arg_parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    arg_parser.add_argument("--windows", type=float, nargs="+", default=[0, 0.002, 0.005, 0.02])
+    arg_parser.add_argument("--max-batch", type=int, nargs="+", default=[8, 32])
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--seconds", type=float, default=3.0, help="load duration per configuration")
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    matcher = synthetic_matcher(args.jobs, 40, "tfidf", rng)
+    resumes = [{"skills": {"all_skills": list(rng.choice(VOCABULARY[:3000], 25, replace=False))}} for _ in range(500)]
+
+    print(f"{'clients':>7} {'mode':<24} {'req/s':>7} {'p50 ms':>7} {'p99 ms':>7} {'batch':>6}")
+    for clients in args.clients:
+        throughput, (p50, p99) = run_load(
+            lambda resume, top_k: matcher.match_resume(resume, top_k=top_k), resumes, clients, args.seconds, args.top_k)
+        print(f"{clients:>7} {'direct':<24} {throughput:>7.0f} {p50:>7.1f} {p99:>7.1f} {1:>6.1f}")
+        for max_batch in args.max_batch:
+            for window in args.windows:
+                batcher = MatchBatcher(matcher, window=window, max_batch=max_batch)
+                throughput, (p50, p99) = run_load(batcher.match_resume, resumes, clients, args.seconds, args.top_k)
+                mode = f"batched {window * 1e3:g}ms/{max_batch}"
+                print(f"{clients:>7} {mode:<24} {throughput:>7.0f} {p50:>7.1f} {p99:>7.1f} "
+                      f"{batcher.stats()['mean_batch']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# scripts/bench_pdf_backends.py
+# Throughput of each PDF text-extraction backend on the bundled sample resumes, and how closely
+# the skills (and experience/education entries) found in its text match the pdfminer layout reference.
+#
+#   python scripts/bench_pdf_backends.py [--limit N] [--model NAME]
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.pdf_backends import PDF_BACKENDS
+from models.resume_parser import ResumeParser
+
+SAMPLE_DIR = os.path.join(ROOT, "data/sample_resumes/data/data/INFORMATION-TECHNOLOGY")
+REFERENCE = "pdfminer-layout"
+
+
+def extract(parser, files):
+    texts, errors = [], 0
+    start = time.perf_counter()
+    for path in files:
+        try:
+            with open(path, "rb") as file:
+                texts.append(parser._extract_text_from_pdf(file))
+        except Exception:
+            texts.append("")
+            errors += 1
+    return texts, errors, time.perf_counter() - start
+
+
+def summarize(parser, text):
+    return (
+        set(parser._extract_skills(text)["all_skills"]),
+        len(parser._extract_experience(text)),
+        len(parser._extract_education(text)),
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--limit", type=int, default=None)
+    arg_parser.add_argument("--model", default=None)
+    args = arg_parser.parse_args()
+
+    files = sorted(os.path.join(SAMPLE_DIR, f) for f in os.listdir(SAMPLE_DIR) if f.endswith(".pdf"))[:args.limit]
+    names = [REFERENCE] + [name for name in PDF_BACKENDS if name != REFERENCE]
+    model = {"model_name": args.model} if args.model else {}
+    parsers = {name: ResumeParser(pdf_backend=name, **model) for name in names}
+    parsers[REFERENCE].skill_nlp  # load before timing
+
+    reference = None
+    print(f"{len(files)} PDFs; parity is against {REFERENCE}\n")
+    print(f"{'backend':<16} {'docs/s':>7} {'speedup':>8} {'errors':>7} {'same skills':>12} "
+          f"{'skill recall':>13} {'same exp/edu':>13}")
+    for name in names:
+        parser = parsers[name]
+        texts, errors, elapsed = extract(parser, files)
+        summaries = [summarize(parser, text) for text in texts]
+        if reference is None:
+            reference, baseline = summaries, elapsed
+
+        same_skills = sum(s[0] == r[0] for s, r in zip(summaries, reference))
+        found = sum(len(s[0] & r[0]) for s, r in zip(summaries, reference))
+        expected = sum(len(r[0]) for r in reference) or 1
+        same_entries = sum(s[1:] == r[1:] for s, r in zip(summaries, reference))
+        print(f"{name:<16} {len(files) / elapsed:>7.1f} {baseline / elapsed:>7.2f}x {errors:>7} "
+              f"{same_skills / len(files):>12.1%} {found / expected:>13.1%} {same_entries / len(files):>13.1%}")
+
+        chosen = getattr(parser.pdf_backend, "chosen", None)
+        if chosen:
+            print(f"{'':<16} chosen: " + ", ".join(f"{backend} x{count}" for backend, count in chosen.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# scripts/bench_pdf_extraction.py
+# Speedup of process-pool PDF text extraction versus worker count on the bundled sample resumes.
+#
+#   python scripts/bench_pdf_extraction.py [--workers 1 2 4 8] [--limit N]
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.resume_parser import ResumeParser
+
+SAMPLE_DIR = os.path.join(ROOT, "data/sample_resumes/data/data/INFORMATION-TECHNOLOGY")
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=None)
+    arg_parser.add_argument("--limit", type=int, default=None)
+    arg_parser.add_argument("--model", default=None)
+    args = arg_parser.parse_args()
+
+    workers_list = args.workers or sorted({w for w in (1, 2, 4, 8) if w <= cpus} | {cpus})
+    parser = ResumeParser(args.model) if args.model else ResumeParser()
+    parser.skill_nlp  # load before forking so every run measures extraction only
+    files = sorted(os.path.join(SAMPLE_DIR, f) for f in os.listdir(SAMPLE_DIR) if f.endswith(".pdf"))[:args.limit]
+
+    start = time.perf_counter()
+    serial = [text for _, text, _ in parser._extract_serial(files)]
+    baseline = time.perf_counter() - start
+    print(f"{len(files)} PDFs on {cpus} CPUs; serial: {baseline:.2f}s ({len(files) / baseline:.1f} docs/s)\n")
+    print(f"{'workers':>7} {'seconds':>8} {'docs/s':>8} {'speedup':>8}")
+
+    for workers in workers_list:
+        start = time.perf_counter()
+        texts = [text for _, text, _ in parser.extract_texts(files, workers=workers)]
+        elapsed = time.perf_counter() - start
+        assert texts == serial, "pool output differs from serial extraction"
+        print(f"{workers:>7} {elapsed:>8.2f} {len(files) / elapsed:>8.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
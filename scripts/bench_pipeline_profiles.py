@@ -0,0 +1,54 @@
+# scripts/bench_pipeline_profiles.py
+# Throughput of each spaCy pipeline profile on the bundled IT sample resumes.
+#
+#   python scripts/bench_pipeline_profiles.py [--limit N] [--repeat R]
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.model_registry import DEFAULT_MODEL, PIPELINE_PROFILES, get_nlp
+from models.resume_parser import ResumeParser
+
+SAMPLE_DIR = os.path.join(ROOT, "data/sample_resumes/data/data/INFORMATION-TECHNOLOGY")
+
+
+def load_texts(limit=None):
+    parser = ResumeParser()
+    files = sorted(f for f in os.listdir(SAMPLE_DIR) if f.endswith(".pdf"))[:limit]
+    texts = []
+    for name in files:
+        with open(os.path.join(SAMPLE_DIR, name), "rb") as f:
+            texts.append(parser._extract_text_from_pdf(f).lower())
+    return texts
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--model", default=DEFAULT_MODEL)
+    arg_parser.add_argument("--limit", type=int, default=None)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    texts = load_texts(args.limit)
+    total_chars = sum(len(t) for t in texts)
+    print(f"{len(texts)} resumes, {total_chars / 1e6:.2f}M chars\n")
+    print(f"{'profile':<10} {'components':<60} {'docs/s':>8} {'kchars/s':>9}")
+
+    for profile in PIPELINE_PROFILES:
+        nlp = get_nlp(args.model, profile)
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for _ in nlp.pipe(texts):
+                pass
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        components = ",".join(nlp.pipe_names) or "(tokenizer only)"
+        print(f"{profile:<10} {components:<60} {len(texts) / best:>8.1f} {total_chars / best / 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# scripts/bench_section_extraction.py
+# Worst-case cost of experience/education extraction on adversarial inputs of growing size:
+# the old whole-text regexes versus SectionIndex + the linear entry scanners.
+#
+#   python scripts/bench_section_extraction.py [--max-chars N] [--old-budget SECONDS]
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.resume_parser import ResumeParser
+from models.resume_sections import SectionIndex
+
+OLD_EXPERIENCE_SECTION_RE = re.compile(r'(Work Experience|Experience|Professional Experience)(.*?)(Education|Projects|Skills|$)', re.DOTALL | re.IGNORECASE)
+OLD_EXPERIENCE_ENTRY_RE = re.compile(r'(?P<title>.+?) at (?P<company>.+?) \((?P<dates>[\d\-– ]+)\)')
+OLD_EDUCATION_SECTION_RE = re.compile(r'(Education)(.*?)(Experience|Skills|Projects|$)', re.DOTALL | re.IGNORECASE)
+OLD_EDUCATION_ENTRY_RE = re.compile(r'(?P<degree>Bachelor|Master|PhD|Associate)[^,\n]* in (?P<field>[^,\n]*)[,\n]+(?P<school>[^\n]+)', re.IGNORECASE)
+
+# Each case repeats a unit that keeps the old patterns backtracking without ever matching
+CASES = {
+    "titles without dates": "Engineer at Acme ",
+    "degrees without school": "Bachelor in Science ",
+    "open experience section": "Experience at Acme (2019 ",
+}
+
+
+def old_extract(text):
+    section = OLD_EXPERIENCE_SECTION_RE.search(text)
+    OLD_EXPERIENCE_ENTRY_RE.findall(section.group(2) if section else text)
+    section = OLD_EDUCATION_SECTION_RE.search(text)
+    OLD_EDUCATION_ENTRY_RE.findall(section.group(2) if section else text)
+
+
+def timed(func, text):
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--max-chars", type=int, default=256_000)
+    arg_parser.add_argument("--old-budget", type=float, default=5.0,
+                            help="stop timing the old regexes once one run exceeds this many seconds")
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+
+    def new_extract(text):
+        sections = SectionIndex(text)
+        parser._extract_experience(text, sections)
+        parser._extract_education(text, sections)
+
+    print(f"{'case':<26} {'chars':>8} {'old ms':>10} {'new ms':>8}")
+    for name, unit in CASES.items():
+        old_too_slow = False
+        size = 1000
+        while size <= args.max_chars:
+            text = unit * (size // len(unit))
+            old = None if old_too_slow else timed(old_extract, text)
+            new = timed(new_extract, text)
+            old_too_slow = old_too_slow or old > args.old_budget
+            old_ms = "skipped" if old is None else f"{old * 1e3:.1f}"
+            print(f"{name:<26} {len(text):>8} {old_ms:>10} {new * 1e3:>8.1f}")
+            size *= 4
+
+
+if __name__ == "__main__":
+    main()
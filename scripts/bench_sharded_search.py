@@ -0,0 +1,61 @@
+# scripts/bench_sharded_search.py
+# Top-k latency of one whole-matrix JobMatcher search versus ShardedScorer with 1..N shards
+# scored in parallel (local top-k per shard, then merged), on a synthetic index of a few
+# million jobs. Speedup over one shard can only approach the shard count up to the number
+# of cores.
+#
+#   python scripts/bench_sharded_search.py [--jobs 2000000] [--shards 1 2 4 8] [--executors thread process]
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_shards import ShardedScorer
+from scripts.bench_top_k import SKILLS, synthetic_matcher
+
+
+def timed(search, queries):
+    start = time.perf_counter()
+    results = [search(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--jobs", type=int, default=2_000_000)
+    arg_parser.add_argument("--terms", type=int, default=20, help="non-zero terms per synthetic job")
+    arg_parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    arg_parser.add_argument("--executors", nargs="+", default=["thread", "process"])
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    matcher = synthetic_matcher(args.jobs, args.terms, np.random.default_rng(0))
+    resumes = [{"skills": {"all_skills": random.Random(i).sample(SKILLS, 4)}} for i in range(args.repeat)]
+    queries = [matcher._transform([matcher._create_resume_text(resume)]) for resume in resumes]
+    cores = os.cpu_count()
+    print(f"{args.jobs} jobs, {matcher.job_vectors.nnz} non-zeros, {cores} cores")
+
+    latency, expected = timed(lambda query: matcher._search(query, args.top_k)[0], queries)
+    print(f"{'search':<16} {'ms/query':>9} {'vs 1 shard':>11} {'per core':>9}")
+    print(f"{'unsharded':<16} {latency * 1e3:>9.1f}")
+    for executor in args.executors:
+        one_shard = None
+        for shards in args.shards:
+            scorer = ShardedScorer(matcher.job_vectors, shards, executor)
+            scorer.search(queries[0], args.top_k)  # starts the pool (forks the processes)
+            latency, found = timed(lambda query: scorer.search(query, args.top_k)[0], queries)
+            scorer.close()
+            assert all(np.array_equal(a, b) for a, b in zip(found, expected))
+            one_shard = one_shard or latency
+            speedup = one_shard / latency
+            print(f"{executor + ' x' + str(shards):<16} {latency * 1e3:>9.1f} {speedup:>10.2f}x {speedup / min(shards, cores):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# scripts/bench_skill_matcher.py
+# Per-document skill matching cost as the skills table grows from dozens to tens of thousands.
+# Compares the compiled SkillMatcher with a per-skill substring scan.
+#
+#   python scripts/bench_skill_matcher.py [--docs N]
+import argparse
+import csv
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.skill_matcher import SkillMatcher
+
+RESUME_CSV = os.path.join(ROOT, "data/sample_resumes/Resume/ResumeDataSet2.csv")
+TOKEN_RE = re.compile(r"\w+|[^\w\s]+")
+BASE_SKILLS = ["python", "java", "javascript", "c++", "sql server", "machine learning", "google cloud",
+               "problem solving", "data analysis", "docker", "kubernetes", "react", "django", "aws"]
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def load_docs(limit):
+    csv.field_size_limit(10 ** 8)
+    with open(RESUME_CSV, newline="", encoding="utf-8", errors="ignore") as f:
+        return [row["Resume"] for _, row in zip(range(limit), csv.DictReader(f))]
+
+
+def make_skills(size, words, rng):
+    skills = set(BASE_SKILLS)
+    while len(skills) < size:
+        skills.add(" ".join(rng.choices(words, k=rng.randint(1, 3))))
+    return sorted(skills)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--docs", type=int, default=200)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[30, 300, 3000, 30000])
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    docs = load_docs(args.docs)
+    tokens = [tokenize(doc) for doc in docs]
+    lowered = [doc.lower() for doc in docs]
+    words = sorted({t for doc in tokens for t in doc if t.isalpha()})
+    print(f"{len(docs)} resumes, {sum(map(len, tokens)) / len(docs):.0f} tokens/doc on average\n")
+    print(f"{'skills':>7} {'compile ms':>11} {'matcher us/doc':>15} {'scan us/doc':>12} {'matches/doc':>12}")
+
+    for size in args.sizes:
+        skills = make_skills(size, words, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher.from_skills(skills, tokenize)
+        compile_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        matches = sum(len(matcher.find_all(doc)) for doc in tokens)
+        matcher_us = (time.perf_counter() - start) / len(docs) * 1e6
+
+        # Substring scan, as in back_end_testing/resume_parser.py::extract_skills
+        scan_docs = lowered[:max(1, len(docs) * 300 // size)]
+        start = time.perf_counter()
+        for doc in scan_docs:
+            [skill for skill in skills if skill in doc]
+        scan_us = (time.perf_counter() - start) / len(scan_docs) * 1e6
+
+        print(f"{len(skills):>7} {compile_ms:>11.1f} {matcher_us:>15.1f} {scan_us:>12.1f} {matches / len(docs):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# scripts/bench_top_k.py
+# Per-query latency and peak allocations of JobMatcher.match_resume returning every job
+# (scored copies, full sort) versus top_k partial selection, on synthetic indexes.
+#
+#   python scripts/bench_top_k.py [--sizes 10000 100000 1000000] [--top-k 20] [--terms 40]
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import JobMatcher
+
+SKILLS = ["python", "docker", "aws", "react", "sql", "kubernetes", "java", "terraform"]
+
+
+def synthetic_matcher(n_jobs, terms, rng):
+    # Fitting TF-IDF on a million descriptions takes minutes and isn't what is measured
+    # here, so the index is filled with random sparse unit rows in the hashed feature space
+    matcher = JobMatcher(hashed=True, n_features=2 ** 18)
+    matcher.preprocess_job_descriptions([{"description": " ".join(SKILLS) + " engineer role"}])
+    vocabulary = matcher.vectorizer.transform([" ".join(SKILLS)]).indices
+    columns = rng.integers(0, matcher.n_features, size=(n_jobs, terms))
+    columns[:, :2] = rng.choice(vocabulary, size=(n_jobs, 2))
+    vectors = sp.csr_matrix(
+        (rng.random(n_jobs * terms), columns.ravel(), np.arange(0, n_jobs * terms + 1, terms)),
+        shape=(n_jobs, matcher.n_features),
+    )
+    vectors.sum_duplicates()
+    matcher._job_vectors = normalize(vectors)
+    matcher._jobs = [
+        {"job_id": str(i), "title": f"Job {i}", "company": "Acme", "location": "Remote",
+         "url": f"https://example.com/jobs/{i}", "description": "..."}
+        for i in range(n_jobs)
+    ]
+    matcher._idf = np.ones(matcher.n_features)
+    return matcher
+
+
+def measure(func, repeat):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    latency = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--terms", type=int, default=40, help="non-zero terms per synthetic job")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    resumes = [{"skills": {"all_skills": random.Random(i).sample(SKILLS, 4)}} for i in range(args.repeat)]
+    print(f"{'jobs':>9} {'mode':<8} {'ms/query':>9} {'peak MB':>8}")
+    for size in args.sizes:
+        matcher = synthetic_matcher(size, args.terms, rng)
+        for mode, top_k in (("full", None), (f"top-{args.top_k}", args.top_k)):
+            queries = iter(resumes * (args.repeat + 2))
+            latency, peak = measure(lambda: matcher.match_resume(next(queries), top_k=top_k)[:args.top_k], args.repeat)
+            print(f"{size:>9} {mode:<8} {latency * 1e3:>9.1f} {peak / 1e6:>8.1f}")
+        del matcher
+
+
+if __name__ == "__main__":
+    main()
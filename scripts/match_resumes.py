@@ -0,0 +1,95 @@
+# scripts/match_resumes.py
+# Batch-match parsed resumes against a job set and write each resume's top-k jobs as JSON lines.
+# Resumes are streamed: .json files (one parsed resume each, like test_outputs/), .jsonl files
+# (one per line) or directories of either; memory stays bounded by --batch-size/--chunk-size.
+#
+#   python scripts/match_resumes.py --jobs tests/sample_jobs.json test_outputs/ --out matches.jsonl
+#   python scripts/match_resumes.py --jobs path/to/saved_index resumes.jsonl --top-k 50
+import argparse
+import json
+import os
+import sys
+from collections import deque
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from models.job_matcher import JobMatcher
+
+OUTPUT_FIELDS = ("job_id", "title", "company", "location", "url")
+
+
+def load_matcher(jobs_path, hashed):
+    # A directory is an index written by JobMatcher.save; a file is a JSON list of jobs
+    if os.path.isdir(jobs_path):
+        return JobMatcher.load(jobs_path)
+    with open(jobs_path, encoding="utf-8") as f:
+        jobs = json.load(f)
+    matcher = JobMatcher(hashed=hashed)
+    matcher.preprocess_job_descriptions(jobs)
+    return matcher
+
+
+def iter_resumes(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from iter_resumes(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith((".json", ".jsonl"))
+            ))
+        elif path.endswith(".jsonl"):
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if line.strip():
+                        yield f"{path}:{line_number}", line
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield path, f.read()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("resumes", nargs="+", help="parsed-resume .json/.jsonl files or directories")
+    arg_parser.add_argument("--jobs", required=True, help="JSON list of jobs, or a saved JobMatcher index directory")
+    arg_parser.add_argument("--out", default="-", help="output JSONL path (default: stdout)")
+    arg_parser.add_argument("--top-k", type=int, default=20)
+    arg_parser.add_argument("--batch-size", type=int, default=256)
+    arg_parser.add_argument("--chunk-size", type=int, default=65536)
+    arg_parser.add_argument("--hashed", action="store_true", help="index a jobs file with hashed features")
+    args = arg_parser.parse_args()
+
+    matcher = load_matcher(args.jobs, args.hashed)
+    names = deque()
+    skipped = 0
+
+    def resumes():
+        nonlocal skipped
+        for name, raw in iter_resumes(args.resumes):
+            try:
+                resume_data = json.loads(raw)
+            except json.JSONDecodeError as e:
+                print(f"Skipping {name}: {e}", file=sys.stderr)
+                skipped += 1
+                continue
+            names.append(name)
+            yield resume_data
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    count = 0
+    try:
+        for matches in matcher.match_many(resumes(), args.top_k, args.batch_size, args.chunk_size):
+            record = {
+                "resume": names.popleft(),
+                "matches": [
+                    {**{field: match.job.get(field) for field in OUTPUT_FIELDS}, "similarity": round(match.score, 6)}
+                    for match in matches
+                ],
+            }
+            out.write(json.dumps(record) + "\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Matched {count} resumes ({skipped} skipped)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,89 @@
 # src/app.py
 import sys
 import os
+import logging
 import streamlit as st
 from components.resume_uploader import render_resume_uploader
 from components.results_display import render_results
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.model_registry import warm_up
 from models.resume_parser import ResumeParser
+from models.parse_supervisor import ParseSupervisor
+from models.resume_cache import ResumeCache
 from models.job_matcher import JobMatcher
+from models.embedding_matcher import EmbeddingMatcher
+from models.cascade_matcher import CascadeMatcher
+from models.job_dedup import JobDeduplicator
+from models.match_cache import MatchCache
+from models.match_batcher import MatchBatcher
 from models.career_path import CareerPathRecommender
 from utils.adzuna_api import AdzunaJobsAPI
+from config import MAX_UPLOAD_SIZE, MAX_RESUME_PAGES, MAX_RESUME_CHARS, PDF_BACKEND, RESUME_CACHE_DIR, RESUME_CACHE_MAX_BYTES
+from config import PARSE_WORKERS, PARSE_TIMEOUT, PARSE_MAX_RSS, DEFAULT_SIMILARITY_METHOD, JOB_DEDUP_THRESHOLD
+from config import JOBS_REFRESH_SECONDS, MATCH_CACHE_MAX_BYTES, CASCADE_CANDIDATES, CASCADE_BUDGETS
+from config import MATCH_BATCH_WINDOW, MATCH_BATCH_MAX
+
+logger = logging.getLogger(__name__)
+
+@st.cache_resource
+def load_resume_parser():
+    # Load models once per server process instead of on every rerun
+    warm_up()
+    return ResumeParser(
+        cache=ResumeCache(RESUME_CACHE_DIR, RESUME_CACHE_MAX_BYTES),
+        max_bytes=MAX_UPLOAD_SIZE,
+        max_pages=MAX_RESUME_PAGES,
+        max_chars=MAX_RESUME_CHARS,
+        pdf_backend=PDF_BACKEND,
+    )
+
+@st.cache_resource
+def load_parse_supervisor():
+    # Parsing runs in killable worker processes so a hostile PDF can't stall the app
+    return ParseSupervisor(load_resume_parser(), workers=PARSE_WORKERS, timeout=PARSE_TIMEOUT, max_rss=PARSE_MAX_RSS)
+
+@st.cache_data(ttl=JOBS_REFRESH_SECONDS, show_spinner=False)
+def fetch_jobs():
+    adzuna_api = AdzunaJobsAPI()
+    jobs = adzuna_api.search_jobs('US', limit=100)
+    if jobs:
+        # The same role is often reposted by several agencies; keep one posting of each
+        deduplicator = JobDeduplicator(threshold=JOB_DEDUP_THRESHOLD)
+        jobs = deduplicator.deduplicate(jobs)
+        logger.debug("Job dedup: %s", deduplicator.report)
+    return jobs
+
+@st.cache_resource(max_entries=1)
+def load_job_matcher(jobs_key, _jobs):
+    # One indexed matcher per fetched job set, shared by reruns and sessions; its match
+    # cache turns repeat views of the same resume into a lookup
+    match_cache = MatchCache(MATCH_CACHE_MAX_BYTES)
+    if DEFAULT_SIMILARITY_METHOD == "spacy":
+        job_matcher = EmbeddingMatcher(ann=True, match_cache=match_cache)
+    elif DEFAULT_SIMILARITY_METHOD == "cascade":
+        job_matcher = CascadeMatcher(n_candidates=CASCADE_CANDIDATES, candidate_budget=CASCADE_BUDGETS[0],
+                                     rerank_budget=CASCADE_BUDGETS[1], match_cache=match_cache)
+    else:
+        job_matcher = JobMatcher(match_cache=match_cache)
+    job_matcher.preprocess_job_descriptions(_jobs)
+    return job_matcher
+
+@st.cache_resource(max_entries=1)
+def load_match_batcher(jobs_key, _jobs):
+    # Sessions run on their own threads; concurrent match requests are scored as one batch
+    return MatchBatcher(load_job_matcher(jobs_key, _jobs), window=MATCH_BATCH_WINDOW, max_batch=MATCH_BATCH_MAX)
+
+@st.cache_resource
+def load_career_path_recommender():
+    # One path model per server process; each job refresh only matches the new postings
+    return CareerPathRecommender([])
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def recommend_career_paths(jobs_key, resume_data, _jobs):
+    recommender = load_career_path_recommender()
+    recommender.sync_jobs(_jobs)
+    return recommender.recommend_career_paths(resume_data)
 
 def main():
     st.set_page_config(
@@ -36,8 +110,8 @@ def main():
 
     # Resume Upload Tab
     with tab1:
-        resume_parser = ResumeParser()
-        resume_data = render_resume_uploader(resume_parser)
+        parse_supervisor = load_parse_supervisor()
+        resume_data = render_resume_uploader(parse_supervisor)
 
         # If resume was successfully parsed, trigger redirect
         if resume_data:
@@ -49,18 +123,18 @@ def main():
     with tab2:
         if st.session_state.resume_data:
             with st.spinner("Fetching and matching jobs from Adzuna API..."):
-                adzuna_api = AdzunaJobsAPI()
-                jobs = adzuna_api.search_jobs('US', limit=100)
+                jobs = fetch_jobs()
 
                 if jobs:
-                    job_matcher = JobMatcher()
+                    jobs_key = MatchCache.key_for("\n".join(job.get("url") or job.get("title", "") for job in jobs))
                     print("DEBUG: Resume Data:", st.session_state.resume_data)
                     try:
-                        job_matcher.preprocess_job_descriptions(jobs)
-                        st.session_state.job_matches = job_matcher.match_resume(st.session_state.resume_data)[:20]
+                        job_matcher = load_job_matcher(jobs_key, jobs)
+                        match_batcher = load_match_batcher(jobs_key, jobs)
+                        st.session_state.job_matches = match_batcher.match_resume(st.session_state.resume_data, top_k=20)
+                        logger.debug("Match cache: %s", job_matcher.match_cache.stats())
 
-                        recommender = CareerPathRecommender(jobs)
-                        st.session_state.career_recommendations = recommender.recommend_career_paths(st.session_state.resume_data)
+                        st.session_state.career_recommendations = recommend_career_paths(jobs_key, st.session_state.resume_data, jobs)
                     except ValueError as e:
                         st.error(f"Matching error: {str(e)}")
                 else:
@@ -1,12 +1,11 @@
 # src/components/resume_uploader.py
 import streamlit as st
-import tempfile
 import pandas as pd
 
-def render_resume_uploader(resume_parser):
+def render_resume_uploader(parse_supervisor):
     st.header("Upload Your Resume")
 
-    uploaded_file = st.file_uploader("Choose a resume file", type="pdf")
+    uploaded_file = st.file_uploader("Choose a resume file", type=["pdf", "docx"])
     resume_data = None
 
     if uploaded_file:
@@ -14,14 +13,18 @@ def render_resume_uploader(resume_parser):
 
         if st.button("Parse Resume"):
             with st.spinner("Parsing resume..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.' + uploaded_file.name.split('.')[-1]) as tmp:
-                    tmp.write(uploaded_file.getvalue())
-                    tmp_path = tmp.name
-
-                if uploaded_file.name.endswith(".pdf"):
-                    resume_data = resume_parser.parse_pdf(open(tmp_path, "rb"))
-                elif uploaded_file.name.endswith(".docx"):
-                    resume_data = resume_parser.parse_docx(tmp_path)
+                # Parsed from the upload buffer in a supervised worker; the format comes from the file's bytes
+                result = parse_supervisor.parse(uploaded_file.getbuffer())
+                if result["status"] == "timeout":
+                    st.error("Parsing this resume took too long. Please try a simpler file.")
+                    return None
+                if result["status"] == "oom":
+                    st.error("This resume needs too much memory to parse. Please try a simpler file.")
+                    return None
+                if result["status"] == "error":
+                    st.error(result["error"].split(": ", 1)[-1])
+                    return None
+                resume_data = result["data"]
 
                 if resume_data:
                     st.subheader("Parsed Resume Data")
@@ -11,10 +11,27 @@ DB_NAME = "jobify"
 # Application settings
 DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
 MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5 MB
+MAX_RESUME_PAGES = 20  # pages beyond this are not extracted
+MAX_RESUME_CHARS = 100_000  # extracted text is truncated past this
+PDF_BACKEND = os.environ.get("PDF_BACKEND", "auto")  # Options: auto, pypdf2, pdfminer-lines, pdfminer-layout
+PARSE_WORKERS = 1  # supervised parse processes
+PARSE_TIMEOUT = 30  # seconds before a parse worker is killed
+PARSE_MAX_RSS = 1024 * 1024 * 1024  # 1 GB of memory growth per parse before the worker is killed
 
 # NLP settings
 NLP_MODEL = "en_core_web_md"  # spaCy model
-DEFAULT_SIMILARITY_METHOD = "tfidf"  # Options: tfidf, spacy, word2vec
+DEFAULT_SIMILARITY_METHOD = "tfidf"  # Options: tfidf, spacy (en_core_web_md document vectors), cascade (tfidf, then spacy re-rank)
+CASCADE_CANDIDATES = 100  # jobs the cascade re-ranks with document vectors
+CASCADE_BUDGETS = (0.05, 0.25)  # seconds for the tfidf and re-rank stages
+JOB_DEDUP_THRESHOLD = 0.8  # estimated Jaccard similarity at which two postings count as duplicates
+JOBS_REFRESH_SECONDS = 15 * 60  # fetched jobs (and the matcher indexing them) are reused this long
+MATCH_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of cached match results
+MATCH_BATCH_WINDOW = 0.005  # seconds concurrent match requests wait to be scored together
+MATCH_BATCH_MAX = 32  # most match requests scored in one batch
+
+# Parsed resume cache (extracted text + parse results, keyed by file hash)
+RESUME_CACHE_DIR = os.environ.get("RESUME_CACHE_DIR", os.path.join(os.path.dirname(__file__), "../.cache/resumes"))
+RESUME_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
 
 # Skills database path
 SKILLS_DB_PATH = os.path.join(os.path.dirname(__file__), "../data/skills_db.json")
@@ -1,17 +1,22 @@
 # src/utils/nlp_utils.py
-import spacy
 import gensim
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from models.model_registry import get_task_nlp
+from models.skill_matcher import SkillMatcher
 
 class NLPUtils:
     def __init__(self):
-        # Load spaCy model
-        self.nlp = spacy.load('en_core_web_md')
+        # Shared spaCy model (loaded once per process). Every task here only needs
+        # tokens, lexical attributes and static vectors, so use the tokenize profile.
+        self.nlp = get_task_nlp("similarity")
         
         # Initialize TF-IDF vectorizer
         self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
         
+        # The last skills collection passed in, a snapshot of its contents and its compiled matcher
+        self._last_skill_matcher = None
+        
     def extract_keywords(self, text, top_n=10):
         """Extract top keywords from text using TF-IDF."""
         # Process the text with spaCy
@@ -66,23 +71,22 @@ class NLPUtils:
         """Extract skills from text using a predefined skills database."""
         doc = self.nlp(text.lower())
         
-        # Process each token and its surrounding context
-        found_skills = set()
-        for token in doc:
-            # Check single tokens
-            if token.text in skills_db:
-                found_skills.add(token.text)
-            
-            # Check bigrams
-            if token.i < len(doc) - 1:
-                bigram = token.text + ' ' + doc[token.i + 1].text
-                if bigram in skills_db:
-                    found_skills.add(bigram)
-            
-            # Check trigrams
-            if token.i < len(doc) - 2:
-                trigram = token.text + ' ' + doc[token.i + 1].text + ' ' + doc[token.i + 2].text
-                if trigram in skills_db:
-                    found_skills.add(trigram)
+        # Single- and multi-word skills are matched in one pass over the tokens
+        return self._skill_matcher(skills_db).find_all(token.lower for token in doc)
+    
+    def _skill_matcher(self, skills_db):
+        """Compile a skills database once and reuse it while the same collection is passed in."""
+        if isinstance(skills_db, SkillMatcher):
+            return skills_db
         
-        return list(found_skills)
+        # Only the last collection is kept, so passing many lists doesn't pile up matchers,
+        # and an in-place edit to it shows up in the snapshot
+        snapshot = tuple(skills_db)
+        cached = self._last_skill_matcher
+        if cached is None or cached[0] is not skills_db or cached[1] != snapshot:
+            matcher = SkillMatcher.from_skills(
+                snapshot, lambda skill: [token.lower for token in self.nlp.make_doc(skill.lower())]
+            )
+            cached = (skills_db, snapshot, matcher)
+            self._last_skill_matcher = cached
+        return cached[2]
@@ -1,8 +1,27 @@
 import unittest
 import os
 import json
+import random
+from collections import defaultdict
 from models.job_matcher import JobMatcher
-from models.career_path import CareerPathRecommender
+from models.career_path import COMMON_SKILLS, KEYWORD_CATEGORIES, CareerPathRecommender
+
+def reference_paths(jobs):
+    # The original nested scan: every category's keywords, then every skill, per posting
+    path_data = defaultdict(lambda: {"skills": set(), "roles": set(), "description": ""})
+    for job in jobs:
+        desc = job.get("description", "").lower()
+        combined = f"{job.get('title', '').lower()} {desc}"
+        for category, keywords in KEYWORD_CATEGORIES.items():
+            if any(k in combined for k in keywords):
+                path_data[category]["roles"].add(job.get("title", "Unknown Role"))
+                path_data[category]["description"] = f"Auto-generated from Adzuna job titles/descriptions for {category}"
+                path_data[category]["skills"].update(s for s in COMMON_SKILLS if s in desc)
+    return {k: v for k, v in path_data.items() if v["skills"] and v["roles"]}
+
+def as_sets(career_paths):
+    return {k: {"skills": set(v["skills"]), "roles": set(v["roles"]), "description": v["description"]}
+            for k, v in career_paths.items()}
 
 class TestCareerPathRecommender(unittest.TestCase):
     def setUp(self):
@@ -36,6 +55,41 @@ class TestCareerPathRecommender(unittest.TestCase):
             self.assertTrue(all("similarity_score" in r for r in recommendations))
             self.assertTrue(all(r["similarity_score"] < 100.0 for r in recommendations))
 
+class TestCareerPathModel(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        words = [k for keywords in KEYWORD_CATEGORIES.values() for k in keywords] + sorted(COMMON_SKILLS)
+        # Filler holds keywords inside other words ("ai" in "email", "test" in "latest")
+        words += ["email", "latest", "guide", "team", "Python3", "nodes", "customer", "great"] * 10
+        titles = ["Software Engineer", "Data Analyst", "QA Lead", "Product Manager", "Office Assistant", "Cloud Architect"]
+        self.jobs = [
+            {"job_id": str(i), "title": rng.choice(titles), "description": " ".join(rng.choices(words, k=rng.randint(0, 12)))}
+            for i in range(400)
+        ]
+
+    def test_matches_reference_extraction(self):
+        recommender = CareerPathRecommender(self.jobs)
+        paths = recommender.career_paths
+        self.assertEqual(list(paths), list(reference_paths(self.jobs)))
+        self.assertEqual(as_sets(paths), reference_paths(self.jobs))
+
+    def test_incremental_updates(self):
+        recommender = CareerPathRecommender(self.jobs[:200])
+        recommender.add_jobs(self.jobs[200:])
+        self.assertEqual(recommender.remove_jobs([str(i) for i in range(0, 400, 3)] + ["unknown"]), 134)
+        expected = [job for job in self.jobs if int(job["job_id"]) % 3]
+        self.assertEqual(as_sets(recommender.career_paths), reference_paths(expected))
+
+        # A re-added job_id replaces the old posting
+        replaced = dict(self.jobs[1], title="Site Reliability Engineer", description="sre with kubernetes")
+        recommender.add_jobs([replaced])
+        expected[0] = replaced
+        self.assertEqual(as_sets(recommender.career_paths), reference_paths(expected))
+
+        refreshed = self.jobs[100:300] + [{"title": "DevOps Engineer", "description": "docker and linux on aws"}]
+        recommender.sync_jobs(refreshed)
+        self.assertEqual(as_sets(recommender.career_paths), reference_paths(refreshed))
+
 if __name__ == "__main__":
     unittest.main()
 
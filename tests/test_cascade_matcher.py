@@ -0,0 +1,115 @@
+import unittest
+import time
+import zlib
+import numpy as np
+from models.cascade_matcher import CascadeMatcher
+from models.embedding_matcher import EmbeddingMatcher
+from models.job_matcher import JobMatcher
+from models.match_batcher import MatchBatcher
+from models.match_cache import MatchCache
+
+def embed(texts):
+    # Mean of fixed random word vectors, as in test_embedding_matcher
+    embed.calls += len(texts)
+    return [np.mean([np.random.default_rng(zlib.crc32(w.lower().encode())).standard_normal(32) for w in text.split()]
+                    or [np.zeros(32)], axis=0) for text in texts]
+
+class TestCascadeMatcher(unittest.TestCase):
+    def setUp(self):
+        embed.calls = 0
+        skills = ["python", "java", "aws", "docker", "react", "sql", "spark", "kubernetes", "figma", "excel"]
+        rng = np.random.default_rng(2)
+        self.jobs = [
+            {"job_id": str(i), "title": f"Job {i}", "description": "engineer with " + " ".join(rng.choice(skills, 4))}
+            for i in range(200)
+        ]
+        self.resume = {"skills": {"all_skills": ["Python", "AWS", "Docker"]}}
+
+    def test_reranks_candidates_by_embedding(self):
+        cascade = CascadeMatcher(n_candidates=len(self.jobs), embed=embed, rerank_budget=60)
+        cascade.preprocess_job_descriptions(self.jobs)
+        exact = EmbeddingMatcher(embed=embed)
+        exact.preprocess_job_descriptions(self.jobs)
+        # With every job a candidate, the cascade is the exhaustive embedding ranking
+        top = cascade.match_resume(self.resume, top_k=10)
+        expected = exact.match_resume(self.resume, top_k=10)
+        self.assertEqual([m.index for m in top], [m.index for m in expected])
+        np.testing.assert_allclose([m.score for m in top], [m.score for m in expected], rtol=1e-5)
+
+        # A smaller N re-ranks only the TF-IDF top N
+        cascade.n_candidates = 20
+        tfidf = JobMatcher()
+        tfidf.preprocess_job_descriptions(self.jobs)
+        candidates = {m.index for m in tfidf.match_resume(self.resume, top_k=20)}
+        top = cascade.match_resume(self.resume)
+        self.assertEqual(len(top), 20)
+        self.assertEqual({m.index for m in top}, candidates)
+        self.assertEqual([m.score for m in top], sorted((m.score for m in top), reverse=True))
+        self.assertEqual(cascade.last_timings["reranked"], 20)
+        # Batched matching re-ranks too
+        self.assertEqual([m.index for m in next(cascade.match_many([self.resume]))], [m.index for m in top])
+
+    def test_job_embeddings_are_cached(self):
+        cascade = CascadeMatcher(n_candidates=30, embed=embed, rerank_budget=60)
+        cascade.preprocess_job_descriptions(self.jobs[:150])
+        cascade.match_resume(self.resume)
+        self.assertEqual(embed.calls, 30 + 1)
+        self.assertEqual(cascade.last_timings["embedded"], 30)
+
+        # Embeddings follow their jobs when the index changes
+        cascade.add_jobs(self.jobs[150:])
+        cascade.remove_jobs(["0", "1"])
+        before = embed.calls
+        top = cascade.match_resume(self.resume)
+        self.assertEqual(embed.calls - before, cascade.last_timings["embedded"] + 1)
+        self.assertLess(cascade.last_timings["embedded"], 30)
+
+        fresh = CascadeMatcher(n_candidates=30, embed=embed, rerank_budget=60)
+        fresh.preprocess_job_descriptions([job for job in self.jobs if job["job_id"] not in ("0", "1")])
+        self.assertEqual([m.index for m in top], [m.index for m in fresh.match_resume(self.resume)])
+
+    def test_exhausted_budget_falls_back_to_tfidf_order(self):
+        def slow_embed(texts):
+            time.sleep(0.02)
+            return embed(texts)
+
+        cascade = CascadeMatcher(n_candidates=50, embed=slow_embed, rerank_budget=0, embed_batch_size=10)
+        cascade.preprocess_job_descriptions(self.jobs)
+        tfidf = JobMatcher()
+        tfidf.preprocess_job_descriptions(self.jobs)
+        expected = tfidf.match_resume(self.resume, top_k=50)
+        top = cascade.match_resume(self.resume)
+        self.assertEqual(cascade.last_timings["embedded"], 0)
+        self.assertEqual([(m.index, m.score) for m in top], [(m.index, m.score) for m in expected])
+
+        # Part of a budget re-ranks the best TF-IDF candidates first; the rest keep TF-IDF order
+        cascade.rerank_budget = 0.05
+        top = cascade.match_resume(self.resume)
+        reranked = cascade.last_timings["reranked"]
+        self.assertGreater(reranked, 0)
+        self.assertLess(reranked, 50)
+        self.assertEqual({m.index for m in top[:reranked]}, {m.index for m in expected[:reranked]})
+        self.assertEqual([m.index for m in top[reranked:]], [m.index for m in expected[reranked:]])
+
+        with self.assertRaises(ValueError):
+            CascadeMatcher(compact=True)
+
+    def test_partial_rerank_is_not_cached(self):
+        cascade = CascadeMatcher(n_candidates=50, embed=embed, rerank_budget=0, match_cache=MatchCache())
+        cascade.preprocess_job_descriptions(self.jobs)
+        batcher = MatchBatcher(cascade, window=0)
+        cascade.match_resume(self.resume, top_k=10)
+        batcher.match_resume(self.resume, top_k=10)
+        self.assertEqual(cascade.last_timings["reranked"], 0)
+        self.assertEqual(cascade.match_cache.stats()["hits"], 0)
+
+        # With enough budget the same query re-ranks every candidate, and that result is cached
+        cascade.rerank_budget = 60
+        top = cascade.match_resume(self.resume, top_k=10)
+        self.assertEqual(cascade.last_timings["reranked"], 50)
+        self.assertEqual(cascade.match_cache.stats()["hits"], 0)
+        self.assertEqual([m.index for m in batcher.match_resume(self.resume, top_k=10)], [m.index for m in top])
+        self.assertEqual(cascade.match_cache.stats()["hits"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
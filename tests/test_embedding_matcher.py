@@ -0,0 +1,88 @@
+import unittest
+import zlib
+import numpy as np
+from models.ann_index import IVFIndex
+from models.embedding_matcher import EmbeddingMatcher
+
+def word_vector(word):
+    return np.random.default_rng(zlib.crc32(word.lower().encode())).standard_normal(32)
+
+def embed(texts):
+    # Mean of fixed random word vectors: the shape of spaCy's doc.vector without the model
+    embed.calls += len(texts)
+    return [np.mean([word_vector(w) for w in text.split()] or [np.zeros(32)], axis=0) for text in texts]
+
+class TestEmbeddingMatcher(unittest.TestCase):
+    def setUp(self):
+        embed.calls = 0
+        skills = ["python", "java", "aws", "docker", "react", "sql", "spark", "kubernetes", "figma", "excel"]
+        rng = np.random.default_rng(1)
+        self.jobs = [
+            {"job_id": str(i), "title": f"Job {i}", "description": "engineer with " + " ".join(rng.choice(skills, 4))}
+            for i in range(200)
+        ]
+        self.resume = {"skills": {"all_skills": ["Python", "AWS", "Docker"]}}
+
+    def test_scores_are_cosine_similarities(self):
+        matcher = EmbeddingMatcher(embed=embed)
+        matcher.preprocess_job_descriptions(self.jobs)
+        self.assertEqual(matcher.job_vectors.dtype, np.float32)
+
+        query = np.mean([word_vector(w) for w in "Python AWS Docker".split()], axis=0)
+        expected = []
+        for i, job in enumerate(self.jobs):
+            vector = np.mean([word_vector(w) for w in job["description"].split()], axis=0)
+            expected.append(vector @ query / np.linalg.norm(vector) / np.linalg.norm(query))
+        top = matcher.match_resume(self.resume, top_k=10)
+        self.assertEqual([match.index for match in top], list(np.argsort(-np.array(expected), kind="stable")[:10]))
+        np.testing.assert_allclose([match.score for match in top], sorted(expected, reverse=True)[:10], rtol=1e-5)
+
+        full = matcher.match_resume(self.resume)
+        self.assertEqual([job["job_id"] for job in full[:10]], [match["job_id"] for match in top])
+
+    def test_only_new_jobs_are_embedded(self):
+        matcher = EmbeddingMatcher(embed=embed)
+        matcher.preprocess_job_descriptions(self.jobs[:150])
+        matcher.add_jobs(self.jobs[150:])
+        matcher.remove_jobs(["3", "160"])
+        before = embed.calls
+        top = matcher.match_resume(self.resume, top_k=5)
+        self.assertEqual(embed.calls - before, 49 + 1)  # added jobs that are still indexed, then the resume
+
+        fresh = EmbeddingMatcher(embed=embed)
+        fresh.preprocess_job_descriptions([job for job in self.jobs if job["job_id"] not in ("3", "160")])
+        self.assertEqual([dict(m) for m in top], [dict(m) for m in fresh.match_resume(self.resume, top_k=5)])
+
+    def test_ann_matches_exact_when_probing_every_list(self):
+        exact = EmbeddingMatcher(embed=embed)
+        exact.preprocess_job_descriptions(self.jobs)
+        ann = EmbeddingMatcher(embed=embed, ann=True, ann_lists=8, ann_probe=8, ann_min_jobs=0)
+        ann.preprocess_job_descriptions(self.jobs)
+        self.assertIsNotNone(ann.ann_index)
+        self.assertEqual([m.index for m in ann.match_resume(self.resume, top_k=10)],
+                         [m.index for m in exact.match_resume(self.resume, top_k=10)])
+
+    def test_sharded_matches_exact(self):
+        exact = EmbeddingMatcher(embed=embed)
+        exact.preprocess_job_descriptions(self.jobs)
+        sharded = EmbeddingMatcher(embed=embed, shards=4)
+        sharded.preprocess_job_descriptions(self.jobs)
+        self.assertEqual([(m.index, m.score) for m in sharded.match_resume(self.resume, top_k=10)],
+                         [(m.index, m.score) for m in exact.match_resume(self.resume, top_k=10)])
+
+    def test_ivf_recall(self):
+        # Clustered unit vectors, as job embeddings of similar postings are
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((50, 64))
+        vectors = (centers[rng.integers(0, 50, 20000)] + 0.3 * rng.standard_normal((20000, 64))).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index = IVFIndex(vectors, n_lists=100, n_probe=10)
+
+        recall = []
+        for query in vectors[rng.integers(0, 20000, 50)]:
+            exact = set(np.argsort(-(vectors @ query))[:10])
+            recall.append(len(exact & set(index.search(query, 10)[0])) / 10)
+        self.assertGreater(np.mean(recall), 0.9)
+
+if __name__ == "__main__":
+    unittest.main()
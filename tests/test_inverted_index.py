@@ -0,0 +1,79 @@
+import unittest
+import math
+import tempfile
+import numpy as np
+from models.job_matcher import JobMatcher
+
+class TestInvertedIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.words = [f"term{i}" for i in range(2000)]
+        self.jobs = [
+            {"job_id": str(i), "description": " ".join(self.words[j] for j in np.minimum(rng.zipf(1.3, 50), 2000) - 1)}
+            for i in range(3000)
+        ]
+        self.resumes = [
+            {"skills": {"all_skills": list(rng.choice(self.words[:500], rng.integers(1, 25)))}}
+            for _ in range(50)
+        ]
+
+    def test_matches_dense_retrieval(self):
+        for hashed in (False, True):
+            for scoring in ("tfidf", "bm25"):
+                dense = JobMatcher(hashed=hashed, scoring=scoring)
+                dense.preprocess_job_descriptions(self.jobs)
+                inverted = JobMatcher(hashed=hashed, scoring=scoring, retrieval="inverted")
+                inverted.preprocess_job_descriptions(self.jobs)
+                skipped = 0
+                for resume in self.resumes:
+                    for k in (1, 10, 100):
+                        expected = [(m.index, m.score) for m in dense.match_resume(resume, top_k=k)]
+                        self.assertEqual([(m.index, m.score) for m in inverted.match_resume(resume, top_k=k)], expected)
+                        stats = inverted._inverted.last_stats
+                        skipped += stats["postings"] - stats["scanned"]
+                # MaxScore left some postings unscanned
+                self.assertGreater(skipped, 0)
+
+    def test_rare_terms_fill_with_zero_scores(self):
+        matcher = JobMatcher(retrieval="inverted")
+        matcher.preprocess_job_descriptions(self.jobs)
+        dense = JobMatcher()
+        dense.preprocess_job_descriptions(self.jobs)
+        resume = {"skills": {"all_skills": [self.words[1999], "unknownterm"]}}
+        self.assertEqual([(m.index, m.score) for m in matcher.match_resume(resume, top_k=20)],
+                         [(m.index, m.score) for m in dense.match_resume(resume, top_k=20)])
+        # Per-query buffers are left clean for the next query
+        self.assertFalse(matcher._inverted._scores.any() or matcher._inverted._seen.any())
+
+    def test_bm25_weights(self):
+        jobs = [
+            {"job_id": "a", "description": "python python python developer role with docker"},
+            {"job_id": "b", "description": "java developer role building backend services"},
+            {"job_id": "c", "description": "python data scientist role with pandas"},
+        ]
+        matcher = JobMatcher(scoring="bm25")
+        matcher.preprocess_job_descriptions(jobs)
+        # Stop words ("with") are dropped; lengths are counted in indexed terms
+        lengths = [6, 6, 5]
+        average = sum(lengths) / 3
+        idf = math.log1p((3 - 2 + 0.5) / (2 + 0.5))
+        expected = idf * 3 * 2.2 / (3 + 1.2 * (0.25 + 0.75 * lengths[0] / average))
+        column = matcher.vectorizer.vocabulary_["python"]
+        self.assertAlmostEqual(matcher.job_vectors[0, column], expected)
+
+        top = matcher.match_resume({"skills": {"all_skills": ["Python", "Python"]}}, top_k=3)
+        self.assertEqual([m["job_id"] for m in top], ["a", "c", "b"])
+        self.assertEqual(top[2].score, 0)
+
+        with tempfile.TemporaryDirectory() as path:
+            matcher.save(path)
+            loaded = JobMatcher.load(path, retrieval="inverted")
+            self.assertEqual(loaded.scoring, "bm25")
+            self.assertEqual([dict(m) for m in loaded.match_resume({"skills": {"all_skills": ["python"]}}, top_k=3)],
+                             [dict(m) for m in top])
+
+        with self.assertRaises(ValueError):
+            JobMatcher(scoring="bm42")
+
+if __name__ == "__main__":
+    unittest.main()
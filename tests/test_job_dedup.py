@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from models.job_dedup import JobDeduplicator
+
+def jaccard(a, b, dedup):
+    a, b = set(dedup._shingle_hashes(a)), set(dedup._shingle_hashes(b))
+    return len(a & b) / len(a | b)
+
+class TestJobDeduplicator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        words = [f"word{i}" for i in range(2000)]
+        self.jobs = []
+        for i in range(300):
+            description = " ".join(rng.choice(words, 60))
+            self.jobs.append({"job_id": str(i), "title": f"Role {i}", "description": description,
+                              "date_posted": "2025-04-01", "salary_min": None})
+        # Reposts of job 0 by agencies: same text with a different sign-off, a later date, a salary
+        base = self.jobs[0]["description"]
+        self.jobs.append(dict(self.jobs[0], job_id="r1", description=base + " apply via agency", date_posted="2025-04-03"))
+        self.jobs.append(dict(self.jobs[0], job_id="r2", description=base + " apply now", date_posted="2025-04-03", salary_min=90000))
+        self.jobs.append(dict(self.jobs[0], job_id="r3", location="Remote"))
+        # Related but different: half of the text replaced
+        self.jobs.append(dict(self.jobs[1], job_id="half", description=" ".join(base.split()[:30] + list(rng.choice(words, 30)))))
+
+    def test_clusters_near_duplicates_only(self):
+        dedup = JobDeduplicator()
+        clusters = [sorted(self.jobs[i]["job_id"] for i in cluster) for cluster in dedup.clusters(self.jobs)]
+        self.assertIn(sorted(["0", "r1", "r2", "r3"]), clusters)
+        self.assertIn(["half"], clusters)
+        self.assertEqual(len(clusters), len(self.jobs) - 3)
+        # Banding keeps comparisons far below all pairs
+        self.assertLess(dedup.report["compared_pairs"], len(self.jobs) * 2)
+
+    def test_bucket_mates_merge_without_the_first_member(self):
+        # All three share the first band; only the last two are near-duplicates
+        dedup = JobDeduplicator(num_perm=8, bands=2)
+        signatures = [np.array(s, dtype=np.uint64) for s in
+                      ([1, 1, 1, 1, 9, 9, 9, 9], [1, 1, 1, 1, 2, 2, 2, 2], [1, 1, 1, 1, 2, 2, 2, 3])]
+        dedup.signatures = lambda texts: signatures
+        self.assertEqual(sorted(dedup.clusters(self.jobs[:3])), [[0], [1, 2]])
+
+    def test_canonical_posting_and_report(self):
+        dedup = JobDeduplicator()
+        kept = dedup.deduplicate(self.jobs)
+        ids = [job["job_id"] for job in kept]
+        # Most recent, then with a salary
+        self.assertEqual(ids[-2:], ["r2", "half"])
+        self.assertNotIn("0", ids)
+        self.assertEqual(dedup.report["removed"], 3)
+        self.assertAlmostEqual(dedup.report["reduction"], 3 / len(self.jobs))
+
+    def test_signature_estimates_jaccard(self):
+        dedup = JobDeduplicator(num_perm=256, bands=32)
+        a = self.jobs[0]["description"]
+        b = " ".join(a.split()[:45] + self.jobs[5]["description"].split()[:15])
+        sa, sb = dedup.signatures([a, b])
+        self.assertAlmostEqual(np.mean(sa == sb), jaccard(a, b, dedup), delta=0.1)
+        self.assertEqual(dedup.signatures([""]), [None])
+
+if __name__ == "__main__":
+    unittest.main()
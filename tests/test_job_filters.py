@@ -0,0 +1,93 @@
+import unittest
+import datetime
+import numpy as np
+from models.job_filters import JobFilterIndex
+from models.job_matcher import JobMatcher
+
+def brute_force(jobs, filters):
+    rows = []
+    for row, job in enumerate(jobs):
+        location = (job.get("location") or "").lower()
+        parts = {location} | {part.strip() for part in location.split(",")}
+        if "location" in filters and filters["location"].lower() not in parts:
+            continue
+        if "category" in filters and (job.get("category") or "").lower() not in [c.lower() for c in filters["category"]]:
+            continue
+        low = job.get("salary_min", job.get("salary_max"))
+        high = job.get("salary_max", low)
+        if "min_salary" in filters and (high is None or high < filters["min_salary"]):
+            continue
+        if "max_salary" in filters and (low is None or low > filters["max_salary"]):
+            continue
+        if "posted_after" in filters and (not job.get("date_posted") or job["date_posted"][:10] < filters["posted_after"]):
+            continue
+        rows.append(row)
+    return rows
+
+class TestJobFilters(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        locations = ["Remote", "New York, NY", "Austin, TX", "Seattle, WA", "Rare Town, VT", None]
+        categories = ["IT Jobs", "Engineering Jobs", "Sales Jobs", None]
+        skills = ["python", "java", "aws", "docker", "react", "sql", "excel", "figma"]
+        self.jobs = []
+        for i in range(2000):
+            job = {
+                "job_id": str(i),
+                "title": f"Job {i}",
+                "description": "role using " + " ".join(rng.choice(skills, 3)),
+                "location": locations[rng.integers(0, 5)] if i % 97 else locations[-1],
+                "category": categories[rng.integers(0, len(categories))],
+            }
+            if i % 7:
+                job["salary_min"] = int(rng.integers(30, 150)) * 1000
+            if i % 5:
+                job["salary_max"] = job.get("salary_min", 60000) + int(rng.integers(0, 40)) * 1000
+            if i % 11:
+                job["date_posted"] = str(np.datetime64("2025-01-01") + int(rng.integers(0, 200))) + "T10:00:00Z"
+            self.jobs.append(job)
+        self.index = JobFilterIndex(self.jobs)
+
+    def test_rows_match_brute_force(self):
+        queries = [
+            {"location": "Remote"},
+            {"location": "ny"},
+            {"location": "Rare Town, VT"},
+            {"category": ["IT Jobs", "engineering jobs"]},
+            {"min_salary": 120000},
+            {"max_salary": 50000, "location": "TX"},
+            {"min_salary": 80000, "max_salary": 90000, "posted_after": "2025-06-01"},
+            {"posted_after": "2025-07-15", "category": ["Sales Jobs"], "location": "Seattle"},
+            {"location": "Nowhere"},
+        ]
+        for filters in queries:
+            self.assertEqual(list(self.index.rows(filters)), brute_force(self.jobs, filters), filters)
+
+    def test_posted_within_days(self):
+        today = datetime.date.today()
+        jobs = [{"date_posted": str(today - datetime.timedelta(days=d))} for d in (0, 3, 10, 40)] + [{}]
+        self.assertEqual(list(JobFilterIndex(jobs).rows({"posted_within_days": 10})), [0, 1, 2])
+
+    def test_unknown_filter(self):
+        with self.assertRaises(ValueError):
+            self.index.rows({"remote": True})
+
+    def test_filtered_match_resume(self):
+        matcher = JobMatcher()
+        matcher.preprocess_job_descriptions(self.jobs)
+        resume_data = {"skills": {"all_skills": ["Python", "AWS"]}}
+        filters = {"location": "Remote", "min_salary": 90000}
+        allowed = {self.jobs[row]["job_id"] for row in brute_force(self.jobs, filters)}
+
+        full = [job for job in matcher.match_resume(resume_data) if job["job_id"] in allowed]
+        self.assertEqual(matcher.match_resume(resume_data, filters=filters), full)
+        top = matcher.match_resume(resume_data, top_k=10, filters=filters)
+        self.assertEqual([dict(match) for match in top], full[:10])
+
+        # The index follows removals
+        matcher.remove_jobs([full[0]["job_id"]])
+        self.assertEqual([match["job_id"] for match in matcher.match_resume(resume_data, top_k=9, filters=filters)],
+                         [job["job_id"] for job in full[1:10]])
+
+if __name__ == "__main__":
+    unittest.main()
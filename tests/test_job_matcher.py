@@ -1,7 +1,9 @@
 import unittest
 import os
 import json
+import tempfile
 from collections import Counter
+import numpy as np
 from models.job_matcher import JobMatcher
 
 class TestJobMatcher(unittest.TestCase):
@@ -301,5 +303,159 @@ class TestJobMatcher(unittest.TestCase):
 
         self.assertEqual(len(failed), 0, f"Some resumes failed to match: {failed}")
 
+    def test_incremental_hashed_index_matches_refit(self):
+        resume_data = {"skills": {"all_skills": ["Python", "Docker", "AWS", "PostgreSQL", "React"]},
+                       "experience": [{"title": "Backend Engineer", "company": "Acme", "description": "REST APIs and data pipelines"}]}
+
+        hashed = JobMatcher(hashed=True)
+        hashed.preprocess_job_descriptions(self.job_descriptions[:12])
+        self.assertEqual(hashed.add_jobs(self.job_descriptions[12:]), 8)
+        self.assertEqual(hashed.remove_jobs(["mock002", "https://mockjob.com/job/007", "unknown"]), 2)
+        replaced = dict(self.job_descriptions[4], description="Kubernetes, Helm and AWS infrastructure automation.")
+        hashed.add_jobs([replaced])
+        hashed.match_resume(resume_data)  # refresh, then keep changing the index
+        hashed.remove_jobs(["mock019"])
+
+        remaining = [job for job in self.job_descriptions if job["job_id"] not in ("mock002", "mock005", "mock007", "mock019")]
+        refit = JobMatcher()
+        refit.preprocess_job_descriptions(remaining + [replaced])
+
+        expected = {job["job_id"]: job["similarity"] for job in refit.match_resume(resume_data)}
+        actual = {job["job_id"]: job["similarity"] for job in hashed.match_resume(resume_data)}
+        self.assertEqual(actual.keys(), expected.keys())
+        for job_id, score in expected.items():
+            self.assertAlmostEqual(actual[job_id], score, places=6)
+        self.assertEqual(hashed.jobs[-1]["description"], replaced["description"])
+
+    def test_duplicate_keys_in_one_batch_keep_the_last_job(self):
+        first = dict(self.job_descriptions[0], description="Java and Spring backend services.")
+        last = dict(self.job_descriptions[0], description="Python and Django web development.")
+        for hashed in (True, False):
+            matcher = JobMatcher(hashed=hashed)
+            matcher.preprocess_job_descriptions([first] + self.job_descriptions[1:5] + [last])
+            self.assertEqual(len(matcher.jobs), 5)
+            self.assertEqual(matcher.jobs[-1]["description"], last["description"])
+            self.assertEqual(matcher.add_jobs([first, last]), 1)
+            self.assertEqual(len(matcher.jobs), 5)
+            # No stale row is left behind for the key
+            self.assertEqual(matcher.remove_jobs([first["job_id"]]), 1)
+            self.assertNotIn(first["job_id"], [job["job_id"] for job in matcher.jobs])
+
+    def test_top_k_matches_full_ranking(self):
+        resume_data = {"skills": {"all_skills": ["Python", "AWS"]}}
+        full = self.matcher.match_resume(resume_data)
+        for k in (1, 5, 20, 50):
+            top = self.matcher.match_resume(resume_data, top_k=k)
+            # Most jobs score 0, so this also checks ties are broken like the full sort
+            self.assertEqual([dict(match) for match in top], full[:k])
+        self.assertEqual(top[0]["similarity"], top[0].score)
+        self.assertEqual(top[0]["title"], self.matcher.jobs[top[0].index]["title"])
+
+    def test_match_many_matches_match_resume(self):
+        resumes = []
+        for file_name in sorted(self.resume_files):
+            with open(os.path.join(self.resume_dir, file_name)) as f:
+                resumes.append(json.load(f))
+        resumes.append({"skills": {"all_skills": []}})
+
+        # Small batches and job chunks exercise the merge across chunks
+        results = list(self.matcher.match_many(resumes, top_k=5, batch_size=7, chunk_size=6))
+        self.assertEqual(len(results), len(resumes))
+        self.assertEqual(results[-1], [])
+        for resume_data, matches in zip(resumes, results):
+            if not self.matcher._create_resume_text(resume_data):
+                self.assertEqual(matches, [])
+                continue
+            expected = self.matcher.match_resume(resume_data, top_k=5)
+            self.assertEqual([(m.index, m.score) for m in matches], [(m.index, m.score) for m in expected])
+
+    def test_saved_index_round_trip(self):
+        resume_data = {"skills": {"all_skills": ["Python", "Docker", "AWS", "Terraform"]}}
+        for hashed in (False, True):
+            matcher = JobMatcher(hashed=hashed)
+            matcher.preprocess_job_descriptions(self.job_descriptions)
+            expected = matcher.match_resume(resume_data)
+
+            with tempfile.TemporaryDirectory() as path:
+                matcher.save(path)
+                for mmap in (True, False):
+                    loaded = JobMatcher.load(path, mmap=mmap)
+                    self.assertEqual(loaded.match_resume(resume_data), expected)
+                    self.assertEqual(loaded.job_vectors.data.flags.writeable, not mmap)
+
+                # A loaded index can keep changing and be saved again
+                loaded = JobMatcher.load(path)
+                loaded.remove_jobs(["mock005"])
+                loaded.add_jobs([dict(self.job_descriptions[4], job_id="mock021")])
+                loaded.save(path)
+                reloaded = JobMatcher.load(path)
+                self.assertEqual(len(reloaded.jobs), len(self.job_descriptions))
+                self.assertEqual(reloaded.jobs[-1]["job_id"], "mock021")
+                self.assertEqual(reloaded.match_resume(resume_data)[0]["title"], expected[0]["title"])
+
+                with open(os.path.join(path, "meta.json"), "w") as f:
+                    json.dump({"format": "jobfinity-job-index", "version": 99}, f)
+                with self.assertRaises(ValueError):
+                    JobMatcher.load(path)
+
+    def test_compact_index(self):
+        resume_data = {"skills": {"all_skills": ["Python", "Docker", "AWS", "Terraform"]}}
+        for hashed in (False, True):
+            full = JobMatcher(hashed=hashed)
+            full.preprocess_job_descriptions(self.job_descriptions)
+            compact = JobMatcher(hashed=hashed, compact=True)
+            compact.preprocess_job_descriptions(self.job_descriptions)
+
+            self.assertEqual(compact.job_vectors.dtype, np.float32)
+            self.assertEqual(compact.job_vectors.indices.dtype, np.int32)
+            self.assertNotIn("description", compact.jobs[0])
+            self.assertIn("description", self.job_descriptions[0])
+            expected = full.match_resume(resume_data, top_k=10)
+            actual = compact.match_resume(resume_data, top_k=10)
+            self.assertEqual([m.index for m in actual], [m.index for m in expected])
+            np.testing.assert_allclose([m.score for m in actual], [m.score for m in expected], rtol=1e-5)
+
+            report, compact_report = full.memory_report(), compact.memory_report()
+            self.assertEqual(compact_report["total"], sum(v for k, v in compact_report.items() if k != "total"))
+            self.assertLess(compact_report["job_vectors"], report["job_vectors"])
+            self.assertLess(compact_report["jobs"], report["jobs"])
+
+            with tempfile.TemporaryDirectory() as path:
+                compact.save(path)
+                loaded = JobMatcher.load(path)
+                self.assertTrue(loaded.compact)
+                self.assertEqual([m.index for m in loaded.match_resume(resume_data, top_k=10)], [m.index for m in actual])
+
+        # Hashed compact indexes keep changing incrementally; vocabulary ones would need the descriptions
+        compact.remove_jobs(["mock005"])
+        self.assertEqual(len(compact.jobs), len(self.job_descriptions) - 1)
+        compact = JobMatcher(compact=True)
+        compact.preprocess_job_descriptions(self.job_descriptions)
+        with self.assertRaises(ValueError):
+            compact.add_jobs([dict(self.job_descriptions[0], job_id="mock021")])
+        with self.assertRaises(ValueError):
+            compact.job_descriptions
+
+    def test_sharded_search_matches_single_scorer(self):
+        resume_data = {"skills": {"all_skills": ["Python", "AWS"]}}
+        expected = [dict(m) for m in self.matcher.match_resume(resume_data, top_k=20)]
+        for executor in ("thread", "process"):
+            matcher = JobMatcher(shards=3, shard_executor=executor)
+            matcher.preprocess_job_descriptions(self.job_descriptions)
+            for k in (1, 5, 20):
+                # Shards hold 6-7 jobs, so k=20 also merges shards shorter than k
+                self.assertEqual([dict(m) for m in matcher.match_resume(resume_data, top_k=k)], expected[:k])
+
+            # Changing the jobs rebuilds the shards
+            matcher.remove_jobs([expected[0]["job_id"]])
+            single = JobMatcher()
+            single.preprocess_job_descriptions([job for job in self.job_descriptions if job["job_id"] != expected[0]["job_id"]])
+            self.assertEqual([dict(m) for m in matcher.match_resume(resume_data, top_k=5)],
+                             [dict(m) for m in single.match_resume(resume_data, top_k=5)])
+            matcher._close_scorer()
+
+        with self.assertRaises(ValueError):
+            JobMatcher(shards=2, shard_executor="gpu")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import threading
+import numpy as np
+from models.job_matcher import JobMatcher
+from models.match_batcher import MatchBatcher
+from models.match_cache import MatchCache
+
+class TestMatchBatcher(unittest.TestCase):
+    def setUp(self):
+        skills = ["python", "java", "aws", "docker", "react", "sql", "spark", "kubernetes", "figma", "excel"]
+        rng = np.random.default_rng(3)
+        self.jobs = [
+            {"job_id": str(i), "title": f"Job {i}", "location": "Austin, TX" if i % 2 else "Remote",
+             "description": "engineer with " + " ".join(rng.choice(skills, 4))}
+            for i in range(300)
+        ]
+        self.resumes = [{"skills": {"all_skills": list(rng.choice(skills, 3))}} for _ in range(40)]
+
+    def concurrent(self, batcher, requests):
+        results = [None] * len(requests)
+        start = threading.Barrier(len(requests))
+
+        def call(i, resume, top_k, filters):
+            start.wait()
+            try:
+                results[i] = batcher.match_resume(resume, top_k=top_k, filters=filters)
+            except ValueError as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=call, args=(i, *request)) for i, request in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_requests_are_batched(self):
+        matcher = JobMatcher()
+        matcher.preprocess_job_descriptions(self.jobs)
+        batcher = MatchBatcher(matcher, window=0.05, max_batch=16)
+        requests = [(resume, 5 + i % 3 * 10, None) for i, resume in enumerate(self.resumes)]
+        requests[3] = ({"skills": {"all_skills": []}}, 5, None)
+        requests[7] = (self.resumes[7], 10, {"location": "Remote"})
+        results = self.concurrent(batcher, requests)
+
+        self.assertIsInstance(results[3], ValueError)
+        for (resume, top_k, filters), matches in zip(requests, results):
+            if resume is requests[3][0]:
+                continue
+            expected = matcher.match_resume(resume, top_k=top_k, filters=filters)
+            self.assertEqual([m.index for m in matches], [m.index for m in expected])
+            np.testing.assert_allclose([m.score for m in matches], [m.score for m in expected])
+        stats = batcher.stats()
+        self.assertEqual(stats["requests"], len(requests))
+        self.assertLess(stats["batches"], len(requests))
+        self.assertLessEqual(stats["mean_batch"], 16)
+
+    def test_results_go_through_match_cache(self):
+        matcher = JobMatcher(match_cache=MatchCache())
+        matcher.preprocess_job_descriptions(self.jobs)
+        batcher = MatchBatcher(matcher, window=0)
+        top = batcher.match_resume(self.resumes[0], top_k=10)
+        self.assertEqual([dict(m) for m in matcher.match_resume(self.resumes[0], top_k=10)], [dict(m) for m in top])
+        self.assertEqual(matcher.match_cache.stats()["hits"], 1)
+        self.assertEqual([dict(m) for m in batcher.match_resume(self.resumes[0], top_k=10)], [dict(m) for m in top])
+        self.assertEqual(matcher.match_cache.stats()["hits"], 2)
+
+        with self.assertRaises(ValueError):
+            batcher.submit(self.resumes[0], top_k=None)
+        with self.assertRaises(ValueError):
+            MatchBatcher(matcher, max_batch=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import json
+from models.job_matcher import JobMatcher
+from models.match_cache import MatchCache
+
+class TestMatchCache(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), "sample_jobs.json")) as f:
+            self.jobs = json.load(f)
+        self.resume = {"skills": {"all_skills": ["Python", "Docker", "AWS"]}}
+
+    def test_lru_eviction_by_bytes(self):
+        cache = MatchCache(max_bytes=100)
+        cache.set("a", [1], 40)
+        cache.set("b", [2], 40)
+        self.assertEqual(cache.get("a"), [1])  # "b" is now the least recently used
+        cache.set("c", [3], 40)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), [3])
+        cache.set("huge", [4], 101)
+        self.assertIsNone(cache.get("huge"))
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (2, 2, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual((stats["entries"], stats["bytes"]), (2, 80))
+
+    def test_matcher_serves_repeats_from_cache(self):
+        matcher = JobMatcher(match_cache=MatchCache())
+        matcher.preprocess_job_descriptions(self.jobs)
+        uncached = JobMatcher()
+        uncached.preprocess_job_descriptions(self.jobs)
+
+        top = matcher.match_resume(self.resume, top_k=3)
+        self.assertEqual([dict(m) for m in top], [dict(m) for m in uncached.match_resume(self.resume, top_k=3)])
+        matcher._search = None  # a repeat must not score again
+        self.assertEqual([dict(m) for m in matcher.match_resume(self.resume, top_k=3)], [dict(m) for m in top])
+        # Case and spacing don't change a TF-IDF match
+        self.assertEqual(matcher.match_resume({"skills": {"all_skills": ["python", "docker ", "AWS"]}}, top_k=3), top)
+
+        full = matcher.match_resume(self.resume)
+        full[0]["title"] = "changed"
+        self.assertNotEqual(matcher.match_resume(self.resume)[0]["title"], "changed")
+        self.assertEqual(matcher.match_cache.stats()["hits"], 3)
+        del matcher._search
+
+    def test_changing_jobs_invalidates(self):
+        matcher = JobMatcher(hashed=True, match_cache=MatchCache())
+        matcher.preprocess_job_descriptions(self.jobs[:4])
+        before = matcher.match_resume(self.resume, top_k=10)
+        generation = matcher.generation
+
+        matcher.add_jobs(self.jobs[4:])
+        after = matcher.match_resume(self.resume, top_k=10)
+        self.assertGreater(matcher.generation, generation)
+        self.assertEqual(len(after), len(self.jobs))
+        self.assertNotEqual(len(before), len(after))
+        self.assertEqual(matcher.match_cache.stats()["hits"], 0)
+        self.assertEqual(matcher.match_cache.stats()["entries"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import os
+import time
+import tempfile
+import threading
+from models.parse_supervisor import ParseSupervisor
+from models.resume_cache import ResumeCache
+
+class FakeParser:
+    # Stands in for ResumeParser: the supervisor only needs parse() and the preloaded models
+    skill_nlp = None
+    skill_matcher = None
+    cache = None
+    max_bytes = 1024
+    fingerprint = "fake"
+
+    def _pool_payload(self, file):
+        return file
+
+    def parse(self, data):
+        if data == b"hang":
+            time.sleep(60)
+        if data == b"bloat":
+            hog = []
+            while True:
+                hog.append(bytearray(16 * 1024 * 1024))
+                time.sleep(0.01)
+        if data == b"crash":
+            os._exit(3)
+        if data == b"bad":
+            raise ValueError("Unsupported resume format.")
+        return {"size": len(data), "cached": self.cache is not None} if data.startswith(b"c") else {"size": len(data)}
+
+class TestParseSupervisor(unittest.TestCase):
+    def setUp(self):
+        self.supervisor = ParseSupervisor(FakeParser(), workers=2, timeout=1.0, max_rss=64 * 1024 * 1024)
+
+    def tearDown(self):
+        self.supervisor.close()
+
+    def test_results_in_input_order(self):
+        files = [b"a" * n for n in range(1, 8)] + [b"bad"]
+        results = list(self.supervisor.parse_many(files))
+        self.assertEqual([r["file"] for r in results], files)
+        self.assertEqual([r["data"] for r in results[:-1]], [{"size": n} for n in range(1, 8)])
+        self.assertEqual(results[-1]["status"], "error")
+        self.assertIn("ValueError", results[-1]["error"])
+        self.assertEqual(self.supervisor.respawns, 0)
+
+    def test_offenders_are_killed_and_replaced(self):
+        start = time.monotonic()
+        results = list(self.supervisor.parse_many([b"hang", b"ok", b"bloat", b"crash", b"ok"]))
+        self.assertLess(time.monotonic() - start, 20)
+        self.assertEqual([r["status"] for r in results], ["timeout", "ok", "oom", "error", "ok"])
+        self.assertEqual(self.supervisor.respawns, 3)
+        self.assertEqual(self.supervisor.parse(b"again")["data"], {"size": 5})
+
+    def test_abandoned_run_does_not_leak_results(self):
+        results = self.supervisor.parse_many([b"x", b"hang", b"hang"])
+        self.assertEqual(next(results)["data"], {"size": 1})
+        results.close()
+        self.assertEqual(self.supervisor.parse(b"yy")["data"], {"size": 2})
+
+    def test_concurrent_callers_get_their_own_results(self):
+        # Streamlit sessions share one supervisor
+        inputs = {caller: [bytes([65 + caller]) * n for n in range(1, 11)] for caller in range(4)}
+        results = {}
+
+        def call(caller):
+            results[caller] = list(self.supervisor.parse_many(inputs[caller]))
+
+        threads = [threading.Thread(target=call, args=(caller,)) for caller in inputs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for caller, files in inputs.items():
+            self.assertEqual([r["file"] for r in results[caller]], files)
+            self.assertEqual([r["data"] for r in results[caller]], [{"size": n} for n in range(1, 11)])
+        self.assertEqual(self.supervisor.respawns, 0)
+
+    def test_cache_is_shared_by_the_pool(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parser = FakeParser()
+            parser.cache = ResumeCache(tmp_dir)
+            with ParseSupervisor(parser, workers=2, timeout=1.0) as supervisor:
+                self.assertEqual(supervisor.parse(b"cv")["data"], {"size": 2, "cached": False})
+                self.assertEqual(parser.cache.stats()["misses"]["result"], 1)
+                # A respawned worker forked before the result was cached; the lookup is the parent's
+                self.assertEqual(supervisor.parse(b"crash")["status"], "error")
+                results = list(supervisor.parse_many([b"cv", b"cv"]))
+                self.assertEqual([r["data"] for r in results], [{"size": 2, "cached": False}] * 2)
+                self.assertEqual(parser.cache.stats()["hits"]["result"], 2)
+                # Over max_bytes: left to the worker (ResumeParser raises there) and not cached
+                supervisor.parse(b"c" * 2048)
+                self.assertEqual(parser.cache.stats()["entries"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+from models.pdf_backends import PDF_BACKENDS, AutoBackend, PdfBackend, get_pdf_backend, is_usable
+from models.resume_parser import ResumeParser
+
+class StaticBackend(PdfBackend):
+    def __init__(self, name, pages=None, error=None):
+        self.name = name
+        self.pages = pages
+        self.error = error
+        self.extracted = 0
+
+    def iter_pages(self, file, max_pages=0):
+        if self.error:
+            raise self.error
+        for page in self.pages:
+            self.extracted += 1
+            yield page
+
+class TestPdfBackends(unittest.TestCase):
+    def setUp(self):
+        resume_dir = os.path.join(os.path.dirname(__file__), "../data/sample_resumes/data/data/INFORMATION-TECHNOLOGY")
+        self.path = os.path.join(resume_dir, sorted(f for f in os.listdir(resume_dir) if f.endswith(".pdf"))[0])
+        self.text = "Software Engineer at Acme Corp (2019 - 2021)\nSkills\nPython, SQL\n"
+
+    def test_every_backend_extracts_lines(self):
+        for name in PDF_BACKENDS:
+            with open(self.path, "rb") as file:
+                pages = list(get_pdf_backend(name).iter_pages(file, max_pages=1))
+            self.assertEqual(len(pages), 1, name)
+            self.assertTrue(is_usable(pages[0]), name)
+            self.assertIn("Summary\n", pages[0], name)
+
+    def test_is_usable(self):
+        self.assertTrue(is_usable(self.text))
+        self.assertFalse(is_usable("\f\n  \f"))
+        self.assertFalse(is_usable("(cid:12)(cid:7)(cid:31) " * 20))
+        self.assertFalse(is_usable("�" * 10 + self.text))
+        self.assertFalse(is_usable(self.text.replace(" ", "").replace("\n", "") * 3))
+
+    def test_auto_falls_back(self):
+        good = StaticBackend("good", [self.text])
+        with open(self.path, "rb") as file:
+            for first in (StaticBackend("empty", ["\f"]), StaticBackend("broken", error=ValueError("bad xref"))):
+                auto = AutoBackend([first, good])
+                self.assertEqual(list(auto.iter_pages(file)), [self.text])
+                self.assertEqual(auto.chosen, {"good": 1})
+
+            auto = AutoBackend([good, StaticBackend("unused", error=AssertionError("not reached"))])
+            self.assertEqual(list(auto.iter_pages(file)), [self.text])
+
+            # Nothing usable: the last output is returned rather than failing the upload
+            auto = AutoBackend([StaticBackend("empty", ["\f"]), StaticBackend("broken", error=ValueError())])
+            self.assertEqual(list(auto.iter_pages(file)), ["\f"])
+            with self.assertRaises(ValueError):
+                list(AutoBackend([StaticBackend("broken", error=ValueError())]).iter_pages(file))
+
+    def test_auto_streams_after_first_usable_pages(self):
+        # max_chars must stop extraction early on the default backend too
+        first = StaticBackend("empty", ["\f"] * 3)
+        good = StaticBackend("good", ["x\f", self.text] * 50)
+        parser = ResumeParser(max_pages=0, max_chars=len(self.text) * 2, pdf_backend=AutoBackend([first, good]))
+        with open(self.path, "rb") as file:
+            text = "".join(parser.iter_pdf_text(file))
+        self.assertEqual(len(text), len(self.text) * 2)
+        self.assertEqual(first.extracted, 3)
+        self.assertLess(good.extracted, 10)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_pdf_backend("tika")
+
+if __name__ == "__main__":
+    unittest.main()
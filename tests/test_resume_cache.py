@@ -0,0 +1,64 @@
+import unittest
+import io
+import tempfile
+from models.resume_cache import ResumeCache
+from models.resume_parser import ResumeParser
+
+class TestResumeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResumeCache(self.tmp_dir.name, max_bytes=1024)
+        self.result = {"skills": {"skills_by_category": {}, "all_skills": ["python"]}, "experience": [], "education": []}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_tiers_are_keyed_independently(self):
+        key = self.cache.key_for(b"%PDF-1.4 resume")
+        self.cache.set_text(key, "extract-v1", "Python developer")
+        self.cache.set_result(key, "parser-v1", self.result)
+
+        self.assertEqual(self.cache.get_text(key, "extract-v1"), "Python developer")
+        self.assertEqual(self.cache.get_result(key, "parser-v1"), self.result)
+        # A new parser fingerprint misses tier 2 but still reuses the extracted text
+        self.assertIsNone(self.cache.get_result(key, "parser-v2"))
+        self.assertEqual(self.cache.get_text(key, "extract-v1"), "Python developer")
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], {"text": 2, "result": 1})
+        self.assertEqual(stats["misses"], {"text": 0, "result": 1})
+
+    def test_lru_eviction_respects_size_bound(self):
+        keys = [self.cache.key_for(bytes([i])) for i in range(4)]
+        for key in keys[:3]:
+            self.cache.set_text(key, "v1", "x" * 300)
+        self.cache.get_text(keys[0], "v1")  # keys[1] is now least recently used
+        self.cache.set_text(keys[3], "v1", "x" * 300)
+
+        self.assertLessEqual(self.cache.stats()["bytes"], 1024)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIsNone(self.cache.get_text(keys[1], "v1"))
+        for key in (keys[0], keys[2], keys[3]):
+            self.assertIsNotNone(self.cache.get_text(key, "v1"))
+
+    def test_entries_survive_restart(self):
+        key = self.cache.key_for(b"resume")
+        self.cache.set_result(key, "v1", self.result)
+
+        reopened = ResumeCache(self.tmp_dir.name, max_bytes=1024)
+        self.assertEqual(reopened.stats()["entries"], 1)
+        self.assertEqual(reopened.get_result(key, "v1"), self.result)
+
+    def test_parser_serves_cached_result_and_fingerprints_skills(self):
+        parser = ResumeParser(cache=self.cache)
+        data = b"%PDF-1.4 not really parsed"
+        self.cache.set_result(self.cache.key_for(data), parser.fingerprint, self.result)
+
+        self.assertEqual(parser.parse_pdf(io.BytesIO(data)), self.result)
+
+        fingerprint = parser.fingerprint
+        parser.skills_db["tools"].append("Terraform")
+        self.assertNotEqual(parser.fingerprint, fingerprint)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
+import io
 import os
 import json
+import docx
 from models.resume_parser import ResumeParser
+from models.parse_supervisor import ParseSupervisor
 
 class TestResumeParser(unittest.TestCase):
     def setUp(self):
@@ -49,6 +52,81 @@ class TestResumeParser(unittest.TestCase):
 
         self.assertEqual(failed, 0, f"{failed} resume(s) failed to parse.")
 
+    def test_parse_many_matches_parse_pdf(self):
+        paths = [os.path.join(self.resume_dir, f) for f in sorted(self.resume_files)[:10]]
+        files = paths[:5] + [io.BytesIO(b"not a pdf")] + paths[5:]
+
+        results = list(self.parser.parse_many(files, batch_size=4))
+
+        self.assertEqual([r["file"] for r in results], files)
+        self.assertEqual(results[5]["status"], "error")
+        self.assertIsNone(results[5]["data"])
+        for path, result in zip(paths, results[:5] + results[6:]):
+            self.assertEqual(result["status"], "ok", result["error"])
+            with open(path, "rb") as f:
+                self.assertEqual(result["data"], self.parser.parse_pdf(f))
+
+    def test_parse_many_with_extract_workers(self):
+        paths = [os.path.join(self.resume_dir, f) for f in sorted(self.resume_files)[:6]]
+        files = paths + ["missing.pdf"]
+
+        serial = list(self.parser.parse_many(files))
+        pooled = list(self.parser.parse_many(files, extract_workers=2))
+
+        self.assertEqual([r["status"] for r in pooled], ["ok"] * 6 + ["error"])
+        self.assertEqual([r["data"] for r in pooled], [r["data"] for r in serial])
+
+    def test_supervised_parse_matches_parse_pdf(self):
+        files = [os.path.join(self.resume_dir, f) for f in sorted(self.resume_files)[:3]]
+        with ParseSupervisor(self.parser, workers=2) as supervisor:
+            results = list(supervisor.parse_many(files))
+        self.assertEqual([r["status"] for r in results], ["ok"] * 3)
+        for path, result in zip(files, results):
+            with open(path, "rb") as file:
+                self.assertEqual(result["data"], self.parser.parse_pdf(file))
+
+    def test_ingestion_budgets(self):
+        path = os.path.join(self.resume_dir, sorted(self.resume_files)[0])
+
+        parser = ResumeParser(max_pages=1, max_chars=500)
+        with open(path, "rb") as file:
+            pages = list(parser.iter_pdf_text(file))
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(len(pages[0]), 500)
+
+        parser = ResumeParser(max_bytes=1024)
+        with open(path, "rb") as file:
+            with self.assertRaises(ValueError):
+                parser.parse_pdf(file)
+
+    def test_in_memory_formats(self):
+        document = docx.Document()
+        document.add_paragraph("Experience")
+        document.add_paragraph("Software Engineer at Acme Corp (2019 - 2021)")
+        document.add_paragraph("Skills")
+        document.add_table(rows=1, cols=2).rows[0].cells[0].text = "Python"
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        path = os.path.join(self.resume_dir, sorted(self.resume_files)[0])
+        with open(path, "rb") as file:
+            pdf_bytes = file.read()
+
+        self.assertEqual(self.parser._detect_format(io.BytesIO(pdf_bytes)), "pdf")
+        self.assertEqual(self.parser._detect_format(io.BytesIO(buffer.getvalue())), "docx")
+        self.assertEqual(self.parser.parse(memoryview(pdf_bytes)), self.parser.parse_pdf(io.BytesIO(pdf_bytes)))
+
+        text = "".join(self.parser.iter_docx_text(io.BytesIO(buffer.getvalue())))
+        self.assertIn("Software Engineer at Acme Corp", text)
+        self.assertIn("Python", text)
+        result = self.parser.parse(buffer.getbuffer())
+        self.assertEqual(result["experience"][0]["company"], "Acme Corp")
+
+        with self.assertRaises(ValueError):
+            self.parser.parse(b"PK\x03\x04 not really a zip file")
+        with self.assertRaises(ValueError):
+            self.parser.parse(b"plain text resume")
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,86 @@
+import unittest
+import csv
+import os
+import random
+import re
+from models.resume_parser import ResumeParser
+from models.resume_sections import SectionIndex
+
+# Pre-segmenter extraction (whole-text DOTALL regexes), kept as the reference behaviour
+EXPERIENCE_SECTION_RE = re.compile(r'(Work Experience|Experience|Professional Experience)(.*?)(Education|Projects|Skills|$)', re.DOTALL | re.IGNORECASE)
+EXPERIENCE_ENTRY_RE = re.compile(r'(?P<title>.+?) at (?P<company>.+?) \((?P<dates>[\d\-– ]+)\)')
+EDUCATION_SECTION_RE = re.compile(r'(Education)(.*?)(Experience|Skills|Projects|$)', re.DOTALL | re.IGNORECASE)
+EDUCATION_ENTRY_RE = re.compile(r'(?P<degree>Bachelor|Master|PhD|Associate)[^,\n]* in (?P<field>[^,\n]*)[,\n]+(?P<school>[^\n]+)', re.IGNORECASE)
+
+def reference_experience(text):
+    section = EXPERIENCE_SECTION_RE.search(text)
+    section_text = section.group(2).strip() if section else text
+    return [{"title": t.strip(), "company": c.strip(), "dates": d.strip()}
+            for t, c, d in EXPERIENCE_ENTRY_RE.findall(section_text)]
+
+def reference_education(text):
+    section = EDUCATION_SECTION_RE.search(text)
+    section_text = section.group(2).strip() if section else text
+    return [{"degree": d.strip(), "field": f.strip(), "school": s.strip()}
+            for d, f, s in EDUCATION_ENTRY_RE.findall(section_text)]
+
+class TestResumeSections(unittest.TestCase):
+    def setUp(self):
+        self.parser = ResumeParser()
+        self.text = (
+            "Jane Doe\n"
+            "Professional Experience\n"
+            "Software Engineer at Acme Corp (2019 - 2021)\n"
+            "Intern at Globex at Night (2018) Analyst at Initech (2017)\n"
+            "Education\n"
+            "Bachelor of Science in Computer Science, State University\n"
+            "Master in Data Science\nTech Institute\n"
+            "Skills\nPython, SQL\n"
+        )
+
+    def test_section_spans(self):
+        index = SectionIndex(self.text)
+        self.assertEqual([name for _, _, name in index.headers], ["experience", "education", "skills"])
+        self.assertTrue(index.span("experience").startswith("Software Engineer"))
+        self.assertTrue(index.span("education").endswith("Tech Institute"))
+        self.assertIsNone(index.span("projects"))
+
+    def test_chunked_feed_matches_single_pass(self):
+        whole = SectionIndex(self.text)
+        for size in (1, 3, 7, 16):
+            index = SectionIndex()
+            for i in range(0, len(self.text), size):
+                index.feed(self.text[i:i + size])
+            self.assertEqual(index.headers, whole.headers)
+            self.assertEqual(index.span("education"), whole.span("education"))
+
+    def test_entries_match_reference(self):
+        self.assertEqual(self.parser._extract_experience(self.text), reference_experience(self.text))
+        self.assertEqual(self.parser._extract_education(self.text), reference_education(self.text))
+        self.assertEqual(len(self.parser._extract_experience(self.text)), 3)
+        self.assertEqual(len(self.parser._extract_education(self.text)), 2)
+        for text in ("Bachelor of Science In Computer Science, MIT", "MASTER IN CS\nStanford"):
+            self.assertEqual(len(self.parser._extract_education(text)), 1)
+            self.assertEqual(self.parser._extract_education(text), reference_education(text))
+
+    def test_entries_match_reference_on_random_text(self):
+        rng = random.Random(3)
+        pieces = [" at ", " (2019 - 2020)", " (x)", "Bachelor", "master", " in ", " In ", " IN ", ",", "\n", "Acme", " ", "PhD"]
+        for _ in range(2000):
+            text = "".join(rng.choices(pieces, k=rng.randint(1, 25)))
+            experience = [e for line in text.split("\n") for e in self.parser._experience_entries(line)]
+            self.assertEqual(experience, EXPERIENCE_ENTRY_RE.findall(text), text)
+            self.assertEqual(list(self.parser._education_entries(text)), EDUCATION_ENTRY_RE.findall(text), text)
+
+    def test_sample_resumes_match_reference(self):
+        path = os.path.join(os.path.dirname(__file__), "../data/sample_resumes/Resume/ResumeDataSet2.csv")
+        csv.field_size_limit(10 ** 8)
+        with open(path, newline="", encoding="utf-8", errors="ignore") as f:
+            texts = [row["Resume"] for row in csv.DictReader(f)][:300]
+
+        for text in texts:
+            self.assertEqual(self.parser._extract_experience(text), reference_experience(text))
+            self.assertEqual(self.parser._extract_education(text), reference_education(text))
+
+if __name__ == "__main__":
+    unittest.main()
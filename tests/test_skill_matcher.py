@@ -0,0 +1,42 @@
+import unittest
+import random
+from models.skill_matcher import SkillMatcher
+
+def tokenize(text):
+    return text.lower().split()
+
+class TestSkillMatcher(unittest.TestCase):
+    def setUp(self):
+        self.skills = ["Python", "SQL", "SQL Server", "Machine Learning", "Google Cloud",
+                       "Problem Solving", "server", "Google Cloud Platform"]
+        self.matcher = SkillMatcher.from_skills(self.skills, tokenize)
+
+    def test_single_and_multi_word_skills(self):
+        text = "Built machine learning models in python on Google Cloud Platform backed by SQL Server"
+        found = self.matcher.find_all(tokenize(text))
+        self.assertEqual(found, ["Machine Learning", "Python", "Google Cloud",
+                                 "Google Cloud Platform", "SQL", "SQL Server", "server"])
+
+    def test_match_positions(self):
+        tokens = tokenize("strong problem solving and sql")
+        self.assertEqual(list(self.matcher.find(tokens)), [(1, 3, "Problem Solving"), (4, 5, "SQL")])
+
+    def test_partial_phrase_does_not_match(self):
+        self.assertEqual(self.matcher.find_all(tokenize("machine shop learning google")), [])
+
+    def test_matches_naive_ngram_scan(self):
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(40)]
+        skills = {" ".join(rng.choices(vocab, k=rng.randint(1, 4))) for _ in range(300)}
+        matcher = SkillMatcher.from_skills(skills, tokenize)
+        tokens = rng.choices(vocab, k=2000)
+
+        expected = set()
+        for i in range(len(tokens)):
+            for n in range(1, min(4, len(tokens) - i) + 1):
+                if " ".join(tokens[i:i + n]) in skills:
+                    expected.add((i, i + n, " ".join(tokens[i:i + n])))
+        self.assertEqual(set(matcher.find(tokens)), expected)
+
+if __name__ == "__main__":
+    unittest.main()